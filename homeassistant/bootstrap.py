@@ -1074,3 +1074,15 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        store_manager = get_internal_store_manager(hass)
+        _LOGGER.debug(
+            "Storage preloaded in %.3fs, load times: %s",
+            store_manager.async_get_preload_time(),
+            dict(
+                sorted(
+                    store_manager.async_get_load_timings().items(),
+                    key=itemgetter(1),
+                    reverse=True,
+                )
+            ),
+        )
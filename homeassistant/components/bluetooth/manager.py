@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from functools import partial
 import itertools
 import logging
+from typing import Any
 
 from bleak_retry_connector import BleakSlotManager
 from bluetooth_adapters import BluetoothAdapters
@@ -40,6 +42,14 @@ from .util import async_load_history_from_system
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _CallbackStats:
+    """Statistics of a registered callback."""
+
+    matcher: BluetoothCallbackMatcherWithCallback
+    dispatches: int = 0
+
+
 class HomeAssistantBluetoothManager(BluetoothManager):
     """Manage Bluetooth for Home Assistant."""
 
@@ -48,6 +58,7 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         "storage",
         "_integration_matcher",
         "_callback_index",
+        "_callback_stats",
         "_cancel_logging_listener",
     )
 
@@ -64,6 +75,7 @@ class HomeAssistantBluetoothManager(BluetoothManager):
         self.storage = storage
         self._integration_matcher = integration_matcher
         self._callback_index = BluetoothCallbackMatcherIndex()
+        self._callback_stats: dict[int, _CallbackStats] = {}
         self._cancel_logging_listener: CALLBACK_TYPE | None = None
         super().__init__(bluetooth_adapters, slot_manager)
         self._async_logging_changed()
@@ -111,7 +123,11 @@ class HomeAssistantBluetoothManager(BluetoothManager):
                 matched_domains,
             )
 
+        callback_stats = self._callback_stats
         for match in self._callback_index.match_callbacks(service_info):
+            # The callback may have been removed by an earlier callback
+            if stats := callback_stats.get(id(match)):
+                stats.dispatches += 1
             callback = match[CALLBACK]
             try:
                 callback(service_info, BluetoothChange.ADVERTISEMENT)
@@ -185,9 +201,11 @@ class HomeAssistantBluetoothManager(BluetoothManager):
 
         connectable = callback_matcher[CONNECTABLE]
         self._callback_index.add_callback_matcher(callback_matcher)
+        self._callback_stats[id(callback_matcher)] = _CallbackStats(callback_matcher)
 
         def _async_remove_callback() -> None:
             self._callback_index.remove_callback_matcher(callback_matcher)
+            del self._callback_stats[id(callback_matcher)]
 
         # If we have history for the subscriber, we can trigger the callback
         # immediately with the last packet so the subscriber can see the
@@ -209,6 +227,28 @@ class HomeAssistantBluetoothManager(BluetoothManager):
 
         return _async_remove_callback
 
+    @hass_callback
+    def async_callback_diagnostics(self) -> list[dict[str, Any]]:
+        """Return how often each registered callback was called."""
+        diagnostics: list[dict[str, Any]] = []
+        for stats in self._callback_stats.values():
+            callback: Any = stats.matcher[CALLBACK]
+            while isinstance(callback, partial):
+                callback = callback.func
+            diagnostics.append(
+                {
+                    "callback": f"{getattr(callback, '__module__', None)}."
+                    f"{getattr(callback, '__qualname__', repr(callback))}",
+                    "matcher": {
+                        key: value
+                        for key, value in stats.matcher.items()
+                        if key != CALLBACK
+                    },
+                    "dispatches": stats.dispatches,
+                }
+            )
+        return sorted(diagnostics, key=lambda item: item["dispatches"], reverse=True)
+
     @hass_callback
     def async_stop(self, event: Event | None = None) -> None:
         """Stop the Bluetooth integration at shutdown."""
@@ -218,21 +218,23 @@ class BluetoothMatcherIndexBase[
         removed one, we are done.
         """
         if LOCAL_NAME in matcher:
-            self.local_name[_local_name_to_index_key(matcher[LOCAL_NAME])].remove(
-                matcher
+            _remove_from_bucket(
+                self.local_name, _local_name_to_index_key(matcher[LOCAL_NAME]), matcher
             )
             return True
 
         if MANUFACTURER_ID in matcher:
-            self.manufacturer_id[matcher[MANUFACTURER_ID]].remove(matcher)
+            _remove_from_bucket(self.manufacturer_id, matcher[MANUFACTURER_ID], matcher)
             return True
 
         if SERVICE_UUID in matcher:
-            self.service_uuid[matcher[SERVICE_UUID]].remove(matcher)
+            _remove_from_bucket(self.service_uuid, matcher[SERVICE_UUID], matcher)
             return True
 
         if SERVICE_DATA_UUID in matcher:
-            self.service_data_uuid[matcher[SERVICE_DATA_UUID]].remove(matcher)
+            _remove_from_bucket(
+                self.service_data_uuid, matcher[SERVICE_DATA_UUID], matcher
+            )
             return True
 
         return False
@@ -348,7 +350,7 @@ class BluetoothCallbackMatcherIndex(
         removed one, we are done.
         """
         if ADDRESS in matcher:
-            self.address[matcher[ADDRESS]].remove(matcher)
+            _remove_from_bucket(self.address, matcher[ADDRESS], matcher)
             return
 
         if super().remove(matcher):
@@ -373,6 +375,20 @@ class BluetoothCallbackMatcherIndex(
         return matches
 
 
+def _remove_from_bucket[_K, _V](
+    buckets: defaultdict[_K, list[_V]], key: _K, matcher: _V
+) -> None:
+    """Remove a matcher from a bucket and drop the bucket when it is empty.
+
+    Empty buckets are dropped so the index sets built from the bucket
+    keys only contain keys that still have matchers.
+    """
+    bucket = buckets[key]
+    bucket.remove(matcher)
+    if not bucket:
+        del buckets[key]
+
+
 def _local_name_to_index_key(local_name: str) -> str:
     """Convert a local name to an index.
 
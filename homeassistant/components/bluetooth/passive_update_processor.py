@@ -235,6 +235,16 @@ def async_register_coordinator_for_restore(
     return _unregister_coordinator_for_restore
 
 
+@callback
+def async_get_coordinator_diagnostics(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Return the advertisement counters of the processor coordinators."""
+    data: PassiveBluetoothProcessorData = hass.data[PASSIVE_UPDATE_PROCESSOR]
+    return sorted(
+        (coordinator.async_get_diagnostics() for coordinator in data.coordinators),
+        key=lambda item: item["address"],
+    )
+
+
 async def async_setup(hass: HomeAssistant) -> None:
     """Set up the passive update processor coordinators."""
     storage: Store[dict[str, dict[str, RestoredPassiveBluetoothDataUpdate]]] = Store(
@@ -282,6 +292,13 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
     The update_method should return the data that is dispatched to each processor.
     This is normally a parsed form of the data, but you can just forward the
     BluetoothServiceInfoBleak if needed.
+
+    Devices that repeat the same advertisement many times per second can skip
+    parsing them with skip_duplicates, which drops advertisements with the
+    same service and manufacturer data as the last processed one. With
+    min_update_interval, advertisements that arrive sooner than the interval
+    after the last processed one are dropped as well. Neither drops an
+    advertisement of a device that was unavailable.
     """
 
     def __init__(
@@ -292,11 +309,23 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         mode: BluetoothScanningMode,
         update_method: Callable[[BluetoothServiceInfoBleak], _DataT],
         connectable: bool = False,
+        *,
+        skip_duplicates: bool = False,
+        min_update_interval: timedelta | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(hass, logger, address, mode, connectable)
         self._processors: list[PassiveBluetoothDataProcessor[Any, _DataT]] = []
         self._update_method = update_method
+        self._skip_duplicates = skip_duplicates
+        self._min_update_interval = (
+            min_update_interval.total_seconds() if min_update_interval else 0.0
+        )
+        self._last_payload_hash: int | None = None
+        self._last_update_time = 0.0
+        self.processed_advertisements = 0
+        self.duplicate_advertisements = 0
+        self.rate_limited_advertisements = 0
         self.last_update_success = True
         self.restore_data: dict[str, RestoredPassiveBluetoothDataUpdate] = {}
         self.restore_key = None
@@ -352,9 +381,50 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
     ) -> None:
         """Handle the device going unavailable."""
         super()._async_handle_unavailable(service_info)
+        self._last_payload_hash = None
         for processor in self._processors:
             processor.async_handle_unavailable()
 
+    @callback
+    def _async_drop_advertisement(
+        self, service_info: BluetoothServiceInfoBleak, was_available: bool
+    ) -> bool:
+        """Return if an advertisement should be dropped before it is parsed."""
+        payload_hash: int | None = None
+        if self._skip_duplicates:
+            payload_hash = hash(
+                (
+                    tuple(service_info.service_data.items()),
+                    tuple(service_info.manufacturer_data.items()),
+                )
+            )
+        if was_available and self.last_update_success:
+            if payload_hash is not None and payload_hash == self._last_payload_hash:
+                self.duplicate_advertisements += 1
+                return True
+            if (
+                self._min_update_interval
+                and service_info.time - self._last_update_time
+                < self._min_update_interval
+            ):
+                self.rate_limited_advertisements += 1
+                return True
+        self._last_payload_hash = payload_hash
+        self._last_update_time = service_info.time
+        return False
+
+    @callback
+    def async_get_diagnostics(self) -> dict[str, Any]:
+        """Return how many advertisements were processed and dropped."""
+        return {
+            "address": self.address,
+            "skip_duplicates": self._skip_duplicates,
+            "min_update_interval": self._min_update_interval,
+            "processed": self.processed_advertisements,
+            "duplicates": self.duplicate_advertisements,
+            "rate_limited": self.rate_limited_advertisements,
+        }
+
     @callback
     def _async_handle_bluetooth_event(
         self,
@@ -367,6 +437,12 @@ class PassiveBluetoothProcessorCoordinator[_DataT](BasePassiveBluetoothCoordinat
         if self.hass.is_stopping:
             return
 
+        if (
+            self._skip_duplicates or self._min_update_interval
+        ) and self._async_drop_advertisement(service_info, was_available):
+            return
+        self.processed_advertisements += 1
+
         try:
             update = self._update_method(service_info)
         except Exception:
@@ -19,6 +19,7 @@ from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
     integration_platform,
+    service,
 )
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.json import (
@@ -211,6 +212,10 @@ async def _async_get_json_file_response(
         "setup_times": async_get_domain_setup_times(hass, domain),
         "data": data,
     }
+    if (
+        service_calls := service.async_get_service_call_limiter_stats(hass, domain)
+    ) is not None:
+        payload["service_call_limiter"] = service_calls
     try:
         json_data = json.dumps(payload, indent=2, cls=ExtendedJSONEncoder)
     except TypeError:
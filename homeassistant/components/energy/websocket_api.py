@@ -4,18 +4,22 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable
+from dataclasses import dataclass
 from datetime import timedelta
 import functools
 from itertools import chain
 from typing import Any, cast
 
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.components import recorder, websocket_api
+from homeassistant.components.recorder.const import SIGNAL_STATISTICS_CHANGED
 from homeassistant.components.recorder.statistics import StatisticsRow
 from homeassistant.const import UnitOfEnergy
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
@@ -42,6 +46,8 @@ type AsyncEnergyWebSocketCommandHandler = Callable[
     Coroutine[Any, Any, None],
 ]
 
+MAX_CACHED_RESULTS = 64
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -80,6 +86,87 @@ async def async_get_energy_platforms(
     return platforms
 
 
+@dataclass(slots=True)
+class _CachedResult:
+    """A result computed from long term statistics."""
+
+    statistic_ids: set[str]
+    end_ts: float
+    result: Any
+
+
+class EnergyResultCache:
+    """Cache results of the energy websocket API.
+
+    A result is dropped when the recorder changes the long term statistics
+    it was computed from, that is statistics of one of its statistic_ids
+    which start before its end time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._results: LRU[Hashable, _CachedResult] = LRU(MAX_CACHED_RESULTS)
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @callback
+    def async_get(self, key: Hashable) -> Any | None:
+        """Return a cached result or None."""
+        if (cached := self._results.get(key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return cached.result
+
+    @callback
+    def async_set(
+        self,
+        key: Hashable,
+        statistic_ids: set[str],
+        end_ts: float,
+        result: Any,
+        generation: int,
+    ) -> None:
+        """Cache a result.
+
+        generation is the generation of the cache when the statistics were
+        fetched, the result is not cached if statistics changed since then.
+        """
+        if generation == self.generation:
+            self._results[key] = _CachedResult(statistic_ids, end_ts, result)
+
+    @callback
+    def async_invalidate(self, statistic_ids: set[str], start_ts: float) -> None:
+        """Drop results computed from changed statistics."""
+        self.generation += 1
+        for key, cached in list(self._results.items()):
+            if cached.end_ts > start_ts and not statistic_ids.isdisjoint(
+                cached.statistic_ids
+            ):
+                del self._results[key]
+
+    @callback
+    def async_get_info(self) -> dict[str, Any]:
+        """Return information about the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "cached_results": len(self._results),
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_hit_rate": round(100 * self.hits / lookups, 1) if lookups else 0,
+        }
+
+
+@singleton("energy_result_cache")
+@callback
+def async_get_result_cache(hass: HomeAssistant) -> EnergyResultCache:
+    """Get the energy result cache."""
+    cache = EnergyResultCache()
+    async_dispatcher_connect(hass, SIGNAL_STATISTICS_CHANGED, cache.async_invalidate)
+    return cache
+
+
 def _ws_with_manager(
     func: AsyncEnergyWebSocketCommandHandler | EnergyWebSocketCommandHandler,
 ) -> websocket_api.AsyncWebSocketCommandHandler:
@@ -271,6 +358,22 @@ async def ws_get_fossil_energy_consumption(
     statistic_ids = set(msg["energy_statistic_ids"])
     statistic_ids.add(msg["co2_statistic_id"])
 
+    # The result is reduced to days and months in the configured time zone
+    cache_key = (
+        msg["type"],
+        start_time,
+        end_time,
+        frozenset(msg["energy_statistic_ids"]),
+        msg["co2_statistic_id"],
+        msg["period"],
+        hass.config.time_zone,
+    )
+    result_cache = async_get_result_cache(hass)
+    if (cached_result := result_cache.async_get(cache_key)) is not None:
+        connection.send_result(msg["id"], cached_result)
+        return
+    generation = result_cache.generation
+
     # Fetch energy + CO2 statistics
     statistics = await recorder.get_instance(hass).async_add_executor_job(
         recorder.statistics.statistics_during_period,
@@ -378,4 +481,7 @@ async def ws_get_fossil_energy_consumption(
         )
 
     result = {period["start"]: period["delta"] for period in reduced_fossil_energy}
+    result_cache.async_set(
+        cache_key, statistic_ids, end_time.timestamp(), result, generation
+    )
     connection.send_result(msg["id"], result)
@@ -5,3 +5,11 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# How many recent states the live streams share the compressed json of
+LIVE_STREAM_CACHE_SIZE = 512
+
+# Chunked history responses fetch and send the states of a time window
+# in chunks of at most this many rows so only one chunk has to be held
+# in memory at a time
+HISTORY_CHUNK_ROWS = 10000
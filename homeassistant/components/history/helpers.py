@@ -4,11 +4,21 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt
+import math
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant
 
+# Numeric states keep the first, minimum, maximum and last state of a bucket
+STATES_PER_BUCKET = 4
+
 
 def entities_may_have_state_changes_after(
     hass: HomeAssistant, entity_ids: Iterable, start_time: dt, no_attributes: bool
@@ -31,3 +41,82 @@ def has_recorder_run_after(hass: HomeAssistant, run_time: dt) -> bool:
     return run_time >= process_timestamp(
         get_instance(hass).recorder_runs_manager.first.start
     )
+
+
+def downsample_bucket_seconds(start_time: dt, end_time: dt, max_points: int) -> float:
+    """Return the bucket size that keeps a time window close to max_points."""
+    buckets = max(max_points // STATES_PER_BUCKET, 1)
+    return max((end_time - start_time).total_seconds() / buckets, 1e-6)
+
+
+def downsample_states(
+    states: dict[str, list[dict[str, Any]]], bucket_seconds: float
+) -> dict[str, list[dict[str, Any]]]:
+    """Downsample compressed states to time buckets of bucket_seconds.
+
+    Numeric states keep the first, minimum, maximum and last state of
+    each bucket. Other states keep every change of state and every
+    state that has attributes.
+
+    The buckets are aligned to the epoch so states fetched in chunks
+    are downsampled the same way as when they are fetched at once.
+    """
+    return {
+        entity_id: _downsample_entity_states(entity_states, bucket_seconds)
+        for entity_id, entity_states in states.items()
+    }
+
+
+def _downsample_entity_states(
+    entity_states: list[dict[str, Any]], bucket_seconds: float
+) -> list[dict[str, Any]]:
+    """Downsample the compressed states of a single entity."""
+    if len(entity_states) <= STATES_PER_BUCKET:
+        return entity_states
+    downsampled: list[dict[str, Any]] = []
+    bucket_states: list[dict[str, Any]] = []
+    bucket_values: list[float] = []
+    current_bucket: int | None = None
+    previous_state: str | None = None
+
+    def _flush_bucket() -> None:
+        if len(bucket_states) <= STATES_PER_BUCKET:
+            downsampled.extend(bucket_states)
+        else:
+            keep = {
+                0,
+                bucket_values.index(min(bucket_values)),
+                bucket_values.index(max(bucket_values)),
+                len(bucket_states) - 1,
+            }
+            downsampled.extend(bucket_states[idx] for idx in sorted(keep))
+        bucket_states.clear()
+        bucket_values.clear()
+
+    for state in entity_states:
+        state_value: str = state[COMPRESSED_STATE_STATE]
+        try:
+            value = float(state_value)
+        except (TypeError, ValueError):
+            value = math.nan
+        if math.isfinite(value):
+            bucket = int(state[COMPRESSED_STATE_LAST_UPDATED] // bucket_seconds)
+            if bucket != current_bucket:
+                _flush_bucket()
+                current_bucket = bucket
+            bucket_states.append(state)
+            bucket_values.append(value)
+        else:
+            # States like unavailable end the bucket so the gap is kept
+            _flush_bucket()
+            current_bucket = None
+            if (
+                not downsampled
+                or state_value != previous_state
+                or COMPRESSED_STATE_ATTRIBUTES in state
+            ):
+                downsampled.append(state)
+        previous_state = state_value
+
+    _flush_bucket()
+    return downsampled
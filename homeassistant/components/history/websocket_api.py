@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
+from functools import lru_cache
 import logging
 from typing import Any, cast
 
@@ -38,8 +39,19 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_ROWS,
+    LIVE_STREAM_CACHE_SIZE,
+    MAX_PENDING_HISTORY_STATES,
+)
+from .helpers import (
+    STATES_PER_BUCKET,
+    downsample_bucket_seconds,
+    downsample_states,
+    entities_may_have_state_changes_after,
+    has_recorder_run_after,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,6 +74,38 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _get_compressed_significant_states(
+    hass: HomeAssistant,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    bucket_seconds: float | None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Fetch history significant_states in the compressed state format."""
+    states = cast(
+        dict[str, list[dict[str, Any]]],
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
+    )
+    if bucket_seconds:
+        states = downsample_states(states, bucket_seconds)
+    return states
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
@@ -72,27 +116,134 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    bucket_seconds: float | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
+            _get_compressed_significant_states(
                 hass,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
-                True,
+                bucket_seconds,
             ),
         )
     )
 
 
+def _ws_get_significant_states_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    bucket_seconds: float | None,
+    complete: bool,
+) -> bytes:
+    """Fetch a chunk of history significant_states and convert it to json."""
+    return json_bytes(
+        messages.event_message(
+            msg_id,
+            {
+                "states": _get_compressed_significant_states(
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    bucket_seconds,
+                ),
+                "complete": complete,
+            },
+        )
+    )
+
+
+async def _async_get_chunk_end_time(
+    hass: HomeAssistant,
+    chunk_start_time: dt,
+    end_time: dt,
+    entity_ids: list[str] | None,
+) -> dt:
+    """Return the end time of the next chunk of a historical window.
+
+    Chunks hold at most HISTORY_CHUNK_ROWS states so only one chunk has
+    to be held in memory at a time, however long the window is.
+    """
+    if not (
+        chunk_end_time := await get_instance(hass).async_add_executor_job(
+            history.get_states_chunk_end_time,
+            hass,
+            chunk_start_time,
+            end_time,
+            entity_ids,
+            HISTORY_CHUNK_ROWS,
+        )
+    ):
+        return end_time
+    # The end time is exclusive and the next chunk starts one microsecond
+    # before it. If more states than fit in a chunk share the same
+    # last_updated time they are sent together so the chunks move forward.
+    return min(
+        max(chunk_end_time, chunk_start_time + timedelta(microseconds=2)), end_time
+    )
+
+
+async def _async_send_significant_states_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    bucket_seconds: float | None,
+) -> None:
+    """Fetch history significant_states and send them in chunks."""
+    instance = get_instance(hass)
+    chunk_start_time = start_time
+    while True:
+        chunk_end_time = await _async_get_chunk_end_time(
+            hass, chunk_start_time, end_time, entity_ids
+        )
+        complete = chunk_end_time == end_time
+        connection.send_message(
+            await instance.async_add_executor_job(
+                _ws_get_significant_states_chunk,
+                hass,
+                msg_id,
+                chunk_start_time,
+                chunk_end_time,
+                entity_ids,
+                include_start_time_state and chunk_start_time == start_time,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                bucket_seconds,
+                complete,
+            )
+        )
+        if complete or msg_id not in connection.subscriptions:
+            return
+        chunk_start_time = chunk_end_time - timedelta(microseconds=1)
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,13 +254,20 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=STATES_PER_BUCKET)),
+        vol.Optional("chunked", default=False): bool,
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    With chunked set, the result message is empty and the states are
+    sent in event messages of at most HISTORY_CHUNK_ROWS states each.
+    The last event message has complete set.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
 
@@ -129,7 +287,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_during_period_response(connection, msg)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -149,11 +307,34 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_during_period_response(connection, msg)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    bucket_seconds: float | None = None
+    if max_points := msg.get("max_points"):
+        bucket_seconds = downsample_bucket_seconds(
+            start_time, end_time or dt_util.utcnow(), max_points
+        )
+
+    if msg["chunked"]:
+        connection.subscriptions[msg["id"]] = callback(lambda: None)
+        connection.send_result(msg["id"])
+        await _async_send_significant_states_chunks(
+            hass,
+            connection,
+            msg["id"],
+            start_time,
+            end_time or dt_util.utcnow(),
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            bucket_seconds,
+        )
+        return
 
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
@@ -167,10 +348,25 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            bucket_seconds,
         )
     )
 
 
+@callback
+def _async_send_empty_during_period_response(
+    connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send an empty history during period response."""
+    if not msg["chunked"]:
+        connection.send_result(msg["id"], {})
+        return
+    connection.send_result(msg["id"])
+    connection.send_message(
+        messages.event_message(msg["id"], {"states": {}, "complete": True})
+    )
+
+
 def _generate_stream_message(
     states: dict[str, list[dict[str, Any]]],
     start_day: dt,
@@ -221,22 +417,19 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    bucket_seconds: float | None,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
+    states = _get_compressed_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        bucket_seconds,
     )
     last_time_ts = 0.0
     for state_list in states.values():
@@ -276,25 +469,44 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    bucket_seconds: float | None,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    The time window is fetched and sent in chunks of at most
+    HISTORY_CHUNK_ROWS states to bound the memory used.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    last_event_time: dt | None = None
+    chunk_start_time = start_time
+    while True:
+        chunk_end_time = await _async_get_chunk_end_time(
+            hass, chunk_start_time, end_time, entity_ids
+        )
+        last_chunk = chunk_end_time == end_time
+        last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            chunk_start_time,
+            chunk_end_time,
+            entity_ids,
+            include_start_time_state and chunk_start_time == start_time,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty and last_chunk and last_event_time is None,
+            bucket_seconds,
+        )
+        if payload:
+            connection.send_message(payload)
+        if last_time_ts != 0:
+            last_event_time = last_time_dt
+        if last_chunk or msg_id not in connection.subscriptions:
+            return last_event_time
+        # The end time is exclusive so the next chunk starts one
+        # microsecond before it to include states at the end time
+        chunk_start_time = chunk_end_time - timedelta(microseconds=1)
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -308,18 +520,34 @@ def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, An
     return comp_state
 
 
-def _events_to_compressed_states(
+@lru_cache(maxsize=LIVE_STREAM_CACHE_SIZE)
+def _cached_compressed_state_json(event: Event, no_attributes: bool) -> bytes:
+    """Serialize the new state of an event to a compressed state.
+
+    Cached since many live streams are often sent the same states.
+    """
+    return json_bytes(_history_compressed_state(event.data["new_state"], no_attributes))
+
+
+def _events_to_compressed_states_json(
     events: Iterable[Event], no_attributes: bool
-) -> dict[str, list[dict[str, Any]]]:
-    """Convert events to a compressed states."""
-    states_by_entity_ids: dict[str, list[dict[str, Any]]] = {}
+) -> bytes:
+    """Convert events to compressed states json."""
+    states_by_entity_ids: dict[str, list[bytes]] = {}
     for event in events:
-        state: State = event.data["new_state"]
-        entity_id: str = state.entity_id
-        states_by_entity_ids.setdefault(entity_id, []).append(
-            _history_compressed_state(state, no_attributes)
+        states_by_entity_ids.setdefault(event.data["entity_id"], []).append(
+            _cached_compressed_state_json(event, no_attributes)
         )
-    return states_by_entity_ids
+    return b"".join(
+        (
+            b'{"states":{',
+            b",".join(
+                b"".join((json_bytes(entity_id), b":[", b",".join(states), b"]"))
+                for entity_id, states in states_by_entity_ids.items()
+            ),
+            b"}}",
+        )
+    )
 
 
 async def _async_events_consumer(
@@ -347,15 +575,11 @@ async def _async_events_consumer(
         while not stream_queue.empty():
             events.append(stream_queue.get_nowait())
 
-        if history_states := _events_to_compressed_states(events, no_attributes):
-            connection.send_message(
-                json_bytes(
-                    messages.event_message(
-                        msg_id,
-                        {"states": history_states},
-                    )
-                )
+        connection.send_message(
+            messages.construct_event_message(
+                msg_id, _events_to_compressed_states_json(events, no_attributes)
             )
+        )
 
 
 @callback
@@ -404,6 +628,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=STATES_PER_BUCKET)),
     }
 )
 @websocket_api.async_response
@@ -443,6 +668,11 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    bucket_seconds: float | None = None
+    if max_points := msg.get("max_points"):
+        bucket_seconds = downsample_bucket_seconds(
+            start_time, end_time or utc_now, max_points
+        )
 
     if end_time and end_time <= utc_now:
         if (
@@ -469,6 +699,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            bucket_seconds,
         )
         return
 
@@ -533,6 +764,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        bucket_seconds,
     )
 
     if msg_id not in connection.subscriptions:
@@ -577,4 +809,5 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        bucket_seconds=bucket_seconds,
     )
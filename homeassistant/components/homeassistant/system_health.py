@@ -6,7 +6,12 @@ from typing import Any
 
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import system_info
+from homeassistant.helpers import event, system_info
+
+from .triggers.state import DATA_STATE_TRIGGER_INDEX
+
+# Number of state triggers listed by how often they were evaluated
+MOST_EVALUATED_STATE_TRIGGERS = 5
 
 
 @callback
@@ -21,7 +26,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
 
-    return {
+    health_info: dict[str, Any] = {
         "version": f"core-{info.get('version')}",
         "installation_type": info.get("installation_type"),
         "dev": info.get("dev"),
@@ -36,3 +41,30 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
     }
+
+    time_change_stats = event.async_get_time_change_stats(hass)
+    health_info["time_pattern_timers"] = time_change_stats["timers"]
+    health_info["time_pattern_listeners"] = ", ".join(
+        f"{integration} ({count})"
+        for integration, count in sorted(
+            time_change_stats["listeners"].items(),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+    )
+
+    if (trigger_index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is not None:
+        stats = trigger_index.async_get_stats()
+        most_evaluated = sorted(
+            stats, key=lambda trigger: trigger["evaluations"], reverse=True
+        )[:MOST_EVALUATED_STATE_TRIGGERS]
+        health_info["state_triggers"] = len(stats)
+        health_info["state_trigger_evaluations"] = sum(
+            trigger["evaluations"] for trigger in stats
+        )
+        health_info["most_evaluated_state_triggers"] = ", ".join(
+            f"{trigger['name']} ({trigger['evaluations']})"
+            for trigger in most_evaluated
+        )
+
+    return health_info
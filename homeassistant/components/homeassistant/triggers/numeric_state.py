@@ -34,13 +34,12 @@ from homeassistant.helpers import (
     entity_registry as er,
     template,
 )
-from homeassistant.helpers.event import (
-    async_track_same_state,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import async_track_same_state
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 
+from .state import async_get_state_trigger_index
+
 
 def validate_above_below[_T: dict[str, Any]](value: _T) -> _T:
     """Validate that above and below can co-exist."""
@@ -230,7 +229,11 @@ async def async_attach_trigger(
             else:
                 call_action()
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # Thresholds can not be indexed, but registering in the index
+    # keeps track of how often the trigger is evaluated
+    unsub = async_get_state_trigger_index(hass).async_add(
+        trigger_info["name"], entity_ids, state_automation_listener
+    )
 
     @callback
     def async_remove() -> None:
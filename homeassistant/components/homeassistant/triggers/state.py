@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import timedelta
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -31,6 +32,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +42,8 @@ CONF_TO = "to"
 CONF_NOT_FROM = "not_from"
 CONF_NOT_TO = "not_to"
 
+DATA_STATE_TRIGGER_INDEX: HassKey[StateTriggerIndex] = HassKey("state_trigger_index")
+
 BASE_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "state",
@@ -69,6 +73,206 @@ TRIGGER_ATTRIBUTE_SCHEMA = BASE_SCHEMA.extend(
 )
 
 
+class _IndexedTrigger:
+    """A trigger listener registered in the state trigger index."""
+
+    __slots__ = ("name", "entity_ids", "listener", "index", "evaluations")
+
+    def __init__(
+        self,
+        name: str,
+        entity_ids: list[str],
+        listener: Callable[[Event[EventStateChangedData]], None],
+        index: str,
+    ) -> None:
+        """Initialize the indexed trigger."""
+        self.name = name
+        self.entity_ids = entity_ids
+        self.listener = listener
+        self.index = index
+        self.evaluations = 0
+
+
+class _EntityTriggers:
+    """Triggers listening to the state changes of a single entity."""
+
+    __slots__ = ("by_to_state", "by_attribute", "other", "unsub")
+
+    def __init__(self, unsub: CALLBACK_TYPE) -> None:
+        """Initialize the entity triggers."""
+        self.by_to_state: dict[str, list[_IndexedTrigger]] = {}
+        self.by_attribute: dict[str, list[_IndexedTrigger]] = {}
+        self.other: list[_IndexedTrigger] = []
+        self.unsub = unsub
+
+    def __bool__(self) -> bool:
+        """Return if there are any triggers left."""
+        return bool(self.by_to_state or self.by_attribute or self.other)
+
+
+class StateTriggerIndex:
+    """Dispatch state changes only to the triggers that can match them.
+
+    Triggers are indexed by entity id and, where possible, by the state
+    they change to or the attribute they watch. A state change is then
+    only evaluated by the triggers of its new state, the triggers of
+    attributes that changed and the triggers that cannot be indexed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._entities: dict[str, _EntityTriggers] = {}
+        self._triggers: dict[_IndexedTrigger, None] = {}
+
+    @callback
+    def async_add(
+        self,
+        name: str,
+        entity_ids: str | Iterable[str],
+        listener: Callable[[Event[EventStateChangedData]], None],
+        *,
+        to_states: Iterable[str] | None = None,
+        attribute: str | None = None,
+    ) -> CALLBACK_TYPE:
+        """Add a trigger listener to the index.
+
+        A listener with `to_states` is only called when an entity changes to
+        one of these states. A listener with an `attribute` is only called
+        when the value of that attribute changed.
+        """
+        if attribute is not None:
+            index = "attribute"
+        elif to_states is not None:
+            index = "to_state"
+            to_states = set(to_states)
+        else:
+            index = "all"
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        # Match the entity ids the same way as async_track_state_change_event
+        entity_ids = [entity_id.lower() for entity_id in entity_ids]
+        trigger = _IndexedTrigger(name, entity_ids, listener, index)
+        self._triggers[trigger] = None
+
+        for entity_id in entity_ids:
+            if (entity_triggers := self._entities.get(entity_id)) is None:
+                entity_triggers = self._entities[entity_id] = _EntityTriggers(
+                    async_track_state_change_event(
+                        self.hass, entity_id, self._async_dispatch
+                    )
+                )
+            if attribute is not None:
+                entity_triggers.by_attribute.setdefault(attribute, []).append(trigger)
+            elif to_states is not None:
+                for to_state in to_states:
+                    entity_triggers.by_to_state.setdefault(to_state, []).append(trigger)
+            else:
+                entity_triggers.other.append(trigger)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the trigger listener from the index."""
+            self._async_remove(trigger, to_states, attribute)
+
+        return async_remove
+
+    @callback
+    def _async_remove(
+        self,
+        trigger: _IndexedTrigger,
+        to_states: Iterable[str] | None,
+        attribute: str | None,
+    ) -> None:
+        """Remove a trigger listener from the index."""
+        del self._triggers[trigger]
+        for entity_id in trigger.entity_ids:
+            entity_triggers = self._entities[entity_id]
+            if attribute is not None:
+                _remove_from_bucket(entity_triggers.by_attribute, attribute, trigger)
+            elif to_states is not None:
+                for to_state in to_states:
+                    _remove_from_bucket(entity_triggers.by_to_state, to_state, trigger)
+            else:
+                entity_triggers.other.remove(trigger)
+            if not entity_triggers:
+                entity_triggers.unsub()
+                del self._entities[entity_id]
+
+    @callback
+    def _async_dispatch(self, event: Event[EventStateChangedData]) -> None:
+        """Dispatch a state change to the triggers that can match it."""
+        if (entity_triggers := self._entities.get(event.data["entity_id"])) is None:
+            return
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+
+        if new_state is not None and (
+            triggers := entity_triggers.by_to_state.get(new_state.state)
+        ):
+            self._async_run(triggers, event)
+
+        for attribute, triggers in list(entity_triggers.by_attribute.items()):
+            old_value = (
+                None if old_state is None else old_state.attributes.get(attribute)
+            )
+            new_value = (
+                None if new_state is None else new_state.attributes.get(attribute)
+            )
+            if old_value != new_value:
+                self._async_run(triggers, event)
+
+        if entity_triggers.other:
+            self._async_run(entity_triggers.other, event)
+
+    @callback
+    def _async_run(
+        self, triggers: list[_IndexedTrigger], event: Event[EventStateChangedData]
+    ) -> None:
+        """Call trigger listeners for a state change."""
+        for trigger in triggers.copy():
+            trigger.evaluations += 1
+            try:
+                trigger.listener(event)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s",
+                    event.data["entity_id"],
+                    trigger.name,
+                )
+
+    @callback
+    def async_get_stats(self) -> list[dict[str, Any]]:
+        """Return how often each trigger was evaluated."""
+        return [
+            {
+                "name": trigger.name,
+                "entity_ids": trigger.entity_ids,
+                "index": trigger.index,
+                "evaluations": trigger.evaluations,
+            }
+            for trigger in self._triggers
+        ]
+
+
+def _remove_from_bucket(
+    buckets: dict[str, list[_IndexedTrigger]], key: str, trigger: _IndexedTrigger
+) -> None:
+    """Remove a trigger from an index bucket."""
+    bucket = buckets[key]
+    bucket.remove(trigger)
+    if not bucket:
+        del buckets[key]
+
+
+@callback
+def async_get_state_trigger_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index
+
+
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
@@ -232,7 +436,18 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # Only triggers waiting for specific new states can be indexed by them,
+    # triggers on attributes only need to run when the attribute changed
+    to_states: list[str] | None = None
+    if attribute is None and isinstance(to_state, str | list) and to_state != MATCH_ALL:
+        to_states = [to_state] if isinstance(to_state, str) else to_state
+    unsub = async_get_state_trigger_index(hass).async_add(
+        trigger_info["name"],
+        entity_ids,
+        state_automation_listener,
+        to_states=to_states,
+        attribute=attribute,
+    )
 
     @callback
     def async_remove() -> None:
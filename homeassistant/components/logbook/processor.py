@@ -13,6 +13,7 @@ from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
 
 from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.const import EVENT_REFERENCES_SCHEMA_VERSION
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import (
     bytes_to_uuid_hex_or_none,
@@ -79,7 +80,7 @@ from .models import (
     LogbookConfig,
     async_event_to_row,
 )
-from .queries import statement_for_request
+from .queries import first_event_reference_time, statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
@@ -141,6 +142,11 @@ class EventProcessor:
         """Check if the stream is limited by entities context or device ids."""
         return bool(self.entity_ids or self.context_id or self.device_ids)
 
+    @property
+    def is_live(self) -> bool:
+        """Check if the stream switched to live."""
+        return not self.logbook_run.memoize_new_contexts
+
     def switch_to_live(self) -> None:
         """Switch to live stream.
 
@@ -170,6 +176,13 @@ class EventProcessor:
                     instance.event_type_manager.get_many(self.event_types, session)
                 )
             )
+            event_references_since: float | None = None
+            if (
+                self.entity_ids or self.device_ids
+            ) and instance.schema_version >= EVENT_REFERENCES_SCHEMA_VERSION:
+                event_references_since = session.execute(
+                    first_event_reference_time()
+                ).scalar()
             stmt = statement_for_request(
                 start_day,
                 end_day,
@@ -179,6 +192,7 @@ class EventProcessor:
                 self.device_ids,
                 self.filters,
                 self.context_id,
+                event_references_since,
             )
             return self.humanify(
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
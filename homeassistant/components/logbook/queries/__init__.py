@@ -5,16 +5,34 @@ from __future__ import annotations
 from collections.abc import Collection
 from datetime import datetime as dt
 
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from homeassistant.components.recorder.db_schema import EventReferences
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import ulid_to_bytes_or_none
 from homeassistant.helpers.json import json_dumps
 
 from .all import all_stmt
-from .devices import devices_stmt
-from .entities import entities_stmt
-from .entities_and_devices import entities_devices_stmt
+from .devices import devices_references_stmt, devices_stmt
+from .entities import entities_references_stmt, entities_stmt
+from .entities_and_devices import (
+    entities_devices_references_stmt,
+    entities_devices_stmt,
+)
+
+
+def first_event_reference_time() -> StatementLambdaElement:
+    """Find the time of the oldest event with event references.
+
+    Events are only referenced since the recorder started writing the
+    event references, older events must be matched by their event data.
+    """
+    return lambda_stmt(
+        lambda: select(EventReferences.time_fired_ts)
+        .order_by(EventReferences.reference_id)
+        .limit(1)
+    )
 
 
 def statement_for_request(
@@ -26,6 +44,7 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    event_references_since: float | None = None,
 ) -> StatementLambdaElement:
     """Generate the logbook statement for a logbook request."""
     start_day = start_day_dt.timestamp()
@@ -42,6 +61,28 @@ def statement_for_request(
             context_id_bin,
         )
 
+    # The event references can replace matching the event data
+    # when all the events in the timeframe are referenced
+    if event_references_since is not None and start_day >= event_references_since:
+        if entity_ids and device_ids:
+            return entities_devices_references_stmt(
+                start_day,
+                end_day,
+                event_type_ids,
+                states_metadata_ids or [],
+                [*entity_ids, *device_ids],
+            )
+        if entity_ids:
+            return entities_references_stmt(
+                start_day,
+                end_day,
+                event_type_ids,
+                states_metadata_ids or [],
+                entity_ids,
+            )
+        assert device_ids is not None
+        return devices_references_stmt(start_day, end_day, event_type_ids, device_ids)
+
     # sqlalchemy caches object quoting, the
     # json quotable ones must be a different
     # object from the non-json ones to prevent
@@ -18,6 +18,7 @@ from homeassistant.components.recorder.db_schema import (
     SHARED_DATA_OR_LEGACY_EVENT_DATA,
     STATES_CONTEXT_ID_BIN_INDEX,
     EventData,
+    EventReferences,
     Events,
     EventTypes,
     StateAttributes,
@@ -155,6 +156,47 @@ def select_events_without_states(
     )
 
 
+def select_events_for_references(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    references: list[str],
+) -> Select:
+    """Generate an events select for the events referencing entity or device ids."""
+    return select_events_without_states(start_day, end_day, event_type_ids).where(
+        Events.event_id.in_(
+            select(EventReferences.event_id).where(
+                _event_references_matcher(start_day, end_day, references)
+            )
+        )
+    )
+
+
+def select_event_references_context_id_subquery(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    references: list[str],
+) -> Select:
+    """Generate the select for a context_id subquery using the event references."""
+    return (
+        select(EventReferences.context_id_bin)
+        .where(_event_references_matcher(start_day, end_day, references))
+        .where(EventReferences.event_type_id.in_(event_type_ids))
+    )
+
+
+def _event_references_matcher(
+    start_day: float, end_day: float, references: list[str]
+) -> ColumnElement[bool]:
+    """Match event references to entity or device ids by time range."""
+    return sqlalchemy.and_(
+        EventReferences.reference.in_(references),
+        EventReferences.time_fired_ts > start_day,
+        EventReferences.time_fired_ts < end_day,
+    )
+
+
 def select_states() -> Select:
     """Generate a states select that formats the states table as event rows."""
     return select(
@@ -13,6 +13,7 @@ from sqlalchemy.sql.selectable import CTE, CompoundSelect, Select
 from homeassistant.components.recorder.db_schema import (
     DEVICE_ID_IN_EVENT,
     EventData,
+    EventReferences,
     Events,
     EventTypes,
     States,
@@ -22,8 +23,10 @@ from homeassistant.components.recorder.db_schema import (
 from .common import (
     apply_events_context_hints,
     apply_states_context_hints,
+    select_event_references_context_id_subquery,
     select_events_context_id_subquery,
     select_events_context_only,
+    select_events_for_references,
     select_events_without_states,
     select_states_context_only,
 )
@@ -45,19 +48,10 @@ def _select_device_id_context_ids_sub_query(
 
 
 def _apply_devices_context_union(
-    sel: Select,
-    start_day: float,
-    end_day: float,
-    event_type_ids: tuple[int, ...],
-    json_quotable_device_ids: list[str],
+    sel: Select, context_ids_sub_query: Select
 ) -> CompoundSelect:
     """Generate a CTE to find the device context ids and a query to find linked row."""
-    devices_cte: CTE = _select_device_id_context_ids_sub_query(
-        start_day,
-        end_day,
-        event_type_ids,
-        json_quotable_device_ids,
-    ).cte()
+    devices_cte: CTE = context_ids_sub_query.cte()
     return sel.union_all(
         apply_events_context_hints(
             select_events_context_only()
@@ -87,10 +81,31 @@ def devices_stmt(
             select_events_without_states(start_day, end_day, event_type_ids).where(
                 apply_event_device_id_matchers(json_quotable_device_ids)
             ),
-            start_day,
-            end_day,
-            event_type_ids,
-            json_quotable_device_ids,
+            _select_device_id_context_ids_sub_query(
+                start_day,
+                end_day,
+                event_type_ids,
+                json_quotable_device_ids,
+            ),
+        ).order_by(Events.time_fired_ts)
+    )
+
+
+def devices_references_stmt(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    device_ids: list[str],
+) -> StatementLambdaElement:
+    """Generate a logbook query for multiple devices using the event references."""
+    return lambda_stmt(
+        lambda: _apply_devices_context_union(
+            select_events_for_references(
+                start_day, end_day, event_type_ids, device_ids
+            ),
+            select_event_references_context_id_subquery(
+                start_day, end_day, event_type_ids, device_ids
+            ).group_by(EventReferences.context_id_bin),
         ).order_by(Events.time_fired_ts)
     )
 
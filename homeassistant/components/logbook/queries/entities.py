@@ -25,26 +25,25 @@ from .common import (
     apply_events_context_hints,
     apply_states_context_hints,
     apply_states_filters,
+    select_event_references_context_id_subquery,
     select_events_context_id_subquery,
     select_events_context_only,
+    select_events_for_references,
     select_events_without_states,
     select_states,
     select_states_context_only,
 )
 
 
-def _select_entities_context_ids_sub_query(
+def select_entities_context_ids_sub_query(
+    events_context_ids: Select,
     start_day: float,
     end_day: float,
-    event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
-    json_quoted_entity_ids: list[str],
 ) -> Select:
     """Generate a subquery to find context ids for multiple entities."""
     union = union_all(
-        select_events_context_id_subquery(start_day, end_day, event_type_ids).where(
-            apply_event_entity_id_matchers(json_quoted_entity_ids)
-        ),
+        events_context_ids,
         apply_entities_hints(select(States.context_id_bin))
         .filter(
             (States.last_updated_ts > start_day) & (States.last_updated_ts < end_day)
@@ -54,22 +53,15 @@ def _select_entities_context_ids_sub_query(
     return select(union.c.context_id_bin).group_by(union.c.context_id_bin)
 
 
-def _apply_entities_context_union(
+def apply_entities_context_union(
     sel: Select,
+    context_ids_sub_query: Select,
     start_day: float,
     end_day: float,
-    event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
-    json_quoted_entity_ids: list[str],
 ) -> CompoundSelect:
     """Generate a CTE to find the entity and device context ids and a query to find linked row."""
-    entities_cte: CTE = _select_entities_context_ids_sub_query(
-        start_day,
-        end_day,
-        event_type_ids,
-        states_metadata_ids,
-        json_quoted_entity_ids,
-    ).cte()
+    entities_cte: CTE = context_ids_sub_query.cte()
     # We used to optimize this to exclude rows we already in the union with
     # a StatesMeta.metadata_ids.not_in(states_metadata_ids) but that made the
     # query much slower on MySQL, and since we already filter them away
@@ -102,15 +94,49 @@ def entities_stmt(
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
     return lambda_stmt(
-        lambda: _apply_entities_context_union(
+        lambda: apply_entities_context_union(
             select_events_without_states(start_day, end_day, event_type_ids).where(
                 apply_event_entity_id_matchers(json_quoted_entity_ids)
             ),
+            select_entities_context_ids_sub_query(
+                select_events_context_id_subquery(
+                    start_day, end_day, event_type_ids
+                ).where(apply_event_entity_id_matchers(json_quoted_entity_ids)),
+                start_day,
+                end_day,
+                states_metadata_ids,
+            ),
+            start_day,
+            end_day,
+            states_metadata_ids,
+        ).order_by(Events.time_fired_ts)
+    )
+
+
+def entities_references_stmt(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    states_metadata_ids: Collection[int],
+    entity_ids: list[str],
+) -> StatementLambdaElement:
+    """Generate a logbook query for multiple entities using the event references."""
+    return lambda_stmt(
+        lambda: apply_entities_context_union(
+            select_events_for_references(
+                start_day, end_day, event_type_ids, entity_ids
+            ),
+            select_entities_context_ids_sub_query(
+                select_event_references_context_id_subquery(
+                    start_day, end_day, event_type_ids, entity_ids
+                ),
+                start_day,
+                end_day,
+                states_metadata_ids,
+            ),
             start_day,
             end_day,
-            event_type_ids,
             states_metadata_ids,
-            json_quoted_entity_ids,
         ).order_by(Events.time_fired_ts)
     )
 
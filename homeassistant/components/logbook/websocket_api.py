@@ -9,6 +9,7 @@ from datetime import datetime as dt, timedelta
 import logging
 from typing import Any
 
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
@@ -31,6 +32,8 @@ from .processor import EventProcessor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
 EVENT_COALESCE_TIME = 0.35
+# How many recent events the live streams share the humanified json of
+LIVE_STREAM_CACHE_SIZE = 512
 # minimum size that we will split the query
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
@@ -38,6 +41,8 @@ BIG_QUERY_RECENT_HOURS = 24
 
 _LOGGER = logging.getLogger(__name__)
 
+_LIVE_ENTRIES_CACHE: LRU[Event, bytes] = LRU(LIVE_STREAM_CACHE_SIZE)
+
 
 @dataclass(slots=True)
 class LogbookLiveStream:
@@ -206,6 +211,23 @@ def _ws_stream_get_events(
     return json_bytes(messages.event_message(msg_id, message)), last_time
 
 
+def _cached_live_entry_json(event_processor: EventProcessor, event: Event) -> bytes:
+    """Humanify a live event to json.
+
+    Once switched to live, the entry of an event is the same for every
+    stream it is sent to, so it is cached since many live streams are
+    often sent the same events. Events that are not logged are cached as
+    an empty string.
+    """
+    if (entry := _LIVE_ENTRIES_CACHE.get(event)) is None:
+        entry = b",".join(
+            json_bytes(data)
+            for data in event_processor.humanify((async_event_to_row(event),))
+        )
+        _LIVE_ENTRIES_CACHE[event] = entry
+    return entry
+
+
 async def _async_events_consumer(
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
@@ -231,6 +253,19 @@ async def _async_events_consumer(
         while not stream_queue.empty():
             events.append(stream_queue.get_nowait())
 
+        if event_processor.is_live:
+            if entries := [
+                entry
+                for event in events
+                if (entry := _cached_live_entry_json(event_processor, event))
+            ]:
+                connection.send_message(
+                    messages.construct_event_message(
+                        msg_id, b"".join((b'{"events":[', b",".join(entries), b"]}"))
+                    )
+                )
+            continue
+
         if logbook_events := event_processor.humanify(
             async_event_to_row(e) for e in events
         ):
@@ -12,8 +12,10 @@ from homeassistant.const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,  # noqa: F401
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,  # noqa: F401
     EVENT_STATE_CHANGED,
+    Platform,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import discovery
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -26,6 +28,7 @@ from homeassistant.helpers.integration_platform import (
 from homeassistant.helpers.recorder import DATA_INSTANCE
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
+from homeassistant.setup import async_when_setup
 from homeassistant.util.event_type import EventType
 
 from . import entity_registry, websocket_api
@@ -61,6 +64,9 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_MIN_COMMIT_INTERVAL = "min_commit_interval"
+CONF_SQLITE_INCREMENTAL_VACUUM = "sqlite_incremental_vacuum"
+CONF_LOW_PRIORITY_EVENT_TYPES = "low_priority_event_types"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -96,6 +102,9 @@ CONFIG_SCHEMA = vol.Schema(
                 {
                     vol.Optional(CONF_AUTO_PURGE, default=True): cv.boolean,
                     vol.Optional(CONF_AUTO_REPACK, default=True): cv.boolean,
+                    vol.Optional(
+                        CONF_SQLITE_INCREMENTAL_VACUUM, default=False
+                    ): cv.boolean,
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
@@ -104,6 +113,12 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(CONF_MIN_COMMIT_INTERVAL): vol.All(
+                        vol.Coerce(int), vol.Range(min=1)
+                    ),
+                    vol.Optional(CONF_LOW_PRIORITY_EVENT_TYPES, default=[]): vol.All(
+                        cv.ensure_list, [cv.string]
+                    ),
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -138,8 +153,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
     auto_purge = conf[CONF_AUTO_PURGE]
     auto_repack = conf[CONF_AUTO_REPACK]
+    sqlite_incremental_vacuum = conf[CONF_SQLITE_INCREMENTAL_VACUUM]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    min_commit_interval = conf.get(CONF_MIN_COMMIT_INTERVAL)
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
@@ -152,17 +169,26 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     if EVENT_STATE_CHANGED in exclude_event_types:
         _LOGGER.error("State change events cannot be excluded, use a filter instead")
         exclude_event_types.remove(EVENT_STATE_CHANGED)
+    low_priority_event_types: set[EventType[Any] | str] = set(
+        conf[CONF_LOW_PRIORITY_EVENT_TYPES]
+    )
+    if EVENT_STATE_CHANGED in low_priority_event_types:
+        _LOGGER.error("State change events cannot have a low priority")
+        low_priority_event_types.remove(EVENT_STATE_CHANGED)
     instance = hass.data[DATA_INSTANCE] = Recorder(
         hass=hass,
         auto_purge=auto_purge,
         auto_repack=auto_repack,
+        sqlite_incremental_vacuum=sqlite_incremental_vacuum,
         keep_days=keep_days,
         commit_interval=commit_interval,
+        min_commit_interval=min_commit_interval,
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        low_priority_event_types=low_priority_event_types,
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -174,7 +200,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     await _async_setup_integration_platform(hass, instance)
 
-    return await instance.async_db_ready
+    if not await instance.async_db_ready:
+        return False
+
+    async def _async_load_sensor_platform(hass: HomeAssistant, component: str) -> None:
+        """Load the sensors reporting the recorder queue and commits."""
+        await discovery.async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+
+    async_when_setup(hass, Platform.SENSOR, _async_load_sensor_platform)
+    return True
 
 
 async def _async_setup_integration_platform(
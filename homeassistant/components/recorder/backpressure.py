@@ -0,0 +1,124 @@
+"""Adapt the recorder to the load on the database."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from enum import IntEnum
+from typing import Any
+
+from .const import MAX_QUEUE_BACKLOG_MIN_VALUE
+
+# The commit interval is adapted up to the configured commit interval
+# times COMMIT_INTERVAL_MAX_FACTOR
+COMMIT_INTERVAL_MAX_FACTOR = 6
+
+# The database is busy when it spends more than this share of the
+# commit interval committing, or when the backlog is larger than
+# BUSY_BACKLOG events
+BUSY_COMMIT_DURATION_RATIO = 0.05
+BUSY_BACKLOG = 1000
+# The database is idle when it spends less than this share of the
+# commit interval committing, and the backlog is smaller than
+# IDLE_BACKLOG events
+IDLE_COMMIT_DURATION_RATIO = 0.01
+IDLE_BACKLOG = 100
+
+# Events are shed when the backlog holds at least BACKLOG_PRESSURE_MIN_VALUE
+# events and the available memory drops below the minimum available memory
+# for the backlog times these factors
+BACKLOG_PRESSURE_MIN_VALUE = MAX_QUEUE_BACKLOG_MIN_VALUE // 4
+SHED_LOW_PRIORITY_MEMORY_FACTOR = 4
+SHED_EVENTS_MEMORY_FACTOR = 2
+
+QUEUE_DEPTH_BUCKETS = (10, 100, 1000, 10000, 50000, 100000)
+COMMIT_DURATION_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10)
+
+
+class BacklogPressure(IntEnum):
+    """How much the recorder sheds events to keep the backlog in memory."""
+
+    NONE = 0
+    # Low priority event types are not recorded
+    LOW_PRIORITY = 1
+    # Only state changes are recorded
+    STATES_ONLY = 2
+
+
+class CommitIntervalController:
+    """Adapt the commit interval to the load on the database.
+
+    Committing is expensive, so the interval is widened when the database
+    is busy to commit the events in larger batches. When the database is
+    idle, the interval is shrunk back to the configured commit interval,
+    or down to min_commit_interval if set, to make new history available
+    sooner.
+    """
+
+    def __init__(
+        self, commit_interval: float, min_commit_interval: float | None = None
+    ) -> None:
+        """Initialize the controller."""
+        self.commit_interval = commit_interval
+        self.min_interval = (
+            commit_interval
+            if min_commit_interval is None
+            else min(commit_interval, min_commit_interval)
+        )
+        self.max_interval = commit_interval * COMMIT_INTERVAL_MAX_FACTOR
+        self.interval = commit_interval
+
+    def update(self, backlog: int, commit_duration: float) -> float:
+        """Return the next commit interval.
+
+        commit_duration is the longest duration of a commit since the last
+        update, 0 if nothing was committed.
+        """
+        interval = self.interval
+        if (
+            backlog > BUSY_BACKLOG
+            or commit_duration > interval * BUSY_COMMIT_DURATION_RATIO
+        ):
+            self.interval = min(self.max_interval, interval * 2)
+        elif (
+            backlog < IDLE_BACKLOG
+            and commit_duration < interval * IDLE_COMMIT_DURATION_RATIO
+        ):
+            self.interval = max(self.min_interval, interval / 2)
+        return self.interval
+
+
+class Histogram:
+    """Count observed values in buckets.
+
+    The buckets are cumulative like Prometheus histograms, a value is
+    counted in every bucket whose upper bound is greater or equal to it.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "last")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        """Initialize the histogram."""
+        self.bounds = tuple(bounds)
+        # The last count is for values larger than all the bounds
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum: float = 0
+        self.last: float | None = None
+
+    def observe(self, value: float) -> None:
+        """Count a value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.last = value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dict."""
+        buckets: dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+        return {"buckets": buckets, "count": self.count, "sum": self.sum}
@@ -13,6 +13,7 @@ from homeassistant.const import (
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,  # noqa: F401
 )
 from homeassistant.helpers.json import JSON_DUMP  # noqa: F401
+from homeassistant.util.signal_type import SignalType
 
 if TYPE_CHECKING:
     from .core import Recorder  # noqa: F401
@@ -46,6 +47,12 @@ DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
 
+# Dispatched with the changed statistic_ids and the start timestamp of
+# the first changed hour once long term statistics changes are committed
+SIGNAL_STATISTICS_CHANGED: SignalType[set[str], float] = SignalType(
+    "recorder_statistics_changed"
+)
+
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
 ATTR_KEEP_DAYS = "keep_days"
@@ -58,6 +65,13 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+LAST_REFERENCED_SCHEMA_VERSION = 48
+EVENT_REFERENCES_SCHEMA_VERSION = 49
+STATISTICS_ROLLUPS_SCHEMA_VERSION = 50
+
+# The last referenced timestamp of state attributes and event data
+# is only written when the stored one is older than this many seconds
+LAST_REFERENCED_RESOLUTION = 3600
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
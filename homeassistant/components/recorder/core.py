@@ -25,6 +25,7 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
+    ATTR_DEVICE_ID,
     ATTR_ENTITY_ID,
     EVENT_HOMEASSISTANT_CLOSE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -35,10 +36,12 @@ from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
     EventStateChangedData,
+    HassJob,
     HomeAssistant,
     callback,
 )
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -50,10 +53,22 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .backpressure import (
+    BACKLOG_PRESSURE_MIN_VALUE,
+    COMMIT_DURATION_BUCKETS,
+    QUEUE_DEPTH_BUCKETS,
+    SHED_EVENTS_MEMORY_FACTOR,
+    SHED_LOW_PRIORITY_MEMORY_FACTOR,
+    BacklogPressure,
+    CommitIntervalController,
+    Histogram,
+)
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
+    EVENT_REFERENCES_SCHEMA_VERSION,
     KEEPALIVE_TIME,
+    LAST_REFERENCED_SCHEMA_VERSION,
     LAST_REPORTED_SCHEMA_VERSION,
     MARIADB_PYMYSQL_URL_PREFIX,
     MARIADB_URL_PREFIX,
@@ -69,6 +84,7 @@ from .db_schema import (
     SCHEMA_VERSION,
     Base,
     EventData,
+    EventReferences,
     Events,
     EventTypes,
     StateAttributes,
@@ -84,6 +100,7 @@ from .migration import (
     EventsContextIDMigration,
     EventTypeIDMigration,
     StatesContextIDMigration,
+    StatisticsRollupsMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
@@ -148,6 +165,7 @@ DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
+BACKLOG_PRESSURE_CHECK_INTERVAL = timedelta(seconds=10)
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -166,13 +184,16 @@ class Recorder(threading.Thread):
         hass: HomeAssistant,
         auto_purge: bool,
         auto_repack: bool,
+        sqlite_incremental_vacuum: bool,
         keep_days: int,
         commit_interval: int,
+        min_commit_interval: int | None,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        low_priority_event_types: set[EventType[Any] | str],
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -182,10 +203,17 @@ class Recorder(threading.Thread):
         self.recorder_and_worker_thread_ids: set[int] = set()
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
+        self.sqlite_incremental_vacuum = sqlite_incremental_vacuum
         self.keep_days = keep_days
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.commit_interval_controller = CommitIntervalController(
+            commit_interval, min_commit_interval
+        )
+        self._commit_job = HassJob(self._async_commit_and_reschedule, "Recorder commit")
+        self._max_commit_duration = 0.0
+        self.commit_duration_histogram = Histogram(COMMIT_DURATION_BUCKETS)
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -201,6 +229,9 @@ class Recorder(threading.Thread):
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
+        self.backlog_pressure = BacklogPressure.NONE
+        self.shed_events = 0
+        self.queue_depth_histogram = Histogram(QUEUE_DEPTH_BUCKETS)
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
         # The entity_filter is exposed on the recorder instance so that
@@ -208,6 +239,7 @@ class Recorder(threading.Thread):
         # by is_entity_recorder and the sensor recorder.
         self.entity_filter = entity_filter
         self.exclude_event_types = exclude_event_types
+        self.low_priority_event_types = low_priority_event_types
 
         self.schema_version = 0
         self._commits_without_expire = 0
@@ -232,6 +264,7 @@ class Recorder(threading.Thread):
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
+        self._backlog_pressure_watcher: CALLBACK_TYPE | None = None
         self._keep_alive_listener: CALLBACK_TYPE | None = None
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
@@ -302,12 +335,26 @@ class Recorder(threading.Thread):
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
+        low_priority_event_types = self.low_priority_event_types
         queue_put = self._queue.put_nowait
 
         @callback
         def _event_listener(event: Event) -> None:
             """Listen for new events and put them in the process queue."""
-            if event.event_type in exclude_event_types:
+            event_type = event.event_type
+            if event_type in exclude_event_types:
+                return
+
+            # Shed events to keep the backlog from exhausting memory
+            if (
+                (pressure := self.backlog_pressure)
+                and event_type != EVENT_STATE_CHANGED
+                and (
+                    pressure is BacklogPressure.STATES_ONLY
+                    or event_type in low_priority_event_types
+                )
+            ):
+                self.shed_events += 1
                 return
 
             if entity_filter is None or not (
@@ -341,6 +388,12 @@ class Recorder(threading.Thread):
             QUEUE_CHECK_INTERVAL,
             name="Recorder queue watcher",
         )
+        self._backlog_pressure_watcher = async_track_time_interval(
+            self.hass,
+            self._async_check_backlog_pressure,
+            BACKLOG_PRESSURE_CHECK_INTERVAL,
+            name="Recorder backlog pressure watcher",
+        )
 
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
@@ -358,6 +411,21 @@ class Recorder(threading.Thread):
         ):
             self.queue_task(COMMIT_TASK)
 
+    @callback
+    def _async_schedule_commit(self) -> None:
+        """Schedule the next commit."""
+        self._commit_listener = async_call_later(
+            self.hass, self.commit_interval_controller.interval, self._commit_job
+        )
+
+    @callback
+    def _async_commit_and_reschedule(self, now: datetime) -> None:
+        """Queue a commit and adapt the interval until the next one."""
+        self._async_commit(now)
+        commit_duration, self._max_commit_duration = self._max_commit_duration, 0.0
+        self.commit_interval_controller.update(self.backlog, commit_duration)
+        self._async_schedule_commit()
+
     @callback
     def async_add_executor_job[_T](
         self, target: Callable[..., _T], *args: Any
@@ -385,6 +453,53 @@ class Recorder(threading.Thread):
         )
         self._async_stop_queue_watcher_and_event_listener()
 
+    @callback
+    def _async_check_backlog_pressure(self, *_: Any) -> None:
+        """Periodic check of the queue size to shed events before memory runs out."""
+        backlog = self.backlog
+        self.queue_depth_histogram.observe(backlog)
+        pressure = self._backlog_pressure(backlog)
+        if pressure is self.backlog_pressure:
+            return
+        if pressure is BacklogPressure.NONE:
+            _LOGGER.info(
+                "The recorder backlog queue is down to %s events; "
+                "recording all events again after shedding %s events",
+                backlog,
+                self.shed_events,
+            )
+        elif pressure is BacklogPressure.LOW_PRIORITY:
+            _LOGGER.warning(
+                "The recorder backlog queue reached %s events and memory is "
+                "running low; low priority events will not be recorded",
+                backlog,
+            )
+        else:
+            _LOGGER.warning(
+                "The recorder backlog queue reached %s events and memory is "
+                "running low; only state changes will be recorded",
+                backlog,
+            )
+        self.backlog_pressure = pressure
+
+    def _backlog_pressure(self, backlog: int) -> BacklogPressure:
+        """Return how much to shed events to keep the backlog in memory."""
+        # First check the minimum value since its cheap
+        if backlog < BACKLOG_PRESSURE_MIN_VALUE:
+            return BacklogPressure.NONE
+        available_memory = self._available_memory()
+        if (
+            available_memory
+            < MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG * SHED_EVENTS_MEMORY_FACTOR
+        ):
+            return BacklogPressure.STATES_ONLY
+        if (
+            available_memory
+            < MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG * SHED_LOW_PRIORITY_MEMORY_FACTOR
+        ):
+            return BacklogPressure.LOW_PRIORITY
+        return BacklogPressure.NONE
+
     def _available_memory(self) -> int:
         """Return the available memory in bytes."""
         if not self._psutil:
@@ -407,6 +522,9 @@ class Recorder(threading.Thread):
         if self._queue_watcher:
             self._queue_watcher()
             self._queue_watcher = None
+        if self._backlog_pressure_watcher:
+            self._backlog_pressure_watcher()
+            self._backlog_pressure_watcher = None
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
@@ -645,12 +763,7 @@ class Recorder(threading.Thread):
 
         # If the commit interval is not 0, we need to commit periodically
         if self.commit_interval:
-            self._commit_listener = async_track_time_interval(
-                self.hass,
-                self._async_commit,
-                timedelta(seconds=self.commit_interval),
-                name="Recorder commit",
-            )
+            self._async_schedule_commit()
 
         # Run nightly tasks at 4:12am
         self._nightly_listener = async_track_time_change(
@@ -812,6 +925,7 @@ class Recorder(threading.Thread):
                 EventTypeIDMigration,
                 EntityIDMigration,
                 EventIDPostMigration,
+                StatisticsRollupsMigration,
             ):
                 migrator = migrator_cls(schema_status.start_version, migration_changes)
                 migrator.do_migrate(self, session)
@@ -1070,15 +1184,44 @@ class Recorder(threading.Thread):
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
             dbevent.data_id = data_id
+            event_data_manager.mark_referenced(data_id, event.time_fired_timestamp)
         else:
             # No matching attributes found, save them in the DB
             dbevent_data = EventData(shared_data=shared_data, hash=hash_)
+            if self.schema_version >= LAST_REFERENCED_SCHEMA_VERSION:
+                dbevent_data.last_referenced_ts = event.time_fired_timestamp
             event_data_manager.add_pending(dbevent_data)
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
+        if self.schema_version >= EVENT_REFERENCES_SCHEMA_VERSION:
+            self._add_event_references_to_session(session, event, dbevent)
         self._add_to_session(session, dbevent)
 
+    def _add_event_references_to_session(
+        self, session: Session, event: Event, dbevent: Events
+    ) -> None:
+        """Add the entity and device ids referenced by an event to the session."""
+        event_data = event.data
+        for reference in (
+            event_data.get(ATTR_ENTITY_ID),
+            event_data.get(ATTR_DEVICE_ID),
+        ):
+            # The logbook only matches events referencing a single id
+            if type(reference) is not str:
+                continue
+            dbreference = EventReferences(
+                reference=reference,
+                time_fired_ts=dbevent.time_fired_ts,
+                context_id_bin=dbevent.context_id_bin,
+            )
+            dbreference.event_rel = dbevent
+            if (event_type_rel := dbevent.event_type_rel) is not None:
+                dbreference.event_type_rel = event_type_rel
+            else:
+                dbreference.event_type_id = dbevent.event_type_id
+            self._add_to_session(session, dbreference)
+
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
     ) -> None:
@@ -1153,9 +1296,14 @@ class Recorder(threading.Thread):
             )
         ):
             dbstate.attributes_id = attributes_id
+            state_attributes_manager.mark_referenced(
+                attributes_id, event.time_fired_timestamp
+            )
         else:
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+            if self.schema_version >= LAST_REFERENCED_SCHEMA_VERSION:
+                dbstate_attributes.last_referenced_ts = event.time_fired_timestamp
             state_attributes_manager.add_pending(dbstate_attributes)
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
@@ -1207,6 +1355,7 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        commit_start = time.monotonic()
 
         if (
             pending_last_reported
@@ -1223,7 +1372,12 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if self.schema_version >= LAST_REFERENCED_SCHEMA_VERSION:
+            self._update_last_referenced(session)
         session.commit()
+        commit_duration = time.monotonic() - commit_start
+        self.commit_duration_histogram.observe(commit_duration)
+        self._max_commit_duration = max(self._max_commit_duration, commit_duration)
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1243,6 +1397,31 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _update_last_referenced(self, session: Session) -> None:
+        """Write when the already stored attributes and event data were last used."""
+        with session.no_autoflush:
+            if pending_referenced := (
+                self.state_attributes_manager.get_pending_referenced()
+            ):
+                session.execute(
+                    update(StateAttributes),
+                    [
+                        {
+                            "attributes_id": attributes_id,
+                            "last_referenced_ts": last_referenced_ts,
+                        }
+                        for attributes_id, last_referenced_ts in pending_referenced.items()
+                    ],
+                )
+            if pending_referenced := self.event_data_manager.get_pending_referenced():
+                session.execute(
+                    update(EventData),
+                    [
+                        {"data_id": data_id, "last_referenced_ts": last_referenced_ts}
+                        for data_id, last_referenced_ts in pending_referenced.items()
+                    ],
+                )
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -77,13 +77,14 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 47
+SCHEMA_VERSION = 50
 
 _LOGGER = logging.getLogger(__name__)
 
 TABLE_EVENTS = "events"
 TABLE_EVENT_DATA = "event_data"
 TABLE_EVENT_TYPES = "event_types"
+TABLE_EVENT_REFERENCES = "event_references"
 TABLE_STATES = "states"
 TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_STATES_META = "states_meta"
@@ -93,6 +94,8 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
 TABLE_MIGRATION_CHANGES = "migration_changes"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
@@ -108,6 +111,7 @@ ALL_TABLES = [
     TABLE_EVENTS,
     TABLE_EVENT_DATA,
     TABLE_EVENT_TYPES,
+    TABLE_EVENT_REFERENCES,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_MIGRATION_CHANGES,
@@ -116,6 +120,8 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
 ]
 
 TABLES_TO_CHECK = [
@@ -129,6 +135,9 @@ LAST_UPDATED_INDEX_TS = "ix_states_last_updated_ts"
 METADATA_ID_LAST_UPDATED_INDEX_TS = "ix_states_metadata_id_last_updated_ts"
 EVENTS_CONTEXT_ID_BIN_INDEX = "ix_events_context_id_bin"
 STATES_CONTEXT_ID_BIN_INDEX = "ix_states_context_id_bin"
+EVENT_REFERENCES_REFERENCE_TIME_FIRED_INDEX_TS = (
+    "ix_event_references_reference_time_fired_ts"
+)
 LEGACY_STATES_EVENT_ID_INDEX = "ix_states_event_id"
 LEGACY_STATES_ENTITY_ID_LAST_UPDATED_INDEX = "ix_states_entity_id_last_updated_ts"
 CONTEXT_ID_BIN_MAX_LENGTH = 16
@@ -361,6 +370,8 @@ class EventData(Base):
     shared_data: Mapped[str | None] = mapped_column(
         Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
     )
+    # The newest time an event referenced this row, used to purge unused rows
+    last_referenced_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -424,6 +435,46 @@ class EventTypes(Base):
         )
 
 
+class EventReferences(Base):
+    """Entity and device ids referenced by events.
+
+    The entity_id and device_id of the event data are stored along with
+    the time, context and event type of the event so the logbook can find
+    the events of entities and devices without matching the event data json.
+    """
+
+    __table_args__ = (
+        # Used for fetching the events of entities and devices
+        # see logbook
+        Index(
+            EVENT_REFERENCES_REFERENCE_TIME_FIRED_INDEX_TS, "reference", "time_fired_ts"
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_EVENT_REFERENCES
+    reference_id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    event_id: Mapped[int | None] = mapped_column(
+        ID_TYPE, ForeignKey("events.event_id"), index=True
+    )
+    reference: Mapped[str | None] = mapped_column(String(MAX_LENGTH_STATE_ENTITY_ID))
+    time_fired_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    context_id_bin: Mapped[bytes | None] = mapped_column(CONTEXT_BINARY_TYPE)
+    event_type_id: Mapped[int | None] = mapped_column(
+        ID_TYPE, ForeignKey("event_types.event_type_id")
+    )
+    event_rel: Mapped[Events | None] = relationship("Events")
+    event_type_rel: Mapped[EventTypes | None] = relationship("EventTypes")
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.EventReferences("
+            f"id={self.reference_id}, event_id={self.event_id}, "
+            f"reference='{self.reference}'"
+            ")>"
+        )
+
+
 class States(Base):
     """State change history."""
 
@@ -586,6 +637,8 @@ class StateAttributes(Base):
     shared_attrs: Mapped[str | None] = mapped_column(
         Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
     )
+    # The newest time a state referenced this row, used to purge unused rows
+    last_referenced_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -789,6 +842,60 @@ class LegacyStatisticsShortTerm(LegacyBase, _StatisticsShortTerm):
     )
 
 
+class StatisticsRollupBase:
+    """Long term statistics reduced to a day or a month.
+
+    end_ts is stored since the periods depend on the time zone the
+    rollup was computed in.
+    """
+
+    id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    created_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, default=time.time)
+    metadata_id: Mapped[int | None] = mapped_column(
+        ID_TYPE,
+        ForeignKey(f"{TABLE_STATISTICS_META}.id", ondelete="CASCADE"),
+    )
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    end_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    last_reset_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    state: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    sum: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+
+
+class StatisticsDaily(Base, StatisticsRollupBase):
+    """Long term statistics reduced to a day."""
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, StatisticsRollupBase):
+    """Long term statistics reduced to a month."""
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class _StatisticsMeta:
     """Statistics meta data."""
 
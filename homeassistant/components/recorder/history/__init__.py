@@ -17,6 +17,7 @@ from .modern import (
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
+    get_states_chunk_end_time as _modern_get_states_chunk_end_time,
     state_changes_during_period as _modern_state_changes_during_period,
 )
 
@@ -28,6 +29,7 @@ __all__ = [
     "get_last_state_changes",
     "get_significant_states",
     "get_significant_states_with_session",
+    "get_states_chunk_end_time",
     "state_changes_during_period",
 ]
 
@@ -152,6 +154,22 @@ def get_significant_states_with_session(
     )
 
 
+def get_states_chunk_end_time(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str] | None,
+    max_rows: int,
+) -> datetime | None:
+    """Return the end of a window from start_time with at most max_rows states."""
+    if not get_instance(hass).states_meta_manager.active:
+        # Legacy databases are not chunked
+        return None
+    return _modern_get_states_chunk_end_time(
+        hass, start_time, end_time, entity_ids, max_rows
+    )
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
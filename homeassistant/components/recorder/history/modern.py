@@ -319,6 +319,62 @@ def get_full_significant_states_with_session(
     )
 
 
+def _states_chunk_end_stmt(
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: list[int],
+    max_rows: int,
+) -> Select:
+    """Query the last_updated time of the first state past max_rows."""
+    return (
+        select(States.last_updated_ts)
+        .filter(States.metadata_id.in_(metadata_ids))
+        .filter(States.last_updated_ts > start_time_ts)
+        .filter(States.last_updated_ts < end_time_ts)
+        .order_by(States.last_updated_ts)
+        .offset(max_rows)
+        .limit(1)
+    )
+
+
+def get_states_chunk_end_time(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str] | None,
+    max_rows: int,
+) -> datetime | None:
+    """Return the end of a window from start_time with at most max_rows states.
+
+    Every state of the entities is counted, not only the significant ones,
+    so the window never holds more than max_rows significant states either.
+
+    Returns None if all states until end_time fit in the window.
+    """
+    if not entity_ids:
+        return None
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            entity_id_to_metadata_id := get_instance(hass).states_meta_manager.get_many(
+                entity_ids, session, False
+            )
+        ) or not (
+            possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)
+        ):
+            return None
+        metadata_ids = possible_metadata_ids
+        start_time_ts = dt_util.utc_to_timestamp(start_time)
+        end_time_ts = dt_util.utc_to_timestamp(end_time)
+        stmt = lambda_stmt(
+            lambda: _states_chunk_end_stmt(
+                start_time_ts, end_time_ts, metadata_ids, max_rows
+            )
+        )
+        if not (rows := execute_stmt_lambda_element(session, stmt, orm_rows=False)):
+            return None
+        return dt_util.utc_from_timestamp(rows[0].last_updated_ts)
+
+
 def _state_changed_during_period_stmt(
     start_time_ts: float,
     end_time_ts: float | None,
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Any, cast, final
 from uuid import UUID
 
 import sqlalchemy
-from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, text, update
+from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, select, text, update
 from sqlalchemy.engine import CursorResult, Engine
 from sqlalchemy.exc import (
     DatabaseError,
@@ -53,6 +53,7 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -67,15 +68,20 @@ from .db_schema import (
     STATISTICS_TABLES,
     TABLE_STATES,
     Base,
+    EventData,
+    EventReferences,
     Events,
     EventTypes,
     LegacyBase,
     MigrationChanges,
     SchemaChanges,
+    StateAttributes,
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -95,12 +101,17 @@ from .queries import (
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
+    has_statistics_to_roll_up,
     has_used_states_entity_ids,
     has_used_states_event_ids,
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import cleanup_statistics_timestamp_migration, get_start_time
+from .statistics import (
+    cleanup_statistics_timestamp_migration,
+    get_start_time,
+    roll_up_statistics,
+)
 from .tasks import RecorderTask
 from .util import (
     database_job_retry_wrapper,
@@ -118,6 +129,9 @@ if TYPE_CHECKING:
 # Schema version 42 was introduced in HA Core 2023.11
 LIVE_MIGRATION_MIN_SCHEMA_VERSION = 42
 
+# Rows updated per transaction when filling in a new column of a large table
+MIGRATION_PRIMARY_KEY_BATCH_SIZE = 100000
+
 MIGRATION_NOTE_OFFLINE = (
     "Note: this may take several hours on large databases and slow machines. "
     "Home Assistant will not start until the upgrade is completed. Please be patient "
@@ -1758,6 +1772,72 @@ class _SchemaVersion47Migrator(_SchemaVersionMigrator, target_version=47):
         )
 
 
+class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        now_timestamp = time()
+        for table, model, id_column in (
+            ("state_attributes", StateAttributes, StateAttributes.attributes_id),
+            ("event_data", EventData, EventData.data_id),
+        ):
+            _add_columns(
+                self.session_maker,
+                table,
+                [f"last_referenced_ts {self.column_types.timestamp_type}"],
+            )
+            # Existing rows may be referenced by any row written until now
+            _initialize_last_referenced_ts(
+                self.session_maker, model, id_column, now_timestamp
+            )
+            _create_index(self.session_maker, table, f"ix_{table}_last_referenced_ts")
+
+
+def _initialize_last_referenced_ts(
+    session_maker: Callable[[], Session],
+    model: type[StateAttributes | EventData],
+    id_column: Any,
+    now_timestamp: float,
+) -> None:
+    """Set last_referenced_ts of the existing rows.
+
+    The rows are updated in primary key ranges, each in its own transaction,
+    so large tables are not locked by a single long running update.
+    """
+    with session_scope(session=session_maker()) as session:
+        min_id, max_id = session.execute(
+            select(func.min(id_column), func.max(id_column))
+        ).one()
+    if min_id is None:
+        return
+    for start_id in range(min_id, max_id + 1, MIGRATION_PRIMARY_KEY_BATCH_SIZE):
+        with session_scope(session=session_maker()) as session:
+            session.execute(
+                update(model)
+                .where(
+                    id_column >= start_id,
+                    id_column < start_id + MIGRATION_PRIMARY_KEY_BATCH_SIZE,
+                    model.last_referenced_ts.is_(None),
+                )
+                .values(last_referenced_ts=now_timestamp)
+            )
+
+
+class _SchemaVersion49Migrator(_SchemaVersionMigrator, target_version=49):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # Only events recorded from now on are referenced, the logbook
+        # keeps matching the event data for events recorded before
+        cast(Table, EventReferences.__table__).create(self.engine, checkfirst=True)
+
+
+class _SchemaVersion50Migrator(_SchemaVersionMigrator, target_version=50):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The existing statistics are rolled up by StatisticsRollupsMigration
+        for table in (StatisticsDaily, StatisticsMonthly):
+            cast(Table, table.__table__).create(self.engine, checkfirst=True)
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2648,6 +2728,32 @@ class EntityIDPostMigration(BaseRunTimeMigrationWithQuery):
         return has_used_states_entity_ids()
 
 
+class StatisticsRollupsMigration(BaseRunTimeMigrationWithQuery):
+    """Migration to roll up the existing long term statistics."""
+
+    required_schema_version = STATISTICS_ROLLUPS_SCHEMA_VERSION
+    migration_id = "statistics_rollups"
+
+    def __init__(self, schema_version: int, migration_changes: dict[str, int]) -> None:
+        """Initialize a new StatisticsRollupsMigration."""
+        super().__init__(schema_version, migration_changes)
+        self._next_start_ts: float | None = None
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Roll up a month of statistics, returns True if completed."""
+        if instance.schema_version < STATISTICS_ROLLUPS_SCHEMA_VERSION:
+            return DataMigrationStatus(needs_migrate=False, migration_done=False)
+        _LOGGER.debug("Rolling up statistics from %s", self._next_start_ts)
+        self._next_start_ts = roll_up_statistics(instance, self._next_start_ts)
+        is_done = self._next_start_ts is None
+        _LOGGER.debug("Rolling up statistics: done=%s", is_done)
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+    def needs_migrate_query(self) -> StatementLambdaElement:
+        """Check if there are statistics to roll up."""
+        return has_statistics_to_roll_up()
+
+
 def _mark_migration_done(
     session: Session, migration: type[BaseRunTimeMigration]
 ) -> None:
@@ -13,6 +13,11 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
+from .const import (
+    EVENT_REFERENCES_SCHEMA_VERSION,
+    LAST_REFERENCED_RESOLUTION,
+    LAST_REFERENCED_SCHEMA_VERSION,
+)
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -21,6 +26,7 @@ from .queries import (
     data_ids_exist_in_events,
     data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
+    delete_event_references_rows,
     delete_event_rows,
     delete_event_types_rows,
     delete_recorder_runs_rows,
@@ -30,6 +36,8 @@ from .queries import (
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    find_attributes_ids_referenced_since,
+    find_data_ids_referenced_since,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -40,8 +48,10 @@ from .queries import (
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
+    find_unreferenced_attributes_ids_to_purge,
+    find_unreferenced_data_ids_to_purge,
 )
-from .repack import repack_database
+from .repack import incremental_vacuum_database, repack_database
 from .util import retryable_database_job, session_scope
 
 if TYPE_CHECKING:
@@ -125,6 +135,8 @@ def purge_old_data(
         _purge_old_recorder_runs(instance, session, purge_before)
     if repack:
         repack_database(instance)
+    elif instance.sqlite_incremental_vacuum:
+        incremental_vacuum_database(instance)
     return True
 
 
@@ -147,7 +159,7 @@ def _purge_legacy_format(
     )
     _purge_state_ids(instance, session, state_ids)
     _purge_unused_attributes_ids(instance, session, attributes_ids)
-    _purge_event_ids(session, event_ids)
+    _purge_event_ids(instance, session, event_ids)
     _purge_unused_data_ids(instance, session, data_ids)
 
     # The database may still have some rows that have an event_id but are not
@@ -202,6 +214,17 @@ def _purge_states_and_attributes_ids(
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
+    if instance.schema_version >= LAST_REFERENCED_SCHEMA_VERSION:
+        # Attributes that were last referenced well before purge_before
+        # are purged with a range delete once all the old states are gone,
+        # only the remaining ones need to be looked up in the states table
+        attributes_ids_batch = _select_attributes_ids_referenced_since(
+            session, attributes_ids_batch, purge_before, max_bind_vars
+        )
+        if not has_remaining_state_ids_to_purge:
+            has_remaining_state_ids_to_purge = _purge_unreferenced_attributes_ids(
+                instance, session, purge_before
+            )
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
@@ -234,9 +257,18 @@ def _purge_events_and_data_ids(
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
-        _purge_event_ids(session, event_ids)
+        _purge_event_ids(instance, session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
+    if instance.schema_version >= LAST_REFERENCED_SCHEMA_VERSION:
+        # See _purge_states_and_attributes_ids
+        data_ids_batch = _select_data_ids_referenced_since(
+            session, data_ids_batch, purge_before, max_bind_vars
+        )
+        if not has_remaining_event_ids_to_purge:
+            has_remaining_event_ids_to_purge = _purge_unreferenced_data_ids(
+                instance, session, purge_before
+            )
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
@@ -283,6 +315,94 @@ def _select_event_data_ids_to_purge(
     return event_ids, data_ids
 
 
+def _select_attributes_ids_referenced_since(
+    session: Session,
+    attributes_ids: set[int],
+    purge_before: datetime,
+    max_bind_vars: int,
+) -> set[int]:
+    """Return the attributes ids that the range delete cannot purge yet."""
+    referenced_since = purge_before.timestamp() - LAST_REFERENCED_RESOLUTION
+    referenced_ids: set[int] = set()
+    for attributes_ids_chunk in chunked_or_all(attributes_ids, max_bind_vars):
+        referenced_ids.update(
+            attributes_id
+            for (attributes_id,) in session.execute(
+                find_attributes_ids_referenced_since(
+                    attributes_ids_chunk, referenced_since
+                )
+            ).all()
+        )
+    return referenced_ids
+
+
+def _select_data_ids_referenced_since(
+    session: Session, data_ids: set[int], purge_before: datetime, max_bind_vars: int
+) -> set[int]:
+    """Return the event data ids that the range delete cannot purge yet."""
+    referenced_since = purge_before.timestamp() - LAST_REFERENCED_RESOLUTION
+    referenced_ids: set[int] = set()
+    for data_ids_chunk in chunked_or_all(data_ids, max_bind_vars):
+        referenced_ids.update(
+            data_id
+            for (data_id,) in session.execute(
+                find_data_ids_referenced_since(data_ids_chunk, referenced_since)
+            ).all()
+        )
+    return referenced_ids
+
+
+def _purge_unreferenced_attributes_ids(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Purge a batch of attributes ids that have not been referenced since purge_before.
+
+    Must only be called once all states older than purge_before have
+    been purged. The last referenced timestamp is only written once per
+    LAST_REFERENCED_RESOLUTION so any newer state may have referenced the
+    attributes up to that long after it.
+
+    Returns true if there may be more attributes ids to purge.
+    """
+    max_bind_vars = instance.max_bind_vars
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.execute(
+            find_unreferenced_attributes_ids_to_purge(
+                purge_before.timestamp() - LAST_REFERENCED_RESOLUTION, max_bind_vars
+            )
+        ).all()
+    }
+    _LOGGER.debug("Selected %s unreferenced attributes to remove", len(attributes_ids))
+    if attributes_ids:
+        _purge_batch_attributes_ids(instance, session, attributes_ids)
+    return len(attributes_ids) == max_bind_vars
+
+
+def _purge_unreferenced_data_ids(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Purge a batch of event data ids that have not been referenced since purge_before.
+
+    See _purge_unreferenced_attributes_ids.
+
+    Returns true if there may be more event data ids to purge.
+    """
+    max_bind_vars = instance.max_bind_vars
+    data_ids = {
+        data_id
+        for (data_id,) in session.execute(
+            find_unreferenced_data_ids_to_purge(
+                purge_before.timestamp() - LAST_REFERENCED_RESOLUTION, max_bind_vars
+            )
+        ).all()
+    }
+    _LOGGER.debug("Selected %s unreferenced event data to remove", len(data_ids))
+    if data_ids:
+        _purge_batch_data_ids(instance, session, data_ids)
+    return len(data_ids) == max_bind_vars
+
+
 def _select_unused_attributes_ids(
     instance: Recorder,
     session: Session,
@@ -570,10 +690,13 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
-def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
+def _purge_event_ids(instance: Recorder, session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
         return
+    if instance.schema_version >= EVENT_REFERENCES_SCHEMA_VERSION:
+        deleted_rows = session.execute(delete_event_references_rows(event_ids))
+        _LOGGER.debug("Deleted %s event references", deleted_rows)
     deleted_rows = session.execute(delete_event_rows(event_ids))
     _LOGGER.debug("Deleted %s events", deleted_rows)
 
@@ -705,7 +828,7 @@ def _purge_filtered_states(
     # These are legacy events that are linked to a state that are no longer
     # created but since we did not remove them when we stopped adding new ones
     # we will need to purge them here.
-    _purge_event_ids(session, filtered_event_ids)
+    _purge_event_ids(instance, session, filtered_event_ids)
     unused_attribute_ids_set = _select_unused_attributes_ids(
         instance,
         session,
@@ -755,7 +878,7 @@ def _purge_filtered_events(
         # created but since we did not remove them when we stopped adding new ones
         # we will need to purge them here.
         _purge_state_ids(instance, session, state_ids)
-    _purge_event_ids(session, event_ids_set)
+    _purge_event_ids(instance, session, event_ids_set)
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, set(data_ids), database_engine
     ):
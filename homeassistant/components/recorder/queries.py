@@ -11,6 +11,7 @@ from sqlalchemy.sql.selectable import Select
 
 from .db_schema import (
     EventData,
+    EventReferences,
     Events,
     EventTypes,
     MigrationChanges,
@@ -591,6 +592,17 @@ def delete_statistics_short_term_rows(
     )
 
 
+def delete_event_references_rows(
+    event_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Delete event_references rows."""
+    return lambda_stmt(
+        lambda: delete(EventReferences)
+        .where(EventReferences.event_id.in_(event_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_rows(
     event_ids: Iterable[int],
 ) -> StatementLambdaElement:
@@ -636,6 +648,54 @@ def find_states_to_purge(
     )
 
 
+def find_unreferenced_attributes_ids_to_purge(
+    referenced_before: float, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find state attributes that were last referenced before a timestamp."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id)
+        .filter(StateAttributes.last_referenced_ts < referenced_before)
+        .limit(max_bind_vars)
+    )
+
+
+def find_attributes_ids_referenced_since(
+    attributes_ids: Iterable[int], referenced_since: float
+) -> StatementLambdaElement:
+    """Find state attributes referenced since a timestamp or not known when."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id).filter(
+            StateAttributes.attributes_id.in_(attributes_ids),
+            StateAttributes.last_referenced_ts.is_(None)
+            | (StateAttributes.last_referenced_ts >= referenced_since),
+        )
+    )
+
+
+def find_unreferenced_data_ids_to_purge(
+    referenced_before: float, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find event data that was last referenced before a timestamp."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id)
+        .filter(EventData.last_referenced_ts < referenced_before)
+        .limit(max_bind_vars)
+    )
+
+
+def find_data_ids_referenced_since(
+    data_ids: Iterable[int], referenced_since: float
+) -> StatementLambdaElement:
+    """Find event data referenced since a timestamp or not known when."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id).filter(
+            EventData.data_id.in_(data_ids),
+            EventData.last_referenced_ts.is_(None)
+            | (EventData.last_referenced_ts >= referenced_since),
+        )
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -805,6 +865,11 @@ def has_entity_ids_to_migrate() -> StatementLambdaElement:
     )
 
 
+def has_statistics_to_roll_up() -> StatementLambdaElement:
+    """Check if there are long term statistics to roll up."""
+    return lambda_stmt(lambda: select(Statistics.id).limit(1))
+
+
 def find_states_context_ids_to_migrate(max_bind_vars: int) -> StatementLambdaElement:
     """Find events context_ids to migrate."""
     return lambda_stmt(
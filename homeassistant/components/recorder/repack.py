@@ -9,6 +9,7 @@ from sqlalchemy import text
 
 from .const import SupportedDialect
 from .db_schema import ALL_TABLES
+from .util import query_on_connection
 
 if TYPE_CHECKING:
     from . import Recorder
@@ -46,3 +47,22 @@ def repack_database(instance: Recorder) -> None:
             conn.execute(text(f"OPTIMIZE TABLE {','.join(ALL_TABLES)}"))
             conn.commit()
         return
+
+
+def incremental_vacuum_database(instance: Recorder) -> None:
+    """Return the pages freed by a purge to the file system.
+
+    Only SQLite databases with the incremental auto vacuum layout, see
+    setup_connection_for_dialect, keep track of the pages to free.
+    """
+    assert instance.engine is not None
+    if instance.engine.dialect.name != SupportedDialect.SQLITE:
+        return
+
+    _LOGGER.debug("Freeing the pages of purged rows")
+    with instance.engine.connect() as conn:
+        # Each page is freed by a step of the statement. It has no result
+        # columns, so fetch its rows with the DBAPI cursor to free all pages
+        dbapi_connection = conn.connection.dbapi_connection
+        assert dbapi_connection is not None
+        query_on_connection(dbapi_connection, "PRAGMA incremental_vacuum")
@@ -0,0 +1,100 @@
+"""Sensors reporting the load on the recorder."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .backpressure import Histogram
+from .const import DOMAIN
+from .core import Recorder
+from .util import get_instance
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class RecorderSensorEntityDescription(SensorEntityDescription):
+    """Describes a recorder sensor."""
+
+    value_fn: Callable[[Recorder], float | None]
+    histogram_fn: Callable[[Recorder], Histogram]
+
+
+SENSORS: tuple[RecorderSensorEntityDescription, ...] = (
+    RecorderSensorEntityDescription(
+        key="queue_depth",
+        name="Recorder queue depth",
+        native_unit_of_measurement="events",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda instance: instance.backlog,
+        histogram_fn=lambda instance: instance.queue_depth_histogram,
+    ),
+    RecorderSensorEntityDescription(
+        key="commit_duration",
+        name="Recorder commit duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=3,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda instance: instance.commit_duration_histogram.last,
+        histogram_fn=lambda instance: instance.commit_duration_histogram,
+    ),
+)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the recorder sensors."""
+    if discovery_info is None:
+        return
+    instance = get_instance(hass)
+    async_add_entities(RecorderSensor(instance, description) for description in SENSORS)
+
+
+class RecorderSensor(SensorEntity):
+    """A sensor reporting the load on the recorder.
+
+    The attributes hold a histogram of the values since the recorder
+    started.
+    """
+
+    entity_description: RecorderSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset({"buckets", "count", "sum"})
+
+    def __init__(
+        self, instance: Recorder, description: RecorderSensorEntityDescription
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._instance = instance
+        self._attr_unique_id = f"{DOMAIN}_{description.key}"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the latest value."""
+        return self.entity_description.value_fn(self._instance)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the histogram of the values."""
+        return self.entity_description.histogram_fn(self._instance).as_dict()
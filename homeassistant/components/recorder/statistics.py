@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import chain, groupby, pairwise
 import logging
 from operator import itemgetter
 import re
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    bindparam,
+    case,
+    delete,
+    event,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    or_,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -23,6 +39,7 @@ import voluptuous as vol
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.core import HomeAssistant, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.util import dt as dt_util
@@ -54,12 +71,18 @@ from .const import (
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
+    SIGNAL_STATISTICS_CHANGED,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMeta,
+    StatisticsMonthly,
+    StatisticsRollupBase,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -445,6 +468,33 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
     )
 
 
+def _compiled_statistic_ids_stmt(start_ts: float) -> StatementLambdaElement:
+    """Return a statement that returns the statistic_ids compiled for an hour."""
+    return lambda_stmt(
+        lambda: select(StatisticsMeta.statistic_id)
+        .join(Statistics, Statistics.metadata_id == StatisticsMeta.id)
+        .where(Statistics.start_ts == start_ts)
+    )
+
+
+def _notify_statistics_changed(
+    instance: Recorder, session: Session, statistic_ids: set[str], start_ts: float
+) -> None:
+    """Dispatch SIGNAL_STATISTICS_CHANGED once the session is committed.
+
+    Listeners may read the statistics as soon as they are notified, so
+    the signal is not sent if the changes are rolled back.
+    """
+    if not statistic_ids:
+        return
+    hass = instance.hass
+
+    def _statistics_committed(session: Session) -> None:
+        dispatcher_send(hass, SIGNAL_STATISTICS_CHANGED, statistic_ids, start_ts)
+
+    event.listen(session, "after_commit", _statistics_committed, once=True)
+
+
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
     """Compile missing statistics."""
@@ -601,6 +651,21 @@ def _compile_statistics(
     if start.minute == 55:
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
+        hour_start_ts = start.replace(minute=0).timestamp()
+        session.flush()
+        if instance.schema_version >= STATISTICS_ROLLUPS_SCHEMA_VERSION:
+            # Roll up the day and month if the hour ended them
+            hour_end_ts = hour_start_ts + Statistics.duration.total_seconds()
+            _update_statistics_rollups(session, hour_start_ts, hour_end_ts, hour_end_ts)
+        compiled_statistic_ids = {
+            row.statistic_id
+            for row in execute_stmt_lambda_element(
+                session, _compiled_statistic_ids_stmt(hour_start_ts)
+            )
+        }
+        _notify_statistics_changed(
+            instance, session, compiled_statistic_ids, hour_start_ts
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -631,7 +696,7 @@ def _compile_statistics(
 
 def _adjust_sum_statistics(
     session: Session,
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollupBase],
     metadata_id: int,
     start_time: datetime,
     adj: float,
@@ -747,6 +812,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+        _notify_statistics_changed(instance, session, set(statistic_ids), 0)
 
 
 def update_statistics_metadata(
@@ -762,6 +828,7 @@ def update_statistics_metadata(
             statistics_meta_manager.update_unit_of_measurement(
                 session, statistic_id, new_unit_of_measurement
             )
+            _notify_statistics_changed(instance, session, {statistic_id}, 0)
     if new_statistic_id is not UNDEFINED and new_statistic_id is not None:
         with session_scope(
             session=instance.get_session(),
@@ -772,6 +839,9 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+            _notify_statistics_changed(
+                instance, session, {statistic_id, new_statistic_id}, 0
+            )
 
 
 async def async_list_statistic_ids(
@@ -1113,6 +1183,344 @@ def _reduce_statistics_per_month(
     )
 
 
+# Reducing in the database renders a CASE expression with the
+# boundaries of each period, so only do it for a bounded number of periods
+MAX_PERIODS_TO_REDUCE_IN_DB = 1000
+
+_REDUCE_TS_FACTORIES: dict[
+    str,
+    Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ],
+] = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+
+def _find_period_bounds(
+    period_start_end: Callable[[float], tuple[float, float]],
+    start_ts: float,
+    end_ts: float,
+) -> list[float] | None:
+    """Return the boundaries of the periods from the one start_ts is within to end_ts.
+
+    Returns None if the periods don't line up in the configured time zone.
+    """
+    bounds = [period_start_end(start_ts)[0]]
+    while bounds[-1] < end_ts:
+        start, end = period_start_end(bounds[-1])
+        if start != bounds[-1]:
+            # The periods don't line up in this time zone, the
+            # reducers have to look up the period of each row
+            return None
+        bounds.append(end)
+    return bounds
+
+
+def _get_period_bounds(
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    period: Literal["day", "week", "month"],
+) -> list[float] | None:
+    """Return the boundaries of the periods between start_time and end_time.
+
+    Returns None if the periods can't be reduced in the database.
+    """
+    _, period_start_end = _REDUCE_TS_FACTORIES[period]()
+    start_time_ts = start_time.timestamp()
+    if end_time is not None:
+        end_time_ts = end_time.timestamp()
+    else:
+        stmt = select(func.max(Statistics.start_ts)).filter(
+            Statistics.start_ts >= start_time_ts
+        )
+        if metadata_ids:
+            stmt = stmt.filter(Statistics.metadata_id.in_(metadata_ids))
+        if (last_start_ts := session.execute(stmt).scalar()) is None:
+            return None
+        end_time_ts = period_start_end(last_start_ts)[1]
+
+    bounds = _find_period_bounds(period_start_end, start_time_ts, end_time_ts)
+    if (
+        bounds is None
+        or bounds[0] != start_time_ts
+        or len(bounds) > MAX_PERIODS_TO_REDUCE_IN_DB + 1
+    ):
+        return None
+    return bounds
+
+
+def _period_start_expr(
+    column: ColumnElement, bounds: list[float], first: int, last: int
+) -> ColumnElement:
+    """Return an expression for the start of the period column is within.
+
+    The periods first..last are searched with nested CASE expressions so
+    the database only has to do a few comparisons per row.
+    """
+    if first == last:
+        return literal(bounds[first], column.type, literal_execute=True)
+    middle = (first + last + 1) // 2
+    return case(
+        (
+            column < literal(bounds[middle], column.type, literal_execute=True),
+            _period_start_expr(column, bounds, first, middle - 1),
+        ),
+        else_=_period_start_expr(column, bounds, middle, last),
+    )
+
+
+def _generate_reduced_statistics_during_period_stmt(
+    bounds: list[float],
+    metadata_ids: list[int] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    ranges: list[tuple[int, float, float]] | None = None,
+) -> Select:
+    """Prepare a database query for statistics reduced to the given periods.
+
+    The hourly statistics are grouped by period in the database, min and
+    max are aggregated per period and last_reset, state and sum are taken
+    from the last hour of each period, like _reduce_statistics does.
+    Mean is not supported.
+
+    If ranges is passed, only the hourly statistics within the
+    (metadata_id, start_ts, end_ts) ranges are reduced.
+    """
+    period_start = _period_start_expr(Statistics.start_ts, bounds, 0, len(bounds) - 2)
+    rows_stmt = select(
+        Statistics.metadata_id,
+        Statistics.start_ts,
+        period_start.label("period_start_ts"),
+        *(getattr(Statistics, key) for key in ("max", "min") if key in types),
+    ).filter(Statistics.start_ts >= bounds[0], Statistics.start_ts < bounds[-1])
+    if metadata_ids:
+        rows_stmt = rows_stmt.filter(Statistics.metadata_id.in_(metadata_ids))
+    if ranges is not None:
+        rows_stmt = rows_stmt.filter(
+            or_(
+                *(
+                    and_(
+                        Statistics.metadata_id == metadata_id,
+                        Statistics.start_ts >= start_ts,
+                        Statistics.start_ts < end_ts,
+                    )
+                    for metadata_id, start_ts, end_ts in ranges
+                )
+            )
+        )
+    rows = rows_stmt.subquery()
+
+    columns = [rows.c.metadata_id, rows.c.period_start_ts]
+    if "max" in types:
+        columns.append(func.max(rows.c.max).label("max"))
+    if "min" in types:
+        columns.append(func.min(rows.c.min).label("min"))
+    last_columns = [
+        getattr(Statistics, _type_column_mapping[key])
+        for key in ("last_reset", "state", "sum")
+        if key in types
+    ]
+    if last_columns:
+        columns.append(func.max(rows.c.start_ts).label("last_start_ts"))
+    periods = (
+        select(*columns).group_by(rows.c.metadata_id, rows.c.period_start_ts).subquery()
+    )
+
+    stmt = select(
+        periods.c.metadata_id,
+        periods.c.period_start_ts.label("start_ts"),
+        *(periods.c[key] for key in ("max", "min") if key in types),
+        *last_columns,
+    ).select_from(periods)
+    if last_columns:
+        stmt = stmt.join(
+            Statistics,
+            and_(
+                Statistics.metadata_id == periods.c.metadata_id,
+                Statistics.start_ts == periods.c.last_start_ts,
+            ),
+        )
+    return stmt.order_by(periods.c.metadata_id, periods.c.period_start_ts)
+
+
+_ROLLUP_TABLES: tuple[
+    tuple[Literal["day", "month"], type[StatisticsDaily | StatisticsMonthly]], ...
+] = (("day", StatisticsDaily), ("month", StatisticsMonthly))
+_ROLLUP_TYPES: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]] = {
+    "last_reset",
+    "max",
+    "min",
+    "state",
+    "sum",
+}
+# The number of periods rolled up by a single query
+_ROLLUP_PERIODS_PER_QUERY = 100
+
+
+def _roll_up_periods(
+    session: Session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    bounds: list[float],
+    metadata_ids: list[int] | None,
+) -> None:
+    """Replace the rollups of the periods between the bounds."""
+    delete_stmt = delete(table).where(
+        table.start_ts < bounds[-1], table.end_ts > bounds[0]
+    )
+    if metadata_ids:
+        delete_stmt = delete_stmt.where(table.metadata_id.in_(metadata_ids))
+    # Rollups computed in another time zone may overlap the periods
+    session.execute(delete_stmt)
+    stmt = _generate_reduced_statistics_during_period_stmt(
+        bounds, metadata_ids, _ROLLUP_TYPES
+    )
+    if not (rows := session.execute(stmt).all()):
+        return
+    period_ends = dict(pairwise(bounds))
+    session.execute(
+        insert(table),
+        [
+            {
+                "metadata_id": metadata_id,
+                "start_ts": start_ts,
+                "end_ts": period_ends[start_ts],
+                "max": max_,
+                "min": min_,
+                "last_reset_ts": last_reset_ts,
+                "state": state,
+                "sum": sum_,
+            }
+            for metadata_id, start_ts, max_, min_, last_reset_ts, state, sum_ in rows
+        ],
+    )
+
+
+def _update_statistics_rollups(
+    session: Session,
+    start_ts: float,
+    end_ts: float,
+    complete_before_ts: float,
+    metadata_ids: list[int] | None = None,
+) -> None:
+    """Roll up the daily and monthly statistics of periods overlapping start-end.
+
+    Only periods which have ended at complete_before_ts are rolled up, the
+    statistics of the current period are reduced from the hourly statistics.
+    """
+    for period, table in _ROLLUP_TABLES:
+        _, period_start_end = _REDUCE_TS_FACTORIES[period]()
+        if not (bounds := _find_period_bounds(period_start_end, start_ts, end_ts)):
+            continue
+        bounds = bounds[: bisect_right(bounds, complete_before_ts)]
+        for first in range(0, len(bounds) - 1, _ROLLUP_PERIODS_PER_QUERY):
+            _roll_up_periods(
+                session,
+                table,
+                bounds[first : first + _ROLLUP_PERIODS_PER_QUERY + 1],
+                metadata_ids,
+            )
+
+
+def roll_up_statistics(instance: Recorder, start_ts: float | None) -> float | None:
+    """Roll up the long term statistics of the month start_ts is within.
+
+    If start_ts is None, the oldest statistics are rolled up.
+
+    Returns the start of the next month to roll up, or None when all
+    statistics have been rolled up.
+    """
+    with session_scope(session=instance.get_session()) as session:
+        if start_ts is None:
+            start_ts = session.execute(select(func.min(Statistics.start_ts))).scalar()
+        last_start_ts = session.execute(select(func.max(Statistics.start_ts))).scalar()
+        if start_ts is None or last_start_ts is None or start_ts > last_start_ts:
+            return None
+        _, month_start_end = reduce_month_ts_factory()
+        end_ts = month_start_end(start_ts)[1]
+        _update_statistics_rollups(
+            session, start_ts, end_ts, dt_util.utcnow().timestamp()
+        )
+    return end_ts
+
+
+def _reduce_statistics_with_rollups(
+    session: Session,
+    bounds: list[float],
+    metadata_ids: list[int],
+    table: type[StatisticsDaily | StatisticsMonthly],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    max_bind_vars: int,
+) -> list[Row]:
+    """Return statistics reduced to the periods, read from the rollups.
+
+    Rollups computed in another time zone are ignored. The periods
+    without a rollup are reduced from the hourly statistics.
+    """
+    stmt = (
+        select(
+            table.metadata_id,
+            table.start_ts,
+            *(getattr(table, key) for key in ("max", "min") if key in types),
+            *(
+                getattr(table, _type_column_mapping[key])
+                for key in ("last_reset", "state", "sum")
+                if key in types
+            ),
+            table.end_ts,
+        )
+        .filter(table.metadata_id.in_(metadata_ids))
+        .filter(table.start_ts >= bounds[0], table.start_ts < bounds[-1])
+    )
+    period_ends = dict(pairwise(bounds))
+    stats: list[Row] = []
+    rolled_up: dict[int, set[float]] = defaultdict(set)
+    for row in session.execute(stmt):
+        if period_ends.get(row.start_ts) == row.end_ts:
+            stats.append(row)
+            rolled_up[row.metadata_id].add(row.start_ts)
+
+    # Find the ranges of periods which are not rolled up
+    ranges: list[tuple[int, float, float]] = []
+    for metadata_id in metadata_ids:
+        metadata_rolled_up = rolled_up.get(metadata_id, set())
+        range_start: float | None = None
+        for period_start in bounds[:-1]:
+            if period_start not in metadata_rolled_up:
+                if range_start is None:
+                    range_start = period_start
+            elif range_start is not None:
+                ranges.append((metadata_id, range_start, period_start))
+                range_start = None
+        if range_start is not None:
+            ranges.append((metadata_id, range_start, bounds[-1]))
+
+    if ranges:
+        reduced_stmt = _generate_reduced_statistics_during_period_stmt(
+            bounds,
+            metadata_ids,
+            types,
+            # Each range is filtered by three bound parameters
+            ranges if len(ranges) * 3 < max_bind_vars else None,
+        )
+        reduced_stats = session.execute(reduced_stmt).all()
+        if not stats:
+            return reduced_stats
+        # Prefer the rollups for periods which are in both
+        stats.extend(
+            row
+            for row in reduced_stats
+            if row.start_ts not in rolled_up.get(row.metadata_id, ())
+        )
+
+    stats.sort(key=itemgetter(0, 1))
+    return stats
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1768,12 +2176,40 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    bounds: list[float] | None = None
+    if period in _REDUCE_TS_FACTORIES and "mean" not in types:
+        # Without mean, the periods can be reduced in the database
+        # which saves fetching and converting every hourly row
+        bounds = _get_period_bounds(session, start_time, end_time, metadata_ids, period)
+
+    stats: Sequence[Row]
+    if bounds is not None:
+        instance = get_instance(hass)
+        if (
+            metadata_ids
+            and period in ("day", "month")
+            and instance.schema_version >= STATISTICS_ROLLUPS_SCHEMA_VERSION
+        ):
+            stats = _reduce_statistics_with_rollups(
+                session,
+                bounds,
+                metadata_ids,
+                StatisticsDaily if period == "day" else StatisticsMonthly,
+                types,
+                instance.max_bind_vars,
+            )
+        else:
+            reduced_stmt = _generate_reduced_statistics_during_period_stmt(
+                bounds, metadata_ids, types
+            )
+            stats = session.execute(reduced_stmt).all()
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
     if not stats:
         return {}
@@ -1789,13 +2225,17 @@ def _statistics_during_period_with_session(
         types,
     )
 
-    if period == "day":
+    if bounds is not None:
+        # The rows start at the start of their period
+        period_ends = dict(pairwise(bounds))
+        for stats_list in result.values():
+            for row in stats_list:
+                row["end"] = period_ends[row["start"]]
+    elif period == "day":
         result = _reduce_statistics_per_day(result, types)
-
-    if period == "week":
+    elif period == "week":
         result = _reduce_statistics_per_week(result, types)
-
-    if period == "month":
+    elif period == "month":
         result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
@@ -2340,13 +2780,29 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    imported_start_ts: list[float] = []
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        imported_start_ts.append(stat["start"].timestamp())
 
     if table != StatisticsShortTerm:
+        if not imported_start_ts:
+            return True
+        if instance.schema_version >= STATISTICS_ROLLUPS_SCHEMA_VERSION:
+            session.flush()
+            _update_statistics_rollups(
+                session,
+                min(imported_start_ts),
+                max(imported_start_ts) + table.duration.total_seconds(),
+                dt_util.utcnow().timestamp(),
+                [metadata_id],
+            )
+        _notify_statistics_changed(
+            instance, session, {metadata["statistic_id"]}, min(imported_start_ts)
+        )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2476,28 +2932,55 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        if instance.schema_version >= STATISTICS_ROLLUPS_SCHEMA_VERSION:
+            for _, table in _ROLLUP_TABLES:
+                _adjust_sum_statistics(
+                    session,
+                    table,
+                    metadata[statistic_id][0],
+                    start_time.replace(minute=0),
+                    sum_adjustment,
+                )
+            # Roll up the periods which are only adjusted from start_time again
+            hour_start_ts = start_time.replace(minute=0).timestamp()
+            _update_statistics_rollups(
+                session,
+                hour_start_ts,
+                hour_start_ts + Statistics.duration.total_seconds(),
+                dt_util.utcnow().timestamp(),
+                [metadata[statistic_id][0]],
+            )
+
+        _notify_statistics_changed(
+            instance,
+            session,
+            {statistic_id},
+            start_time.replace(minute=0).timestamp(),
+        )
+
     return True
 
 
 def _change_statistics_unit_for_table(
     session: Session,
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollupBase],
     metadata_id: int,
     convert: Callable[[float | None], float | None],
 ) -> None:
     """Insert statistics in the database."""
-    columns = (table.id, table.mean, table.min, table.max, table.state, table.sum)
-    query = session.query(*columns).filter_by(metadata_id=bindparam("metadata_id"))
+    # The rollups don't have a mean
+    value_columns = [
+        getattr(table, column)
+        for column in ("mean", "min", "max", "state", "sum")
+        if hasattr(table, column)
+    ]
+    query = session.query(table.id, *value_columns).filter_by(
+        metadata_id=bindparam("metadata_id")
+    )
     rows = execute(query.params(metadata_id=metadata_id))
     for row in rows:
         session.query(table).filter(table.id == row.id).update(
-            {
-                table.mean: convert(row.mean),
-                table.min: convert(row.min),
-                table.max: convert(row.max),
-                table.state: convert(row.state),
-                table.sum: convert(row.sum),
-            },
+            {column: convert(getattr(row, column.key)) for column in value_columns},
             synchronize_session=False,
         )
 
@@ -2533,16 +3016,19 @@ def change_statistics_unit(
             )
             return
 
-        tables: tuple[type[StatisticsBase], ...] = (
+        tables: list[type[StatisticsBase | StatisticsRollupBase]] = [
             Statistics,
             StatisticsShortTerm,
-        )
+        ]
+        if instance.schema_version >= STATISTICS_ROLLUPS_SCHEMA_VERSION:
+            tables.extend(table for _, table in _ROLLUP_TABLES)
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
+        _notify_statistics_changed(instance, session, {statistic_id}, 0)
 
 
 @callback
@@ -8,6 +8,8 @@ from lru import LRU
 
 from homeassistant.util.event_type import EventType
 
+from ..const import LAST_REFERENCED_RESOLUTION, LAST_REFERENCED_SCHEMA_VERSION
+
 if TYPE_CHECKING:
     from ..core import Recorder
 
@@ -74,3 +76,77 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         lru = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+
+class BaseReferencedLRUTableManager[_DataT](BaseLRUTableManager[_DataT]):
+    """Base class for LRU table managers that track when rows were last referenced.
+
+    The last referenced timestamp of a row is written at most once per
+    LAST_REFERENCED_RESOLUTION so the purge can delete rows that are no
+    longer used with a range delete instead of searching for references.
+    """
+
+    def __init__(self, recorder: Recorder, lru_size: int) -> None:
+        """Initialize the referenced LRU table manager."""
+        super().__init__(recorder, lru_size)
+        self._pending_referenced: dict[int, float] = {}
+        self._last_referenced: LRU[int, float] = LRU(lru_size)
+
+    @property
+    def tracks_last_referenced(self) -> bool:
+        """Return if the database schema stores when rows were last referenced."""
+        return self.recorder.schema_version >= LAST_REFERENCED_SCHEMA_VERSION
+
+    def mark_referenced(self, row_id: int, timestamp: float) -> None:
+        """Mark a row as referenced at timestamp.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (
+            last_referenced := self._pending_referenced.get(row_id)
+            or self._last_referenced.get(row_id)
+        ) is not None and timestamp - last_referenced < LAST_REFERENCED_RESOLUTION:
+            return
+        self._pending_referenced[row_id] = timestamp
+
+    def get_pending_referenced(self) -> dict[int, float]:
+        """Return the last referenced timestamps to write at the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_referenced
+
+    def _post_commit_referenced(self) -> None:
+        """Remember the last referenced timestamps that were just committed."""
+        last_referenced = self._last_referenced
+        for row_id, timestamp in self._pending_referenced.items():
+            last_referenced[row_id] = timestamp
+        self._pending_referenced.clear()
+
+    def _evict_referenced(self, row_ids: set[int]) -> None:
+        """Forget the last referenced timestamps of purged rows."""
+        last_referenced = self._last_referenced
+        for row_id in row_ids:
+            last_referenced.pop(row_id, None)
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the LRU cache size.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().adjust_lru_size(new_size)
+        if new_size > self._last_referenced.get_size():
+            self._last_referenced.set_size(new_size)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._pending_referenced.clear()
+        self._last_referenced.clear()
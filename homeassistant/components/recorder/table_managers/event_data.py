@@ -15,7 +15,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 from ..db_schema import EventData
 from ..queries import get_shared_event_datas
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseReferencedLRUTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -26,7 +26,7 @@ CACHE_SIZE = 2048
 _LOGGER = logging.getLogger(__name__)
 
 
-class EventDataManager(BaseLRUTableManager[EventData]):
+class EventDataManager(BaseReferencedLRUTableManager[EventData]):
     """Manage the EventData table."""
 
     def __init__(self, recorder: Recorder) -> None:
@@ -121,9 +121,15 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        tracks_last_referenced = self.tracks_last_referenced
         for shared_data, db_event_data in self._pending.items():
             self._id_map[shared_data] = db_event_data.data_id
+            if tracks_last_referenced and (
+                last_referenced_ts := db_event_data.last_referenced_ts
+            ):
+                self._last_referenced[db_event_data.data_id] = last_referenced_ts
         self._pending.clear()
+        self._post_commit_referenced()
 
     def evict_purged(self, data_ids: set[int]) -> None:
         """Evict purged data_ids from the cache when they are no longer used.
@@ -138,3 +144,4 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         # Evict any purged data from the cache
         for purged_data_id in data_ids.intersection(event_data_ids_reversed):
             id_map.pop(event_data_ids_reversed[purged_data_id], None)
+        self._evict_referenced(data_ids)
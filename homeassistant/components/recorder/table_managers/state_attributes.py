@@ -15,7 +15,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 from ..db_schema import StateAttributes
 from ..queries import get_shared_attributes
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseReferencedLRUTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -31,7 +31,7 @@ CACHE_SIZE = 2048
 _LOGGER = logging.getLogger(__name__)
 
 
-class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
+class StateAttributesManager(BaseReferencedLRUTableManager[StateAttributes]):
     """Manage the StateAttributes table."""
 
     def __init__(self, recorder: Recorder) -> None:
@@ -132,9 +132,17 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        tracks_last_referenced = self.tracks_last_referenced
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
+            if tracks_last_referenced and (
+                last_referenced_ts := db_state_attributes.last_referenced_ts
+            ):
+                self._last_referenced[db_state_attributes.attributes_id] = (
+                    last_referenced_ts
+                )
         self._pending.clear()
+        self._post_commit_referenced()
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
@@ -152,3 +160,4 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             state_attributes_ids_reversed
         ):
             id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+        self._evict_referenced(attributes_ids)
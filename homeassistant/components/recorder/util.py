@@ -555,6 +555,14 @@ def setup_connection_for_dialect(
         # enable support for foreign keys
         execute_on_connection(dbapi_connection, "PRAGMA foreign_keys=ON")
 
+        # Pages freed by a purge are returned to the file system after each
+        # purge instead of by the monthly repack. The layout of an existing
+        # database file only changes when it is vacuumed, which is why this
+        # is set on each connection the repack may vacuum with.
+        # https://sqlite.org/pragma.html#pragma_auto_vacuum
+        if instance.sqlite_incremental_vacuum:
+            execute_on_connection(dbapi_connection, "PRAGMA auto_vacuum=INCREMENTAL")
+
     elif dialect_name == SupportedDialect.MYSQL:
         max_bind_vars = DEFAULT_MAX_BIND_VARS
         execute_on_connection(dbapi_connection, "SET session wait_timeout=28800")
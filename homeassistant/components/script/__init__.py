@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_trace_runs
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -59,7 +60,7 @@ from homeassistant.helpers.script import (
     script_stack_cv,
 )
 from homeassistant.helpers.service import async_set_service_schema
-from homeassistant.helpers.trace import trace_get, trace_path
+from homeassistant.helpers.trace import trace_disable, trace_get, trace_path
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import create_eager_task
@@ -697,8 +698,12 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
             context,
             self._trace_config,
         ) as script_trace:
-            # Prepare tracing the execution of the script's sequence
-            script_trace.set_trace(trace_get())
+            # Prepare tracing the execution of the script's sequence,
+            # unless this run is not traced
+            if script_trace.traced:
+                script_trace.set_trace(trace_get())
+            else:
+                trace_disable()
             with trace_path("sequence"):
                 this = None
                 if state := self.hass.states.get(self.entity_id):
@@ -757,6 +762,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
 
         # remove service
         self.hass.services.async_remove(DOMAIN, self._attr_unique_id)
+        async_remove_trace_runs(self.hass, f"{DOMAIN}.{self._attr_unique_id}")
 
 
 @websocket_api.websocket_command({"type": "script/config", "entity_id": str})
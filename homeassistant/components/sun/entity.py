@@ -19,6 +19,7 @@ from homeassistant.helpers import event
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.sun import (
+    get_astral_event_cache,
     get_astral_location,
     get_location_astral_event_next,
 )
@@ -186,7 +187,11 @@ class Sun(Entity):
         self, utc_point_in_time: datetime, sun_event: str, before: str | None
     ) -> datetime:
         next_utc = get_location_astral_event_next(
-            self.location, self.elevation, sun_event, utc_point_in_time
+            self.location,
+            self.elevation,
+            sun_event,
+            utc_point_in_time,
+            cache=get_astral_event_cache(self.hass),
         )
         if next_utc < self._next_change:
             self._next_change = next_utc
@@ -16,13 +16,20 @@ from homeassistant.helpers.typing import ConfigType
 
 from . import websocket_api
 from .const import (
+    CONF_FAILED_ONLY,
+    CONF_SAMPLE_EVERY,
     CONF_STORED_TRACES,
     DATA_TRACE,
     DATA_TRACE_STORE,
     DEFAULT_STORED_TRACES,
 )
 from .models import ActionTrace
-from .util import async_store_trace
+from .util import (
+    async_finish_trace,
+    async_remove_trace_runs,
+    async_start_trace,
+    async_store_trace,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,7 +39,13 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    # Trace one in every sample_every runs
+    vol.Optional(CONF_SAMPLE_EVERY, default=1): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+    # Only keep the traces of runs which failed
+    vol.Optional(CONF_FAILED_ONLY, default=False): cv.boolean,
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -41,6 +54,9 @@ __all__ = [
     "CONF_STORED_TRACES",
     "TRACE_CONFIG_SCHEMA",
     "ActionTrace",
+    "async_finish_trace",
+    "async_remove_trace_runs",
+    "async_start_trace",
     "async_store_trace",
 ]
 
@@ -9,11 +9,14 @@ from homeassistant.util.hass_dict import HassKey
 if TYPE_CHECKING:
     from homeassistant.helpers.storage import Store
 
-    from .models import TraceData
+    from .models import TraceData, TraceRuns
 
 
+CONF_FAILED_ONLY = "failed_only"
+CONF_SAMPLE_EVERY = "sample_every"
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE: HassKey[TraceData] = HassKey("trace")
+DATA_TRACE_RUNS: HassKey[dict[str, TraceRuns]] = HassKey("trace_runs")
 DATA_TRACE_STORE: HassKey[Store[dict[str, list]]] = HassKey("trace_store")
 DATA_TRACES_RESTORED: HassKey[bool] = HassKey("trace_traces_restored")
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import abc
 from collections import deque
+from dataclasses import dataclass
 import datetime as dt
 from typing import Any
 
 from homeassistant.core import Context
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -21,6 +23,17 @@ import homeassistant.util.uuid as uuid_util
 
 type TraceData = dict[str, LimitedSizeDict[str, BaseTrace]]
 
+# Script executions of runs which did not complete as intended
+FAILED_SCRIPT_EXECUTIONS = {"error", "aborted", "disallowed_recursion_detected"}
+
+
+@dataclass(slots=True)
+class TraceRuns:
+    """Count the runs of a script or automation and how many were traced."""
+
+    runs: int = 0
+    traced_runs: int = 0
+
 
 class BaseTrace(abc.ABC):
     """Base container for a script or automation trace."""
@@ -44,11 +57,21 @@ class BaseTrace(abc.ABC):
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this ActionTrace."""
 
+    def estimate_size(self) -> tuple[int, int]:
+        """Return the number of trace elements and an estimate of the size."""
+        trace = self.as_extended_dict()["trace"]
+        return (
+            sum(len(trace_list) for trace_list in trace.values()),
+            len(json_bytes(trace)),
+        )
+
 
 class ActionTrace(BaseTrace):
     """Base container for a script or automation trace."""
 
     _domain: str | None = None
+    # Set to False when the run is not traced, see async_start_trace
+    traced: bool = True
 
     def __init__(
         self,
@@ -89,6 +112,24 @@ class ActionTrace(BaseTrace):
         self._state = "stopped"
         self._script_execution = script_execution_get()
 
+    @property
+    def failed(self) -> bool:
+        """Return if the run failed."""
+        return (
+            self._error is not None
+            or self._script_execution in FAILED_SCRIPT_EXECUTIONS
+        )
+
+    def estimate_size(self) -> tuple[int, int]:
+        """Return the number of trace elements and an estimate of the size."""
+        elements = size = 0
+        if self._trace:
+            for trace_list in self._trace.values():
+                for element in trace_list:
+                    elements += 1
+                    size += element.estimate_size()
+        return elements, size
+
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
         if self._dict:
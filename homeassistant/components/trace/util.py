@@ -6,12 +6,21 @@ from collections.abc import Mapping
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
-from .const import DATA_TRACE, DATA_TRACE_STORE, DATA_TRACES_RESTORED
-from .models import ActionTrace, BaseTrace, RestoredTrace, TraceData
+from .const import (
+    CONF_FAILED_ONLY,
+    CONF_SAMPLE_EVERY,
+    CONF_STORED_TRACES,
+    DATA_TRACE,
+    DATA_TRACE_RUNS,
+    DATA_TRACE_STORE,
+    DATA_TRACES_RESTORED,
+)
+from .models import ActionTrace, BaseTrace, RestoredTrace, TraceData, TraceRuns
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,6 +100,69 @@ def async_store_trace(
         traces[key][trace.run_id] = trace
 
 
+@callback
+def async_start_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> bool:
+    """Decide if a run is traced and store its trace, return if it is traced.
+
+    One in every sample_every runs is traced. The trace is stored right away
+    unless only the traces of failed runs are kept, see async_finish_trace.
+    """
+    stored_traces = trace_config[CONF_STORED_TRACES]
+    runs = hass.data.setdefault(DATA_TRACE_RUNS, {}).setdefault(trace.key, TraceRuns())
+    trace.traced = (
+        stored_traces > 0 and runs.runs % trace_config.get(CONF_SAMPLE_EVERY, 1) == 0
+    )
+    runs.runs += 1
+    if not trace.traced:
+        return False
+
+    runs.traced_runs += 1
+    if not trace_config.get(CONF_FAILED_ONLY, False):
+        async_store_trace(hass, trace, stored_traces)
+    return True
+
+
+@callback
+def async_finish_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Store the trace of a failed run when only those are kept."""
+    if trace.traced and trace_config.get(CONF_FAILED_ONLY, False) and trace.failed:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
+@callback
+def async_remove_trace_runs(hass: HomeAssistant, key: str) -> None:
+    """Forget the number of runs of a removed script or automation."""
+    if trace_runs := hass.data.get(DATA_TRACE_RUNS):
+        trace_runs.pop(key, None)
+
+
+@callback
+def async_get_trace_stats(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return the number of runs and the size of the stored traces per key."""
+    trace_runs = hass.data.get(DATA_TRACE_RUNS, {})
+    stats: dict[str, dict[str, Any]] = {}
+    for key in trace_runs.keys() | hass.data[DATA_TRACE].keys():
+        elements = size = 0
+        traces = hass.data[DATA_TRACE].get(key) or {}
+        for trace in traces.values():
+            trace_elements, trace_size = trace.estimate_size()
+            elements += trace_elements
+            size += trace_size
+        runs = trace_runs.get(key) or TraceRuns()
+        stats[key] = {
+            "runs": runs.runs,
+            "traced_runs": runs.traced_runs,
+            "stored_traces": len(traces),
+            "trace_elements": elements,
+            "estimated_size": size,
+        }
+    return stats
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
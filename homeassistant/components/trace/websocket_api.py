@@ -26,7 +26,12 @@ from homeassistant.helpers.script import (
     debug_stop,
 )
 
-from .util import async_get_trace, async_list_contexts, async_list_traces
+from .util import (
+    async_get_trace,
+    async_get_trace_stats,
+    async_list_contexts,
+    async_list_traces,
+)
 
 TRACE_DOMAINS = ("automation", "script")
 
@@ -37,6 +42,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, websocket_trace_get)
     websocket_api.async_register_command(hass, websocket_trace_list)
     websocket_api.async_register_command(hass, websocket_trace_contexts)
+    websocket_api.async_register_command(hass, websocket_trace_stats)
     websocket_api.async_register_command(hass, websocket_breakpoint_clear)
     websocket_api.async_register_command(hass, websocket_breakpoint_list)
     websocket_api.async_register_command(hass, websocket_breakpoint_set)
@@ -103,6 +109,18 @@ async def websocket_trace_list(
     connection.send_result(msg["id"], traces)
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "trace/stats"})
+@callback
+def websocket_trace_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Report the runs and memory used by script and automation traces."""
+    connection.send_result(msg["id"], {"traces": async_get_trace_stats(hass)})
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
@@ -594,6 +594,7 @@ def _cached_template(template_str: str, hass: HomeAssistant) -> template.Templat
         vol.Optional("timeout"): vol.Coerce(float),
         vol.Optional("strict", default=False): bool,
         vol.Optional("report_errors", default=False): bool,
+        vol.Optional("render_in_executor", default=False): bool,
     }
 )
 @decorators.async_response
@@ -671,6 +672,8 @@ async def handle_render_template(
             _template_listener,
             strict=msg["strict"],
             log_fn=log_fn,
+            # Errors are reported from the event loop only
+            render_in_executor=msg["render_in_executor"] and not report_errors,
         )
     except TemplateError as ex:
         connection.send_error(msg["id"], const.ERR_TEMPLATE_ERROR, str(ex))
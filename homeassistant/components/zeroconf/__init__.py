@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from asyncio import TimerHandle
 import contextlib
 from contextlib import suppress
 from dataclasses import dataclass
@@ -78,6 +79,10 @@ MAX_PROPERTY_VALUE_LEN = 230
 # Dns label max length
 MAX_NAME_LEN = 63
 
+# Devices on busy networks announce changes in bursts, updates of the
+# same service within this many seconds are collapsed into one
+SERVICE_UPDATE_COALESCE_SECONDS = 2.0
+
 ATTR_DOMAIN: Final = "domain"
 ATTR_NAME: Final = "name"
 ATTR_PROPERTIES: Final = "properties"
@@ -364,6 +369,8 @@ class ZeroconfDiscovery:
         self.homekit_model_lookups = homekit_model_lookups
         self.homekit_model_matchers = homekit_model_matchers
         self.async_service_browser: AsyncServiceBrowser | None = None
+        self._coalesce_timers: dict[tuple[str, str], TimerHandle] = {}
+        self._coalesced_updates: set[tuple[str, str]] = set()
 
     async def async_setup(self) -> None:
         """Start discovery."""
@@ -389,6 +396,10 @@ class ZeroconfDiscovery:
 
     async def async_stop(self) -> None:
         """Cancel the service browser and stop processing the queue."""
+        for timer in self._coalesce_timers.values():
+            timer.cancel()
+        self._coalesce_timers.clear()
+        self._coalesced_updates.clear()
         if self.async_service_browser:
             await self.async_service_browser.async_cancel()
 
@@ -430,12 +441,56 @@ class ZeroconfDiscovery:
             state_change,
         )
 
+        key = (service_type, name)
         if state_change is ServiceStateChange.Removed:
+            if timer := self._coalesce_timers.pop(key, None):
+                timer.cancel()
+            self._coalesced_updates.discard(key)
             self._async_dismiss_discoveries(name)
             return
 
+        if key in self._coalesce_timers:
+            # Process the latest state once the window has passed
+            self._coalesced_updates.add(key)
+            return
+
+        self._async_coalesce_service_update(zeroconf, service_type, name)
+
+    @callback
+    def _async_coalesce_service_update(
+        self,
+        zeroconf: HaZeroconf,
+        service_type: str,
+        name: str,
+    ) -> None:
+        """Process a service update and collapse the updates that follow it."""
+        self._coalesce_timers[(service_type, name)] = self.hass.loop.call_later(
+            SERVICE_UPDATE_COALESCE_SECONDS,
+            self._async_coalesce_window_passed,
+            zeroconf,
+            service_type,
+            name,
+        )
         self._async_service_update(zeroconf, service_type, name)
 
+    @callback
+    def _async_coalesce_window_passed(
+        self,
+        zeroconf: HaZeroconf,
+        service_type: str,
+        name: str,
+    ) -> None:
+        """Process updates that arrived while updates were collapsed.
+
+        Processing them starts a new window, so a burst that goes on past
+        the end of the window is still collapsed.
+        """
+        key = (service_type, name)
+        del self._coalesce_timers[key]
+        if key in self._coalesced_updates:
+            self._coalesced_updates.remove(key)
+            self._async_coalesce_service_update(zeroconf, service_type, name)
+
     @callback
     def _async_service_update(
         self,
@@ -96,6 +96,7 @@ from .helpers.deprecation import (
     dir_with_deprecated_constants,
 )
 from .helpers.json import json_bytes, json_fragment
+from .helpers.schema_compiler import compile_schema
 from .helpers.typing import UNDEFINED, UndefinedType, VolSchemaType
 from .util import dt as dt_util, location
 from .util.async_ import (
@@ -1771,9 +1772,6 @@ class State:
         "entity_id",
         "state",
         "attributes",
-        "last_changed",
-        "last_reported",
-        "last_updated",
         "context",
         "state_info",
         "domain",
@@ -1794,8 +1792,14 @@ class State:
         validate_entity_id: bool | None = True,
         state_info: StateInfo | None = None,
         last_updated_timestamp: float | None = None,
+        last_changed_timestamp: float | None = None,
     ) -> None:
-        """Initialize a new state."""
+        """Initialize a new state.
+
+        When only timestamps are passed, the last_changed, last_reported
+        and last_updated datetime objects are created when they are first
+        accessed since most states are replaced before anything needs them.
+        """
         self._cache: dict[str, Any] = {}
         state = str(state)
 
@@ -1816,26 +1820,89 @@ class State:
             self.attributes = ReadOnlyDict(attributes or {})
         else:
             self.attributes = attributes
-        self.last_reported = last_reported or dt_util.utcnow()
-        self.last_updated = last_updated or self.last_reported
-        self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.state_info = state_info
         self.domain, self.object_id = split_entity_id(self.entity_id)
+        cache = self._cache
+        if last_updated_timestamp and last_updated is None and last_reported is None:
+            # This is the path used by the state machine
+            self.last_updated_timestamp = last_updated_timestamp
+            cache["last_reported_timestamp"] = last_updated_timestamp
+            if last_changed is not None:
+                cache["last_changed"] = last_changed
+            else:
+                cache["last_changed_timestamp"] = (
+                    last_changed_timestamp or last_updated_timestamp
+                )
+            return
+
+        last_reported = last_reported or dt_util.utcnow()
+        last_updated = last_updated or last_reported
+        last_changed = last_changed or last_updated
+        cache["last_reported"] = last_reported
+        cache["last_updated"] = last_updated
+        cache["last_changed"] = last_changed
         # The recorder or the websocket_api will always call the timestamps,
         # so we will set the timestamp values here to avoid the overhead of
         # the function call in the property we know will always be called.
-        last_updated = self.last_updated
         if not last_updated_timestamp:
             last_updated_timestamp = last_updated.timestamp()
         self.last_updated_timestamp = last_updated_timestamp
-        if self.last_changed == last_updated:
-            self._cache["last_changed_timestamp"] = last_updated_timestamp
-        # If last_reported is the same as last_updated async_set will pass
+        if last_changed == last_updated:
+            cache["last_changed_timestamp"] = last_updated_timestamp
+        # If last_reported is the same as last_updated the caller may pass
         # the same datetime object for both values so we can use an identity
         # check here.
-        if self.last_reported is last_updated:
-            self._cache["last_reported_timestamp"] = last_updated_timestamp
+        if last_reported is last_updated:
+            cache["last_reported_timestamp"] = last_updated_timestamp
+
+    @property
+    def last_changed(self) -> datetime.datetime:
+        """Last time the state was changed."""
+        cache = self._cache
+        if (last_changed := cache.get("last_changed")) is None:
+            last_changed = cache["last_changed"] = dt_util.utc_from_timestamp(
+                cache["last_changed_timestamp"]
+            )
+        return last_changed
+
+    @last_changed.setter
+    def last_changed(self, value: datetime.datetime) -> None:
+        """Set the last time the state was changed."""
+        self._cache["last_changed"] = value
+        self._cache.pop("last_changed_timestamp", None)
+
+    @property
+    def last_reported(self) -> datetime.datetime:
+        """Last time the state was reported."""
+        cache = self._cache
+        if (last_reported := cache.get("last_reported")) is None:
+            last_reported = cache["last_reported"] = dt_util.utc_from_timestamp(
+                cache["last_reported_timestamp"]
+            )
+        return last_reported
+
+    @last_reported.setter
+    def last_reported(self, value: datetime.datetime) -> None:
+        """Set the last time the state was reported."""
+        self._cache["last_reported"] = value
+        self._cache.pop("last_reported_timestamp", None)
+
+    @property
+    def last_updated(self) -> datetime.datetime:
+        """Last time the state or attributes were changed."""
+        cache = self._cache
+        if (last_updated := cache.get("last_updated")) is None:
+            last_updated = cache["last_updated"] = dt_util.utc_from_timestamp(
+                self.last_updated_timestamp
+            )
+        return last_updated
+
+    @last_updated.setter
+    def last_updated(self, value: datetime.datetime) -> None:
+        """Set the last time the state or attributes were changed."""
+        self._cache["last_updated"] = value
+        self.last_updated_timestamp = value.timestamp()
 
     @under_cached_property
     def name(self) -> str:
@@ -1942,7 +2009,7 @@ class State:
             COMPRESSED_STATE_CONTEXT: context,
             COMPRESSED_STATE_LAST_CHANGED: self.last_changed_timestamp,
         }
-        if self.last_changed != self.last_updated:
+        if self.last_changed_timestamp != self.last_updated_timestamp:
             compressed_state[COMPRESSED_STATE_LAST_UPDATED] = (
                 self.last_updated_timestamp
             )
@@ -2315,15 +2382,24 @@ class StateMachine:
             same_state = False
             same_attr = False
             last_changed = None
+            last_changed_timestamp = None
         else:
             same_state = old_state.state == new_state and not force_update
             same_attr = old_state.attributes == attributes
-            last_changed = old_state.last_changed if same_state else None
-
-        # It is much faster to convert a timestamp to a utc datetime object
-        # than converting a utc datetime object to a timestamp since cpython
-        # does not have a fast path for handling the UTC timezone and has to do
-        # multiple local timezone conversions.
+            last_changed = None
+            last_changed_timestamp = None
+            if same_state:
+                # Carry over the datetime object if the old state already
+                # created one, otherwise only pass on the timestamp
+                if (last_changed := old_state._cache.get("last_changed")) is None:  # noqa: SLF001
+                    last_changed_timestamp = old_state.last_changed_timestamp
+
+        # The state only stores the timestamps and creates the datetime
+        # objects when they are accessed. It is much faster to convert a
+        # timestamp to a utc datetime object than converting a utc datetime
+        # object to a timestamp since cpython does not have a fast path for
+        # handling the UTC timezone and has to do multiple local timezone
+        # conversions.
         #
         # from_timestamp implementation:
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
@@ -2331,7 +2407,6 @@ class StateMachine:
         # timestamp implementation:
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
 
         if context is None:
             context = Context(id=ulid_at_time(timestamp))
@@ -2339,8 +2414,9 @@ class StateMachine:
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
-            old_state.last_reported = now  # type: ignore[union-attr]
-            old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
+            old_state_cache = old_state._cache  # type: ignore[union-attr] # noqa: SLF001
+            del old_state_cache["last_reported"]
+            old_state_cache["last_reported_timestamp"] = timestamp
             # Avoid creating an EventStateReportedData
             self._bus.async_fire_internal(  # type: ignore[misc]
                 EVENT_STATE_REPORTED,
@@ -2366,12 +2442,13 @@ class StateMachine:
             new_state,
             attributes,
             last_changed,
-            now,
-            now,
+            None,
+            None,
             context,
             old_state is None,
             state_info,
             timestamp,
+            last_changed_timestamp,
         )
         if old_state is not None:
             old_state.expire()
@@ -2405,7 +2482,14 @@ class SupportsResponse(enum.StrEnum):
 class Service:
     """Representation of a callable service."""
 
-    __slots__ = ["job", "schema", "domain", "service", "supports_response"]
+    __slots__ = [
+        "job",
+        "schema",
+        "domain",
+        "service",
+        "supports_response",
+        "_compiled_schema",
+    ]
 
     def __init__(
         self,
@@ -2427,6 +2511,21 @@ class Service:
         self.job = HassJob(func, f"service {domain}.{service}", job_type=job_type)
         self.schema = schema
         self.supports_response = supports_response
+        self._compiled_schema: (
+            tuple[VolSchemaType, Callable[[dict[str, Any]], dict[str, Any]]] | None
+        ) = None
+
+    def validate(self, service_data: dict[str, Any]) -> dict[str, Any]:
+        """Validate service data against the schema.
+
+        The schema is compiled into a fast validator on first use.
+        """
+        schema = self.schema
+        if (compiled := self._compiled_schema) is None or compiled[0] is not schema:
+            if TYPE_CHECKING:
+                assert schema is not None
+            compiled = self._compiled_schema = (schema, compile_schema(schema))
+        return compiled[1](service_data)
 
 
 class ServiceCall:
@@ -2755,7 +2854,7 @@ class ServiceRegistry:
 
         if handler.schema:
             try:
-                processed_data: dict[str, Any] = handler.schema(service_data)
+                processed_data: dict[str, Any] = handler.validate(service_data)
             except vol.Invalid:
                 _LOGGER.debug(
                     "Invalid data for service call %s.%s: %s",
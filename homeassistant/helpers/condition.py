@@ -6,12 +6,15 @@ import asyncio
 from collections import deque
 from collections.abc import Callable, Container, Generator
 from contextlib import contextmanager
+import dataclasses
 from datetime import datetime, time as dt_time, timedelta
 import functools as ft
 import logging
+from operator import itemgetter
 import re
 import sys
 from typing import Any, Protocol, cast
+import weakref
 
 import voluptuous as vol
 
@@ -65,6 +68,7 @@ from .template import Template, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_collected,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -92,6 +96,12 @@ _PLATFORM_ALIASES = {
     "zone": None,
 }
 
+# Estimated cost of evaluating a condition. When no trace is collected,
+# AND and OR conditions evaluate their cheapest conditions first.
+COST_CHEAP = 1
+COST_MEDIUM = 2
+COST_EXPENSIVE = 10
+
 INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
@@ -119,6 +129,22 @@ class ConditionProtocol(Protocol):
 type ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool | None]
 
 
+@dataclasses.dataclass(slots=True, frozen=True)
+class _CompiledCondition:
+    """A condition prepared for evaluation without tracing."""
+
+    check: ConditionCheckerType
+    # None when the cost is unknown, such conditions are never reordered
+    cost: int | None
+    operator: str | None = None
+    leaves: tuple[tuple[ConditionCheckerType, int | None], ...] = ()
+
+
+_COMPILED_CONDITIONS: weakref.WeakKeyDictionary[
+    ConditionCheckerType, _CompiledCondition
+] = weakref.WeakKeyDictionary()
+
+
 def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceElement:
     """Append a TraceElement to trace[path]."""
     trace_element = TraceElement(variables, path)
@@ -151,8 +177,13 @@ def condition_trace_update_result(**kwargs: Any) -> None:
 
 
 @contextmanager
-def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement]:
+def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement | None]:
     """Trace condition evaluation."""
+    if not trace_collected():
+        # No trace is collected
+        yield None
+        return
+
     should_pop = True
     trace_element = trace_stack_top(trace_stack_cv)
     if trace_element and trace_element.reuse_by_child:
@@ -171,17 +202,113 @@ def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement]:
             trace_stack_pop(trace_stack_cv)
 
 
-def trace_condition_function(condition: ConditionCheckerType) -> ConditionCheckerType:
-    """Wrap a condition function to enable basic tracing."""
+def trace_condition_function(
+    condition: ConditionCheckerType,
+    untraced: ConditionCheckerType | None = None,
+    cost: int | None = None,
+) -> ConditionCheckerType:
+    """Wrap a condition function to enable basic tracing.
+
+    When no trace is collected, the untraced function is called instead,
+    or the condition itself if there is none. Conditions with a known cost
+    may be reordered by AND and OR conditions.
+    """
+    fast_condition = untraced or condition
 
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if not trace_collected():
+            return fast_condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
             return result
 
+    if untraced is not None or cost is not None:
+        _COMPILED_CONDITIONS[wrapper] = _CompiledCondition(fast_condition, cost)
+    return wrapper
+
+
+def _flatten_conditions(
+    operator: str, checks: list[ConditionCheckerType]
+) -> list[tuple[ConditionCheckerType, int | None]]:
+    """Return the untraced conditions and their cost.
+
+    Nested conditions with the same operator are merged into the list.
+    """
+    leaves: list[tuple[ConditionCheckerType, int | None]] = []
+    for check in checks:
+        if (compiled := _COMPILED_CONDITIONS.get(check)) is None:
+            leaves.append((check, None))
+        elif compiled.operator == operator:
+            leaves.extend(compiled.leaves)
+        else:
+            leaves.append((compiled.check, compiled.cost))
+    return leaves
+
+
+def _order_by_cost(
+    leaves: list[tuple[ConditionCheckerType, int | None]],
+) -> list[ConditionCheckerType]:
+    """Order conditions cheapest first.
+
+    Built-in conditions only raise ConditionError and have no side effects,
+    so the result of AND and OR does not depend on their order. Conditions
+    with an unknown cost, like device conditions, are kept in place and
+    no condition is moved across them.
+    """
+    ordered: list[ConditionCheckerType] = []
+    segment: list[tuple[ConditionCheckerType, int]] = []
+    for check, cost in leaves:
+        if cost is None:
+            ordered.extend(check for check, _ in sorted(segment, key=itemgetter(1)))
+            segment.clear()
+            ordered.append(check)
+        else:
+            segment.append((check, cost))
+    ordered.extend(check for check, _ in sorted(segment, key=itemgetter(1)))
+    return ordered
+
+
+def _total_cost(leaves: list[tuple[ConditionCheckerType, int | None]]) -> int | None:
+    """Return the cost of evaluating all conditions."""
+    total = 0
+    for _, cost in leaves:
+        if cost is None:
+            return None
+        total += cost
+    return total
+
+
+def _compile_and_or(
+    operator: str,
+    condition: ConditionCheckerType,
+    checks: list[ConditionCheckerType],
+) -> ConditionCheckerType:
+    """Wrap an AND or OR condition with tracing and a cost ordered fast path."""
+    leaves = _flatten_conditions(operator, checks)
+    ordered = _order_by_cost(leaves)
+    # The result which stops the evaluation
+    stop_result = operator == "or"
+
+    def untraced_condition(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test the conditions cheapest first."""
+        try:
+            for check in ordered:
+                if check(hass, variables) is stop_result:
+                    return stop_result
+        except ConditionError:
+            # Evaluate in the configured order to raise the same errors
+            return cast(bool, condition(hass, variables))
+        return not stop_result
+
+    wrapper = trace_condition_function(condition, untraced_condition)
+    _COMPILED_CONDITIONS[wrapper] = _CompiledCondition(
+        untraced_condition, _total_cost(leaves), operator, tuple(leaves)
+    )
     return wrapper
 
 
@@ -239,14 +366,13 @@ async def async_from_config(
                 ) from err
         if not enabled:
 
-            @trace_condition_function
             def disabled_condition(
                 hass: HomeAssistant, variables: TemplateVarsType = None
             ) -> bool | None:
                 """Condition not enabled, will act as if it didn't exist."""
                 return None
 
-            return disabled_condition
+            return trace_condition_function(disabled_condition, cost=0)
 
     # Check for partials to properly determine if coroutine function
     check_factory = factory
@@ -264,7 +390,6 @@ async def async_and_from_config(
     """Create multi condition matcher using 'AND'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
 
-    @trace_condition_function
     def if_and_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -286,7 +411,7 @@ async def async_and_from_config(
 
         return True
 
-    return if_and_condition
+    return _compile_and_or("and", if_and_condition, checks)
 
 
 async def async_or_from_config(
@@ -295,7 +420,6 @@ async def async_or_from_config(
     """Create multi condition matcher using 'OR'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
 
-    @trace_condition_function
     def if_or_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -317,7 +441,7 @@ async def async_or_from_config(
 
         return False
 
-    return if_or_condition
+    return _compile_and_or("or", if_or_condition, checks)
 
 
 async def async_not_from_config(
@@ -325,8 +449,10 @@ async def async_not_from_config(
 ) -> ConditionCheckerType:
     """Create multi condition matcher using 'NOT'."""
     checks = [await async_from_config(hass, entry) for entry in config["conditions"]]
+    # NOT is false if any condition is true, like OR is true
+    leaves = _flatten_conditions("or", checks)
+    ordered = _order_by_cost(leaves)
 
-    @trace_condition_function
     def if_not_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -348,7 +474,22 @@ async def async_not_from_config(
 
         return True
 
-    return if_not_condition
+    def if_not_untraced(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test not condition cheapest first."""
+        try:
+            for check in ordered:
+                if check(hass, variables):
+                    return False
+        except ConditionError:
+            # Evaluate in the configured order to raise the same errors
+            return if_not_condition(hass, variables)
+        return True
+
+    return trace_condition_function(
+        if_not_condition, if_not_untraced, _total_cost(leaves)
+    )
 
 
 def numeric_state(
@@ -506,7 +647,6 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
 
-    @trace_condition_function
     def if_numeric_state(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
@@ -538,7 +678,26 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return True
 
-    return if_numeric_state
+    def if_numeric_state_untraced(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test numeric state condition without tracing."""
+        try:
+            for entity_id in entity_ids:
+                if not async_numeric_state(
+                    hass, entity_id, below, above, value_template, variables, attribute
+                ):
+                    return False
+        except ConditionError:
+            # Evaluate again to collect the errors of all entities
+            return if_numeric_state(hass, variables)
+        return True
+
+    return trace_condition_function(
+        if_numeric_state,
+        if_numeric_state_untraced,
+        COST_MEDIUM if value_template is None else COST_EXPENSIVE,
+    )
 
 
 def state(
@@ -625,7 +784,6 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
     if not isinstance(req_states, list):
         req_states = [req_states]
 
-    @trace_condition_function
     def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Test if condition."""
         errors = []
@@ -652,7 +810,23 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return result
 
-    return if_state
+    def if_state_untraced(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test if condition without tracing."""
+        result: bool = match != ENTITY_MATCH_ANY
+        try:
+            for entity_id in entity_ids:
+                if state(hass, entity_id, req_states, for_period, attribute, variables):
+                    result = True
+                elif match == ENTITY_MATCH_ALL:
+                    return False
+        except ConditionError:
+            # Evaluate again to collect the errors of all entities
+            return if_state(hass, variables)
+        return result
+
+    return trace_condition_function(if_state, if_state_untraced, COST_CHEAP)
 
 
 def sun(
@@ -746,12 +920,11 @@ def sun_from_config(config: ConfigType) -> ConditionCheckerType:
     before_offset = config.get("before_offset")
     after_offset = config.get("after_offset")
 
-    @trace_condition_function
     def sun_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate time based if-condition."""
         return sun(hass, before, after, before_offset, after_offset)
 
-    return sun_if
+    return trace_condition_function(sun_if, cost=COST_EXPENSIVE)
 
 
 def template(
@@ -786,12 +959,11 @@ def async_template_from_config(config: ConfigType) -> ConditionCheckerType:
     """Wrap action method with state based condition."""
     value_template = cast(Template, config.get(CONF_VALUE_TEMPLATE))
 
-    @trace_condition_function
     def template_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate template based if-condition."""
         return async_template(hass, value_template, variables)
 
-    return template_if
+    return trace_condition_function(template_if, cost=COST_EXPENSIVE)
 
 
 def time(
@@ -887,12 +1059,11 @@ def time_from_config(config: ConfigType) -> ConditionCheckerType:
     after = config.get(CONF_AFTER)
     weekday = config.get(CONF_WEEKDAY)
 
-    @trace_condition_function
     def time_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate time based if-condition."""
         return time(hass, before, after, weekday)
 
-    return time_if
+    return trace_condition_function(time_if, cost=COST_CHEAP)
 
 
 def zone(
@@ -953,7 +1124,6 @@ def zone_from_config(config: ConfigType) -> ConditionCheckerType:
     entity_ids = config.get(CONF_ENTITY_ID, [])
     zone_entity_ids = config.get(CONF_ZONE, [])
 
-    @trace_condition_function
     def if_in_zone(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Test if condition."""
         errors = []
@@ -985,7 +1155,7 @@ def zone_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return all_ok
 
-    return if_in_zone
+    return trace_condition_function(if_in_zone, cost=COST_MEDIUM)
 
 
 async def async_trigger_from_config(
@@ -994,7 +1164,6 @@ async def async_trigger_from_config(
     """Test a trigger condition."""
     trigger_id = config[CONF_ID]
 
-    @trace_condition_function
     def trigger_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate trigger based if-condition."""
         return (
@@ -1003,7 +1172,7 @@ async def async_trigger_from_config(
             and variables["trigger"].get("id") in trigger_id
         )
 
-    return trigger_if
+    return trace_condition_function(trigger_if, cost=COST_CHEAP)
 
 
 def numeric_state_validate_config(
@@ -1076,9 +1245,20 @@ async def async_conditions_from_config(
         await async_from_config(hass, condition_config)
         for condition_config in condition_configs
     ]
+    ordered = _order_by_cost(_flatten_conditions("and", checks))
 
     def check_conditions(variables: TemplateVarsType = None) -> bool:
         """AND all conditions."""
+        if not trace_collected():
+            try:
+                for check in ordered:
+                    if check(hass, variables) is False:
+                        return False
+            except ConditionError:
+                pass  # Evaluate again in the configured order to log the errors
+            else:
+                return True
+
         errors: list[ConditionErrorIndex] = []
         for index, check in enumerate(checks):
             try:
@@ -161,6 +161,10 @@ class EntityPlatform:
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
 
+        # Limits entity service calls, shared with the other
+        # platforms of the integration
+        self.service_call_limiter = self._get_service_call_limiter()
+
         # Storage for entities indexed by domain
         # with the child dict indexed by entity_id
         #
@@ -223,6 +227,33 @@ class EntityPlatform:
 
         return self.parallel_updates
 
+    @callback
+    def _get_service_call_limiter(self) -> service.ServiceCallLimiter | None:
+        """Get or create the service call limiter of the integration.
+
+        - PARALLEL_SERVICE_CALLS limits how many service calls of the
+          integration's entities run at the same time.
+        - SERVICE_CALLS_PER_SECOND limits how often such a call may start.
+
+        Platforms of the same integration setting either constant share a
+        single limiter, which uses the values of the first platform.
+        """
+        max_concurrent: int | None = (
+            getattr(self.platform, "PARALLEL_SERVICE_CALLS", None) or None
+        )
+        calls_per_second: float | None = (
+            getattr(self.platform, "SERVICE_CALLS_PER_SECOND", None) or None
+        )
+        if max_concurrent is None and calls_per_second is None:
+            return None
+
+        limiters = self.hass.data.setdefault(service.DATA_SERVICE_CALL_LIMITERS, {})
+        if (limiter := limiters.get(self.platform_name)) is None:
+            limiter = limiters[self.platform_name] = service.ServiceCallLimiter(
+                self.hass, max_concurrent, calls_per_second
+            )
+        return limiter
+
     async def async_setup(
         self,
         platform_config: ConfigType,
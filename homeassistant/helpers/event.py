@@ -971,6 +971,7 @@ class TrackTemplateResultInfo:
         track_templates: Sequence[TrackTemplate],
         action: TrackTemplateResultListener,
         has_super_template: bool = False,
+        render_in_executor: bool = False,
     ) -> None:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
@@ -978,6 +979,11 @@ class TrackTemplateResultInfo:
 
         self._track_templates = track_templates
         self._has_super_template = has_super_template
+        # Templates flagged with render_in_executor are re-rendered in the
+        # executor, the values tell if another render was requested meanwhile
+        self._render_in_executor = render_in_executor
+        self._executor_renders: dict[Template, bool] = {}
+        self._removed = False
 
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
@@ -1111,6 +1117,7 @@ class TrackTemplateResultInfo:
     def async_remove(self) -> None:
         """Cancel the listener."""
         assert self._track_state_changes
+        self._removed = True
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
@@ -1165,10 +1172,31 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
+        if (
+            self._render_in_executor
+            and template.render_in_executor
+            and not (
+                self._has_super_template and track_template_ is self._track_templates[0]
+            )
+        ):
+            # The result is applied when the render in the executor is done,
+            # the super template stays on the event loop as it gates the others
+            self._async_render_in_executor(track_template_)
+            return False
+
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
+        return self._render_info_to_update(template, info)
 
+    def _render_info_to_update(
+        self, template: Template, info: RenderInfo
+    ) -> bool | TrackTemplateResult:
+        """Return the update for a new render of a template.
+
+        Returns True if the result did not change, otherwise
+        a TrackTemplateResult.
+        """
         try:
             result: str | TemplateError = info.result()
         except TemplateError as ex:
@@ -1185,6 +1213,77 @@ class TrackTemplateResultInfo:
 
         return TrackTemplateResult(template, last_result, result)
 
+    @callback
+    def _async_render_in_executor(self, track_template_: TrackTemplate) -> None:
+        """Render a template in the executor unless it is already rendering."""
+        template = track_template_.template
+        if template in self._executor_renders:
+            # Render again when done, the running render may miss changes
+            self._executor_renders[template] = True
+            return
+        self._executor_renders[template] = False
+        self.hass.async_create_background_task(
+            self._async_executor_render(track_template_),
+            f"render template {template.template} in executor",
+            eager_start=True,
+        )
+
+    async def _async_executor_render(self, track_template_: TrackTemplate) -> None:
+        """Render a template in the executor and apply the result."""
+        template = track_template_.template
+        try:
+            info = await template.async_render_to_info_in_executor(
+                track_template_.variables
+            )
+        finally:
+            render_again = self._executor_renders.pop(template)
+        if self._removed:
+            return
+        self._apply_executor_result(template, info)
+        if render_again:
+            self._async_render_in_executor(track_template_)
+
+    @callback
+    def _apply_executor_result(self, template: Template, info: RenderInfo) -> None:
+        """Apply the result of a render in the executor.
+
+        The result is dropped when the super template stopped rendering
+        as True while the template was rendering.
+        """
+        if self._has_super_template and (
+            (super_result := self._last_result.get(self._track_templates[0].template))
+            is not None
+            and self._super_template_as_boolean(super_result) is not True
+        ):
+            return
+
+        self._info[template] = info
+        updates: list[TrackTemplateResult] = []
+        if self._apply_update(
+            updates, self._render_info_to_update(template, info), template
+        ):
+            self._async_update_track_state_listeners()
+        if not updates:
+            return
+        for track_result in updates:
+            self._last_result[track_result.template] = track_result.result
+        self.hass.async_run_hass_job(self._job, None, updates)
+
+    @callback
+    def _async_update_track_state_listeners(self) -> None:
+        """Update the state listeners to what the templates rendered."""
+        assert self._track_state_changes
+        self._track_state_changes.async_update_listeners(
+            _render_infos_to_track_states(
+                [
+                    _suppress_domain_all_in_render_info(info)
+                    if self._rate_limit.async_has_timer(template)
+                    else info
+                    for template, info in self._info.items()
+                ]
+            )
+        )
+
     @staticmethod
     def _super_template_as_boolean(result: bool | str | TemplateError) -> bool:
         """Return True if the result is truthy or a TemplateError."""
@@ -1278,17 +1377,7 @@ class TrackTemplateResultInfo:
                 )
 
         if info_changed:
-            assert self._track_state_changes
-            self._track_state_changes.async_update_listeners(
-                _render_infos_to_track_states(
-                    [
-                        _suppress_domain_all_in_render_info(info)
-                        if self._rate_limit.async_has_timer(template)
-                        else info
-                        for template, info in self._info.items()
-                    ]
-                )
-            )
+            self._async_update_track_state_listeners()
             _LOGGER.debug(
                 (
                     "Template group %s listens for %s, re-render blocked by super"
@@ -1336,6 +1425,7 @@ def async_track_template_result(
     strict: bool = False,
     log_fn: Callable[[int, str], None] | None = None,
     has_super_template: bool = False,
+    render_in_executor: bool = False,
 ) -> TrackTemplateResultInfo:
     """Add a listener that fires when the result of a template changes.
 
@@ -1367,13 +1457,19 @@ def async_track_template_result(
     has_super_template
         When set to True, the first template will block rendering of other
         templates if it doesn't render as True.
+    render_in_executor
+        When set to True, templates which are slow to render are re-rendered
+        in the executor against a snapshot of the states. log_fn must be safe
+        to call from other threads.
 
     Returns
     -------
     Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = TrackTemplateResultInfo(hass, track_templates, action, has_super_template)
+    tracker = TrackTemplateResultInfo(
+        hass, track_templates, action, has_super_template, render_in_executor
+    )
     tracker.async_setup(strict=strict, log_fn=log_fn)
     return tracker
 
@@ -1783,14 +1879,50 @@ time_tracker_utcnow = dt_util.utcnow
 time_tracker_timestamp = time.time
 
 
-@dataclass(slots=True)
+type _TimePatternKey = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], bool]
+
+_TIME_PATTERN_SCHEDULES: HassKey[dict[_TimePatternKey, _TimePatternSchedule]] = HassKey(
+    "track_time_pattern_schedules"
+)
+
+
+def _callback_integration(action: Callable[..., Any]) -> str:
+    """Return the integration a callback was defined in."""
+    while isinstance(action, partial):
+        action = action.func
+    module: str = getattr(action, "__module__", None) or ""
+    parts = module.split(".")
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    if parts[:2] == ["homeassistant", "components"] and len(parts) > 2:
+        return parts[2]
+    return "homeassistant"
+
+
+@dataclass(slots=True, eq=False)
 class _TrackUTCTimeChange:
+    """A listener of a time pattern schedule."""
+
+    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    integration: str
+
+
+@dataclass(slots=True)
+class _TimePatternSchedule:
+    """Run all listeners of the same time pattern from a single timer.
+
+    Many listeners use the same pattern, like every 5 minutes. Instead of
+    scheduling a timer for each of them, listeners of the same pattern
+    share one timer and are run together when it fires.
+    """
+
     hass: HomeAssistant
+    key: _TimePatternKey
     time_match_expression: tuple[list[int], list[int], list[int]]
     microsecond: int
     local: bool
-    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     listener_job_name: str
+    listeners: dict[_TrackUTCTimeChange, None]
     _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
     _cancel_callback: CALLBACK_TYPE | None = None
 
@@ -1829,14 +1961,42 @@ class _TrackUTCTimeChange:
             self._pattern_time_change_listener_job,
             self._calculate_next(utc_now + timedelta(seconds=1)),
         )
-        hass.async_run_hass_job(self.job, localized_now, background=True)
+        listeners = self.listeners
+        for listener in list(listeners):
+            # A listener may have been removed by one that ran before it
+            if listener in listeners:
+                hass.async_run_hass_job(listener.job, localized_now, background=True)
 
     @callback
-    def async_cancel(self) -> None:
-        """Cancel the call_at."""
+    def async_add_listener(self, listener: _TrackUTCTimeChange) -> CALLBACK_TYPE:
+        """Add a listener to the schedule."""
+        self.listeners[listener] = None
+        return partial(self._async_remove_listener, listener)
+
+    @callback
+    def _async_remove_listener(self, listener: _TrackUTCTimeChange) -> None:
+        """Remove a listener and cancel the timer when it was the last one."""
+        if listener not in self.listeners:
+            # Already removed, unsubscribing twice is allowed
+            return
+        del self.listeners[listener]
+        if self.listeners:
+            return
         if TYPE_CHECKING:
             assert self._cancel_callback is not None
         self._cancel_callback()
+        del self.hass.data[_TIME_PATTERN_SCHEDULES][self.key]
+
+
+@callback
+def async_get_time_change_stats(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the number of time pattern timers and listeners per integration."""
+    schedules = hass.data.get(_TIME_PATTERN_SCHEDULES, {})
+    listeners: defaultdict[str, int] = defaultdict(int)
+    for schedule in schedules.values():
+        for listener in schedule.listeners:
+            listeners[listener.integration] += 1
+    return {"timers": len(schedules), "listeners": dict(listeners)}
 
 
 @callback
@@ -1867,21 +2027,32 @@ def async_track_utc_time_change(
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
-    track = _TrackUTCTimeChange(
-        hass,
-        (matching_seconds, matching_minutes, matching_hours),
-        microsecond,
+    key = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
         local,
-        job,
-        listener_job_name,
     )
-    track.async_attach()
-    return track.async_cancel
+    schedules = hass.data.setdefault(_TIME_PATTERN_SCHEDULES, {})
+    if (schedule := schedules.get(key)) is None:
+        # Avoid aligning all time trackers to the same fraction of a second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+        listener_job_name = f"time change listener {hour}:{minute}:{second}"
+        schedule = schedules[key] = _TimePatternSchedule(
+            hass,
+            key,
+            (matching_seconds, matching_minutes, matching_hours),
+            microsecond,
+            local,
+            listener_job_name,
+            {},
+        )
+        schedule.async_attach()
+    return schedule.async_add_listener(
+        _TrackUTCTimeChange(job, _callback_integration(action))
+    )
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -29,9 +29,17 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
 
-# How long between periodically saving the current states to disk
+# States that changed since the last full dump are written here
+# so the periodic dumps do not have to write every entity
+DELTA_STORAGE_KEY = "core.restore_state.delta"
+
+# How long between periodically saving the changed states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# Write a full dump instead of a delta once this share of the
+# stored states have changed since the last full dump
+FULL_DUMP_RATIO = 0.5
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -60,23 +68,60 @@ class RestoredExtraData(ExtraStoredData):
 
 
 class StoredState:
-    """Object to represent a stored state."""
+    """Object to represent a stored state.
+
+    States loaded from storage are only decoded into a State
+    object when they are accessed.
+    """
 
     def __init__(
         self,
-        state: State,
+        state: State | dict[str, Any],
         extra_data: ExtraStoredData | None,
         last_seen: datetime,
     ) -> None:
-        """Initialize a new stored state."""
+        """Initialize a new stored state.
+
+        state is either a State or the dict of a state loaded from storage.
+        """
         self.extra_data = extra_data
         self.last_seen = last_seen
-        self.state = state
+        self._state: State | None
+        self._json_state: dict[str, Any] | None
+        if isinstance(state, State):
+            self._state = state
+            self._json_state = None
+        else:
+            self._state = None
+            self._json_state = state
+
+    @property
+    def state(self) -> State:
+        """Return the stored state, decoding it if needed."""
+        if self._state is None:
+            self._state = cast(State, State.from_dict(self._json_state))  # type: ignore[arg-type]
+            self._json_state = None
+        return self._state
+
+    @state.setter
+    def state(self, state: State) -> None:
+        """Set the stored state."""
+        self._state = state
+        self._json_state = None
+
+    @property
+    def entity_id(self) -> str:
+        """Return the entity_id of the stored state without decoding it."""
+        if self._state is None:
+            return cast(str, self._json_state["entity_id"])  # type: ignore[index]
+        return self._state.entity_id
 
     def as_dict(self) -> dict[str, Any]:
         """Return a dict representation of the stored state to be JSON serialized."""
+        # If the state was never decoded, write it back as it was loaded
+        state = self._json_state if self._state is None else self._state.json_fragment
         return {
-            "state": self.state.json_fragment,
+            "state": state,
             "extra_data": self.extra_data.as_dict() if self.extra_data else None,
             "last_seen": self.last_seen,
         }
@@ -91,9 +136,7 @@ class StoredState:
         if isinstance(last_seen, str):
             last_seen = dt_util.parse_datetime(last_seen)
 
-        return cls(
-            cast(State, State.from_dict(json_dict["state"])), extra_data, last_seen
-        )
+        return cls(json_dict["state"], extra_data, last_seen)
 
 
 async def async_load(hass: HomeAssistant) -> None:
@@ -137,8 +180,15 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.delta_store = Store[list[dict[str, Any]]](
+            hass, STORAGE_VERSION, DELTA_STORAGE_KEY, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The state object and extra data last written for each entity
+        self._dumped: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        # States changed since the last full dump, keyed by entity_id
+        self._delta: dict[str, dict[str, Any]] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -159,16 +209,34 @@ class RestoreStateData:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
-        if stored_states is None:
+        try:
+            delta_states = await self.delta_store.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading changed states", exc_info=exc)
+            delta_states = None
+
+        if stored_states is None and delta_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
-        else:
-            self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
-                if valid_entity_id(item["state"]["entity_id"])
-            }
-            _LOGGER.debug("Created cache with %s", list(self.last_states))
+            return
+
+        last_states = {
+            item["state"]["entity_id"]: StoredState.from_dict(item)
+            for item in stored_states or ()
+            if valid_entity_id(item["state"]["entity_id"])
+        }
+        for item in delta_states or ():
+            if not valid_entity_id(entity_id := item["state"]["entity_id"]):
+                continue
+            stored_state = StoredState.from_dict(item)
+            # A full dump written after the delta has the newer state
+            if (
+                existing := last_states.get(entity_id)
+            ) is not None and existing.last_seen > stored_state.last_seen:
+                continue
+            last_states[entity_id] = stored_state
+        self.last_states = last_states
+        _LOGGER.debug("Created cache with %s", list(self.last_states))
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -197,6 +265,15 @@ class RestoreStateData:
             for entity_id, entity in self.entities.items()
             if entity_id in current_states_by_entity_id
         ]
+        # Remember what is written so the periodic dumps can skip
+        # entities which have not changed since
+        self._dumped = {
+            stored_state.entity_id: (
+                stored_state.state,
+                stored_state.extra_data.as_dict() if stored_state.extra_data else None,
+            )
+            for stored_state in stored_states
+        }
         expiration_time = now - STATE_EXPIRATION
 
         for entity_id, stored_state in self.last_states.items():
@@ -217,6 +294,9 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        dumped = self._dumped
+        delta = self._delta
+        self._delta = {}
         try:
             await self.store.async_save(
                 [
@@ -226,6 +306,61 @@ class RestoreStateData:
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            # Nothing was written, so keep tracking the changes
+            # since the last successful full dump
+            self._dumped = dumped
+            delta.update(self._delta)
+            self._delta = delta
+            return
+        # The full dump supersedes any delta, including one
+        # left behind by a previous run that did not stop cleanly
+        await self.delta_store.async_remove()
+
+    @callback
+    def async_get_changed_states(self) -> dict[str, dict[str, Any]]:
+        """Get the states which changed since the last full dump.
+
+        Entities whose state object and extra data are the same as
+        when they were last written are skipped.
+        """
+        now = dt_util.utcnow()
+        states = self.hass.states
+        dumped = self._dumped
+        delta = self._delta
+        for entity_id, entity in self.entities.items():
+            if (state := states.get(entity_id)) is None or state.attributes.get(
+                ATTR_RESTORED
+            ):
+                continue
+            extra_data = entity.extra_restore_state_data
+            extra_data_dict = extra_data.as_dict() if extra_data else None
+            if (previous := dumped.get(entity_id)) is not None and (
+                previous[0] is state and previous[1] == extra_data_dict
+            ):
+                continue
+            dumped[entity_id] = (state, extra_data_dict)
+            delta[entity_id] = {
+                "state": state.json_fragment,
+                "extra_data": extra_data_dict,
+                "last_seen": now,
+            }
+        return delta
+
+    async def async_dump_changed_states(self) -> None:
+        """Save the states which changed since the last full dump to storage.
+
+        A full dump is written instead once enough states have changed
+        that the delta would not be much smaller.
+        """
+        delta = self.async_get_changed_states()
+        if len(delta) > FULL_DUMP_RATIO * max(len(self._dumped), 1):
+            await self.async_dump_states()
+            return
+        _LOGGER.debug("Dumping %s changed states", len(delta))
+        try:
+            await self.delta_store.async_save(list(delta.values()))
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -241,10 +376,13 @@ class RestoreStateData:
             _async_dump_states(), "RestoreStateData dump"
         )
 
-        # Dump states periodically
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_changed_states()
+
+        # Dump changed states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_changed_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
@@ -277,10 +415,11 @@ class RestoreStateData:
         if state is not None:
             state = State.from_dict(json_loads(state.as_dict_json))  # type: ignore[arg-type]
         if state is not None:
-            self.last_states[entity_id] = StoredState(
-                state, extra_data, dt_util.utcnow()
-            )
+            stored_state = StoredState(state, extra_data, dt_util.utcnow())
+            self.last_states[entity_id] = stored_state
+            self._delta[entity_id] = stored_state.as_dict()
 
+        self._dumped.pop(entity_id, None)
         del self.entities[entity_id]
 
 
@@ -0,0 +1,313 @@
+"""Compile voluptuous schemas into fast validation callables.
+
+Voluptuous walks its generic schema structures on every call, building
+paths, candidate lists and error lists even when the data is valid. For
+schemas that are validated over and over, like service call schemas, the
+common building blocks (dicts with marker keys, lists, All, Any, nested
+Schema objects and plain validator callables) are compiled into plain
+Python callables once.
+
+The compiled callable only ever returns a value voluptuous would also
+return. When it runs into invalid data it calls the original schema
+instead, so errors are always raised by voluptuous with its usual
+messages and paths. Parts of a schema that are not recognized are
+validated by voluptuous itself.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+import inspect
+from typing import Any
+
+import voluptuous as vol
+
+type _Validator = Callable[[Any], Any]
+
+_PRIMITIVE_TYPES = (bool, bytes, int, float, str, complex)
+_KEY_MARKERS = (vol.Required, vol.Optional, vol.Remove, vol.Exclusive, vol.Inclusive)
+_MISSING = object()
+
+
+class _Undecided(Exception):
+    """Raised when the fast path cannot tell what voluptuous would do."""
+
+
+class _Unsupported(Exception):
+    """Raised when a schema cannot be compiled at all."""
+
+
+class _CompiledNode:
+    """A compiled schema node."""
+
+    __slots__ = ("validate", "is_leaf")
+
+    def __init__(self, validate: _Validator, is_leaf: bool) -> None:
+        """Initialize the compiled node."""
+        self.validate = validate
+        self.is_leaf = is_leaf
+
+
+def compile_schema(schema: Callable[[Any], Any]) -> _Validator:
+    """Compile a schema into a validation callable.
+
+    The returned callable accepts and returns the same data as the schema
+    and raises the same exceptions.
+    """
+    try:
+        if isinstance(schema, vol.Schema):
+            node = _compile(schema.schema, schema.extra, schema.required)
+        elif type(schema) is vol.All and schema.discriminant is None:
+            # Calling All or Any directly validates each
+            # validator with a default Schema
+            node = _compile_all(schema, vol.PREVENT_EXTRA, False)
+        elif type(schema) is vol.Any and schema.discriminant is None:
+            node = _compile_any(schema, vol.PREVENT_EXTRA, False)
+        else:
+            return schema
+    except _Unsupported:
+        return schema
+
+    if node.is_leaf:
+        # Nothing to gain over calling the schema itself
+        return schema
+
+    fast_validate = node.validate
+
+    def validate(data: Any) -> Any:
+        """Validate data with the fast path, falling back to voluptuous."""
+        try:
+            return fast_validate(data)
+        except (vol.Invalid, ValueError, _Undecided):
+            # Let voluptuous raise the error
+            return schema(data)
+
+    return validate
+
+
+def _compile(schema: Any, extra: int, required: bool) -> _CompiledNode:
+    """Compile a schema node the same way vol.Schema would."""
+    if schema is vol.Self:
+        # Self refers to the schema being compiled
+        raise _Unsupported
+    if schema is vol.Extra:
+        return _delegate(schema, extra, required)
+    if isinstance(schema, vol.Schema):
+        # A nested Schema is called with its own settings
+        return _compile(schema.schema, schema.extra, schema.required)
+    if type(schema) is vol.All and schema.discriminant is None:
+        return _compile_all(schema, extra, schema.required)
+    if type(schema) is vol.Any and schema.discriminant is None:
+        return _compile_any(schema, extra, schema.required)
+    if hasattr(schema, "__voluptuous_compile__") or isinstance(schema, vol.Object):
+        return _delegate(schema, extra, required)
+    if type(schema) is dict:
+        return _compile_dict(schema, extra, required)
+    if type(schema) in (list, tuple):
+        return _compile_sequence(schema, extra, required)
+    if isinstance(schema, Mapping | list | tuple | set | frozenset):
+        return _delegate(schema, extra, required)
+    if inspect.isclass(schema):
+        return _CompiledNode(_instance_validator(schema), True)
+    if callable(schema):
+        return _CompiledNode(schema, True)
+    if type(schema) in _PRIMITIVE_TYPES or schema is None:
+        return _CompiledNode(_value_validator(schema), True)
+    return _delegate(schema, extra, required)
+
+
+def _delegate(schema: Any, extra: int, required: bool) -> _CompiledNode:
+    """Let voluptuous validate a schema node we do not recognize."""
+    compiled = vol.Schema(schema, extra=extra, required=required)._compiled  # noqa: SLF001
+
+    def validate(value: Any) -> Any:
+        return compiled([], value)
+
+    return _CompiledNode(validate, False)
+
+
+def _instance_validator(schema: type) -> _Validator:
+    """Return a validator checking the type of the data."""
+
+    def validate(value: Any) -> Any:
+        if isinstance(value, schema):
+            return value
+        raise vol.Invalid(f"expected {schema.__name__}")
+
+    return validate
+
+
+def _value_validator(schema: Any) -> _Validator:
+    """Return a validator comparing the data with a literal value."""
+
+    def validate(value: Any) -> Any:
+        if value != schema:
+            raise vol.Invalid("not a valid value")
+        return value
+
+    return validate
+
+
+def _is_valid(validator: _Validator, value: Any) -> bool:
+    """Return if a value passes a validator."""
+    try:
+        validator(value)
+    except (vol.Invalid, ValueError):
+        return False
+    return True
+
+
+def _compile_all(schema: vol.All, extra: int, required: bool) -> _CompiledNode:
+    """Compile All, which chains each validator."""
+    nodes = [_compile(item, extra, required) for item in schema.validators]
+    if len(nodes) == 1:
+        return nodes[0]
+    validators = [node.validate for node in nodes]
+
+    def validate(value: Any) -> Any:
+        for validator in validators:
+            value = validator(value)
+        return value
+
+    return _CompiledNode(validate, all(node.is_leaf for node in nodes))
+
+
+def _compile_any(schema: vol.Any, extra: int, required: bool) -> _CompiledNode:
+    """Compile Any, which returns the result of the first valid validator."""
+    nodes = [_compile(item, extra, required) for item in schema.validators]
+    validators = [node.validate for node in nodes]
+
+    def validate(value: Any) -> Any:
+        error: vol.Invalid | None = None
+        for validator in validators:
+            try:
+                return validator(value)
+            except vol.Invalid as err:
+                # Like voluptuous, keep the error from deepest in the data
+                if error is None or len(err.path) > len(error.path):
+                    error = err
+            except ValueError:
+                continue
+        raise error or vol.Invalid("no valid value found")
+
+    return _CompiledNode(validate, all(node.is_leaf for node in nodes))
+
+
+def _compile_sequence(
+    schema: list | tuple, extra: int, required: bool
+) -> _CompiledNode:
+    """Compile a list or tuple of validators tried in order for each item."""
+    if not schema:
+        return _delegate(schema, extra, required)
+    nodes = [_compile(item, extra, required) for item in schema]
+    # Voluptuous does not try the next validator for an item when the
+    # error comes from deeper in the data, which only leaves can rule out
+    if not all(node.is_leaf for node in nodes[:-1]):
+        return _delegate(schema, extra, required)
+    validators = [node.validate for node in nodes]
+    leading_validators = validators[:-1]
+    last_validator = validators[-1]
+    seq_type = type(schema)
+
+    def validate(value: Any) -> Any:
+        if type(value) is not seq_type:
+            if isinstance(value, seq_type):
+                raise _Undecided
+            raise vol.Invalid(f"expected a {seq_type.__name__}")
+        out = []
+        for item in value:
+            for validator in leading_validators:
+                try:
+                    result = validator(item)
+                except vol.Invalid as err:
+                    if err.path:
+                        raise _Undecided from err
+                    continue
+                except ValueError:
+                    continue
+                break
+            else:
+                result = last_validator(item)
+            if result is not vol.Remove:
+                out.append(result)
+        return seq_type(out)
+
+    return _CompiledNode(validate, False)
+
+
+def _compile_dict(schema: dict[Any, Any], extra: int, required: bool) -> _CompiledNode:
+    """Compile a dict schema with literal and marker keys."""
+    validators: dict[str, _Validator] = {}
+    removed: dict[str, _Validator] = {}
+    required_keys: set[str] = set()
+    defaults: list[tuple[str, Callable[[], Any], _Validator]] = []
+    exclusive: dict[str, list[str]] = {}
+    inclusive: dict[str, list[str]] = {}
+
+    for skey, svalue in schema.items():
+        if type(skey) is str:
+            key = skey
+        elif type(skey) in _KEY_MARKERS and type(skey.schema) is str:
+            key = skey.schema
+        else:
+            # Keys validated by a type or validator are matched
+            # against every key of the data
+            return _delegate(schema, extra, required)
+
+        validator = _compile(svalue, extra, required).validate
+        if type(skey) is vol.Remove:
+            removed[key] = validator
+            continue
+        validators[key] = validator
+
+        if type(skey) is vol.Exclusive:
+            exclusive.setdefault(skey.group_of_exclusion, []).append(key)
+        elif type(skey) is vol.Inclusive:
+            inclusive.setdefault(skey.group_of_inclusion, []).append(key)
+
+        if (required and not isinstance(skey, vol.Optional)) or isinstance(
+            skey, vol.Required
+        ):
+            required_keys.add(key)
+        if isinstance(skey, vol.Required | vol.Optional) and not isinstance(
+            skey.default, vol.Undefined
+        ):
+            defaults.append((key, skey.default, validator))
+
+    exclusive_groups = [set(group) for group in exclusive.values()]
+    inclusive_groups = [set(group) for group in inclusive.values()]
+    allow_extra = extra == vol.ALLOW_EXTRA
+    remove_extra = extra == vol.REMOVE_EXTRA
+
+    def validate(value: Any) -> Any:
+        if not isinstance(value, dict):
+            raise vol.Invalid("expected a dictionary")
+        for group in exclusive_groups:
+            if len(group.intersection(value)) > 1:
+                raise vol.Invalid("two or more values in the same group of exclusion")
+        for group in inclusive_groups:
+            if 0 < len(group.intersection(value)) < len(group):
+                raise vol.Invalid("some but not all values in the same group")
+
+        out = value.__class__()
+        for key, item in value.items():
+            if (validator := validators.get(key, _MISSING)) is not _MISSING:
+                out[key] = validator(item)  # type: ignore[operator]
+            elif key in removed and _is_valid(removed[key], item):
+                # Removed keys are only dropped when their value is valid
+                continue
+            elif remove_extra:
+                continue
+            elif allow_extra:
+                out[key] = item
+            else:
+                raise vol.Invalid("extra keys not allowed")
+        for key, default, validator in defaults:
+            if key not in value:
+                out[key] = validator(default())
+        for key in required_keys:
+            if key not in out:
+                raise vol.Invalid("required key not provided")
+        return out
+
+    return _CompiledNode(validate, False)
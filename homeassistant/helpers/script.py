@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Coroutine, Mapping, Sequence
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from copy import copy
@@ -29,6 +29,7 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_FLOOR_ID,
     ATTR_LABEL_ID,
+    CONF_ACTION,
     CONF_ALIAS,
     CONF_CHOOSE,
     CONF_CONDITION,
@@ -57,6 +58,7 @@ from homeassistant.const import (
     CONF_SERVICE,
     CONF_SERVICE_DATA,
     CONF_SERVICE_DATA_TEMPLATE,
+    CONF_SERVICE_TEMPLATE,
     CONF_SET_CONVERSATION_RESPONSE,
     CONF_STOP,
     CONF_TARGET,
@@ -79,6 +81,7 @@ from homeassistant.core import (
     State,
     SupportsResponse,
     callback,
+    valid_entity_id,
 )
 from homeassistant.util import slugify
 from homeassistant.util.async_ import create_eager_task
@@ -97,6 +100,7 @@ from .trace import (
     async_trace_path,
     script_execution_set,
     trace_append_element,
+    trace_disabled,
     trace_id_get,
     trace_path,
     trace_path_get,
@@ -177,8 +181,10 @@ def _set_result_unless_done(future: asyncio.Future[None]) -> None:
         future.set_result(None)
 
 
-def action_trace_append(variables: dict[str, Any], path: str) -> TraceElement:
-    """Append a TraceElement to trace[path]."""
+def action_trace_append(variables: dict[str, Any], path: str) -> TraceElement | None:
+    """Append a TraceElement to trace[path], unless tracing is disabled."""
+    if trace_disabled():
+        return None
     trace_element = TraceElement(variables, path)
     trace_append_element(trace_element, ACTION_TRACE_NODE_MAX_LEN)
     return trace_element
@@ -190,10 +196,14 @@ async def trace_action(
     script_run: _ScriptRun,
     stop: asyncio.Future[None],
     variables: dict[str, Any],
-) -> AsyncGenerator[TraceElement]:
+) -> AsyncGenerator[TraceElement | None]:
     """Trace action execution."""
+    if trace_disabled():
+        yield None
+        return
+
     path = trace_path_get()
-    trace_element = action_trace_append(variables, path)
+    trace_element = cast(TraceElement, action_trace_append(variables, path))
     trace_stack_push(trace_stack_cv, trace_element)
 
     trace_id = trace_id_get()
@@ -406,6 +416,7 @@ class _ScriptRun:
     """Manage Script sequence run."""
 
     _action: dict[str, Any]
+    _step_data: _ScriptStep
 
     def __init__(
         self,
@@ -440,6 +451,8 @@ class _ScriptRun:
 
     def _step_log(self, default_message: str, timeout: float | None = None) -> None:
         self._script.last_action = self._action.get(CONF_ALIAS, default_message)
+        if not self._script._logger.isEnabledFor(logging.INFO):  # noqa: SLF001
+            return
         _timeout = (
             "" if timeout is None else f" (timeout: {timedelta(seconds=timeout)})"
         )
@@ -457,7 +470,8 @@ class _ScriptRun:
 
         try:
             self._log("Running %s", self._script.running_description)
-            for self._step, self._action in enumerate(self._script.sequence):
+            for self._step, self._step_data in enumerate(self._script._steps):  # noqa: SLF001
+                self._action = self._step_data.config
                 if self._stop.done():
                     script_execution_set("cancelled")
                     break
@@ -491,17 +505,16 @@ class _ScriptRun:
         return ScriptRunResult(self._conversation_response, response, self._variables)
 
     async def _async_step(self, log_exceptions: bool) -> None:
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+        step = self._step_data
+        continue_on_error = step.continue_on_error
 
-        with trace_path(str(self._step)):
+        with trace_path(step.path):
             async with trace_action(
                 self._hass, self, self._stop, self._variables
             ) as trace_element:
                 if self._stop.done():
                     return
 
-                action = cv.determine_script_action(self._action)
-
                 if CONF_ENABLED in self._action:
                     enabled = self._action[CONF_ENABLED]
                     if isinstance(enabled, Template):
@@ -516,20 +529,20 @@ class _ScriptRun:
                     if not enabled:
                         self._log(
                             "Skipped disabled step %s",
-                            self._action.get(CONF_ALIAS, action),
+                            self._action.get(CONF_ALIAS, step.action),
                         )
                         trace_set_result(enabled=False)
                         return
 
-                handler = f"_async_{action}_step"
                 try:
-                    await getattr(self, handler)()
+                    await step.handler(self)
                 except Exception as ex:  # noqa: BLE001
                     self._handle_exception(
                         ex, continue_on_error, self._log_exceptions or log_exceptions
                     )
                 finally:
-                    trace_element.update_variables(self._variables)
+                    if trace_element is not None:
+                        trace_element.update_variables(self._variables)
 
     def _finish(self) -> None:
         self._script._runs.remove(self)  # noqa: SLF001
@@ -581,7 +594,7 @@ class _ScriptRun:
             raise exception
 
     def _log_exception(self, exception: Exception) -> None:
-        action_type = cv.determine_script_action(self._action)
+        action_type = self._step_data.action
 
         error = str(exception)
         level = logging.ERROR
@@ -615,6 +628,8 @@ class _ScriptRun:
         )
 
     def _get_pos_time_period_template(self, key: str) -> timedelta:
+        if (time_period := self._step_data.time_periods.get(key)) is not None:
+            return time_period
         try:
             return cv.positive_time_period(  # type: ignore[no-any-return]
                 template.render_complex(self._action[key], self._variables)
@@ -732,9 +747,20 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
-        )
+        if (
+            static_params := self._step_data.get_service_params(self._hass)
+        ) is not None:
+            # Copy the prepared parameters, the service call updates them
+            params: service.ServiceParams = {
+                "domain": static_params["domain"],
+                "service": static_params["service"],
+                "service_data": dict(static_params["service_data"]),
+                "target": dict(static_params["target"]),
+            }
+        else:
+            params = service.async_prepare_call_from_config(
+                self._hass, self._action, self._variables
+            )
 
         # Validate response data parameters. This check ignores services that do
         # not exist which will raise an appropriate error in the service call below.
@@ -798,8 +824,10 @@ class _ScriptRun:
         """Fire an event."""
         self._step_log(self._action.get(CONF_ALIAS, self._action[CONF_EVENT]))
         event_data = {}
+        if (static_event_data := self._step_data.event_data) is not None:
+            event_data.update(static_event_data)
         for conf in (CONF_EVENT_DATA, CONF_EVENT_DATA_TEMPLATE):
-            if conf not in self._action:
+            if conf not in self._action or static_event_data is not None:
                 continue
 
             try:
@@ -1382,6 +1410,90 @@ class _IfData(TypedDict):
     if_else: Script | None
 
 
+_SERVICE_PARAMS_KEYS = (
+    CONF_ACTION,
+    CONF_SERVICE_TEMPLATE,
+    CONF_TARGET,
+    CONF_SERVICE_DATA,
+    CONF_SERVICE_DATA_TEMPLATE,
+)
+
+
+class _ScriptStep:
+    """A step of a script sequence, prepared once for all runs.
+
+    The action type and its handler are determined up front, time periods
+    and event data which do not use templates are parsed up front and the
+    parameters of service calls without templates are prepared on the
+    first call.
+    """
+
+    __slots__ = (
+        "_service_params",
+        "action",
+        "config",
+        "continue_on_error",
+        "event_data",
+        "handler",
+        "path",
+        "time_periods",
+    )
+
+    def __init__(self, index: int, config: dict[str, Any]) -> None:
+        """Prepare the step."""
+        self.config = config
+        self.path = str(index)
+        self.action = cv.determine_script_action(config)
+        self.handler: Callable[[_ScriptRun], Coroutine[Any, Any, None]] = getattr(
+            _ScriptRun, f"_async_{self.action}_step"
+        )
+        self.continue_on_error: bool = config.get(CONF_CONTINUE_ON_ERROR, False)
+        self.time_periods: dict[str, timedelta] = {}
+        for key in (CONF_DELAY, CONF_TIMEOUT):
+            if key in config and not template.is_complex(config[key]):
+                try:
+                    self.time_periods[key] = cv.positive_time_period(config[key])
+                except vol.Invalid:
+                    # Let the run raise and log the error
+                    continue
+        self.event_data: dict[str, Any] | None = None
+        if self.action == cv.SCRIPT_ACTION_FIRE_EVENT and not any(
+            template.is_complex(config.get(key))
+            for key in (CONF_EVENT_DATA, CONF_EVENT_DATA_TEMPLATE)
+        ):
+            self.event_data = {
+                **config.get(CONF_EVENT_DATA, {}),
+                **config.get(CONF_EVENT_DATA_TEMPLATE, {}),
+            }
+        # None if not prepared yet, False if it can't be prepared
+        self._service_params: service.ServiceParams | Literal[False] | None = (
+            None
+            if self.action == cv.SCRIPT_ACTION_CALL_SERVICE
+            and not any(
+                template.is_complex(config.get(key)) for key in _SERVICE_PARAMS_KEYS
+            )
+            else False
+        )
+
+    def get_service_params(self, hass: HomeAssistant) -> service.ServiceParams | None:
+        """Return the prepared service call parameters, if they don't change."""
+        if self._service_params is None:
+            self._service_params = False
+            entity_ids = cv.comp_entity_ids_or_uuids(
+                self.config.get(CONF_TARGET, {}).get(ATTR_ENTITY_ID, [])
+            )
+            # Entity registry ids are resolved on every call since
+            # the entity they refer to may be renamed
+            if isinstance(entity_ids, list) and not all(
+                valid_entity_id(entity_id) for entity_id in entity_ids
+            ):
+                return None
+            self._service_params = service.async_prepare_call_from_config(
+                hass, self.config
+            )
+        return self._service_params or None
+
+
 @dataclass
 class ScriptRunResult:
     """Container with the result of a script run."""
@@ -2015,9 +2127,18 @@ class Script:
             self._sequence_scripts[step] = sequence_script
         return sequence_script
 
+    @cached_property
+    def _steps(self) -> list[_ScriptStep]:
+        """Return the steps of the sequence prepared for running."""
+        return [
+            _ScriptStep(index, config) for index, config in enumerate(self.sequence)
+        ]
+
     def _log(
         self, msg: str, *args: Any, level: int = logging.INFO, **kwargs: Any
     ) -> None:
+        if level != _LOG_EXCEPTION and not self._logger.isEnabledFor(level):
+            return
         msg = f"%s: {msg}"
         args = (self.name, *args)
 
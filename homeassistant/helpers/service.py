@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine, Hashable, Iterable
 import dataclasses
 from enum import Enum
 from functools import cache, partial
@@ -79,6 +80,9 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+DATA_SERVICE_CALL_LIMITERS: HassKey[dict[str, ServiceCallLimiter]] = HassKey(
+    "service_call_limiters"
+)
 
 
 @cache
@@ -857,6 +861,172 @@ def async_set_service_schema(
     descriptions_cache[(domain, service)] = description
 
 
+class ServiceCallLimiter:
+    """Limit the concurrency and rate of entity service calls.
+
+    A limiter is shared by all entity platforms of an integration, which
+    usually talk to the same radio, hub or cloud API. Callers waiting for a
+    slot are served round robin, so a single service call targeting many
+    entities does not hold up other callers until all of its entities have
+    been called.
+
+    A call made by the task holding a slot of the limiter, like an entity
+    service calling another service of its integration, runs without
+    waiting. It would otherwise wait for a slot its caller can only free
+    once the call is done. Tasks created while holding a slot, like the
+    automations triggered by a state change, are limited as usual.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent: int | None,
+        calls_per_second: float | None,
+    ) -> None:
+        """Initialize the limiter."""
+        self.hass = hass
+        self.max_concurrent = max_concurrent
+        self.calls_per_second = calls_per_second
+        self._min_interval = 1 / calls_per_second if calls_per_second else 0.0
+        self._next_start = 0.0
+        self._active = 0
+        self._queues: dict[Hashable, deque[asyncio.Future[None]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        # The tasks currently holding a slot
+        self._holders: set[asyncio.Task[Any]] = set()
+        self.calls = 0
+        self.queued_calls = 0
+        self.nested_calls = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of calls waiting for a slot."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @callback
+    def async_get_stats(self) -> dict[str, Any]:
+        """Return the queue statistics of the limiter."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "calls_per_second": self.calls_per_second,
+            "active": self._active,
+            "waiting": self.waiting,
+            "calls": self.calls,
+            "queued_calls": self.queued_calls,
+            "nested_calls": self.nested_calls,
+            "total_wait_time": self.total_wait_time,
+            "max_wait_time": self.max_wait_time,
+        }
+
+    @callback
+    def async_held_by_current_task(self) -> bool:
+        """Return if the current task holds a slot of the limiter."""
+        return asyncio.current_task() in self._holders
+
+    async def async_run[_T](
+        self, caller: Hashable, coro: Coroutine[Any, Any, _T]
+    ) -> _T:
+        """Run a call once a slot is available for it."""
+        if self.async_held_by_current_task():
+            self.nested_calls += 1
+            return await coro
+        try:
+            await self._async_acquire(caller)
+        except BaseException:
+            coro.close()
+            raise
+        task = cast(asyncio.Task[Any], asyncio.current_task())
+        self._holders.add(task)
+        try:
+            return await coro
+        finally:
+            self._holders.discard(task)
+            self._active -= 1
+            self._async_dispatch()
+
+    def _has_free_slot(self) -> bool:
+        """Return if a call may start now."""
+        return (
+            self.max_concurrent is None or self._active < self.max_concurrent
+        ) and self.hass.loop.time() >= self._next_start
+
+    def _start_call(self) -> None:
+        """Take a slot for a call."""
+        self._active += 1
+        self.calls += 1
+        if self._min_interval:
+            self._next_start = self.hass.loop.time() + self._min_interval
+
+    async def _async_acquire(self, caller: Hashable) -> None:
+        """Wait until a call of the caller may start."""
+        if not self._queues and self._has_free_slot():
+            self._start_call()
+            return
+
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        if (queue := self._queues.get(caller)) is None:
+            queue = self._queues[caller] = deque()
+        queue.append(future)
+        self.queued_calls += 1
+        start = self.hass.loop.time()
+        self._async_dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                self._async_remove(caller, future)
+            else:
+                # The slot was handed over just before the cancellation
+                self._active -= 1
+                self._async_dispatch()
+            raise
+        finally:
+            wait_time = self.hass.loop.time() - start
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def _async_remove(self, caller: Hashable, future: asyncio.Future[None]) -> None:
+        """Remove a cancelled call from the queue of its caller."""
+        if (queue := self._queues.get(caller)) is None:
+            return
+        if future in queue:
+            queue.remove(future)
+        if not queue:
+            del self._queues[caller]
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Start queued calls while slots are available."""
+        while self._queues:
+            if not self._has_free_slot():
+                if (
+                    self.max_concurrent is None or self._active < self.max_concurrent
+                ) and self._timer is None:
+                    self._timer = self.hass.loop.call_at(
+                        self._next_start, self._async_timer_fired
+                    )
+                return
+            # Serve callers round robin by moving the caller
+            # to the back after taking one of its calls
+            caller = next(iter(self._queues))
+            queue = self._queues.pop(caller)
+            future = queue.popleft()
+            if queue:
+                self._queues[caller] = queue
+            if future.done():
+                continue
+            self._start_call()
+            future.set_result(None)
+
+    @callback
+    def _async_timer_fired(self) -> None:
+        """Start queued calls once the rate limit allows it."""
+        self._timer = None
+        self._async_dispatch()
+
+
 def _get_permissible_entity_candidates(
     call: ServiceCall,
     entities: dict[str, Entity],
@@ -993,9 +1163,11 @@ async def entity_service_call(
     if len(entities) == 1:
         # Single entity case avoids creating task
         entity = entities[0]
-        single_response = await _handle_entity_call(
-            hass, entity, func, data, call.context
-        )
+        single_call = _handle_entity_call(hass, entity, func, data, call.context)
+        if limiter := _get_service_call_limiter(entity):
+            single_response = await limiter.async_run(call.context.id, single_call)
+        else:
+            single_response = await single_call
         if entity.should_poll:
             # Context expires if the turn on commands took a long time.
             # Set context again so it's there when we update
@@ -1007,8 +1179,12 @@ async def entity_service_call(
     # are in the same order as the entities list
     results: list[ServiceResponse | BaseException] = await asyncio.gather(
         *[
-            entity.async_request_call(
-                _handle_entity_call(hass, entity, func, data, call.context)
+            _limited_entity_call(
+                entity,
+                call.context.id,
+                entity.async_request_call(
+                    _handle_entity_call(hass, entity, func, data, call.context)
+                ),
             )
             for entity in entities
         ],
@@ -1041,6 +1217,37 @@ async def entity_service_call(
     return response_data if return_response and response_data else None
 
 
+@callback
+def async_get_service_call_limiter_stats(
+    hass: HomeAssistant, domain: str
+) -> dict[str, Any] | None:
+    """Return the statistics of the service call limiter of an integration."""
+    if (limiter := hass.data.get(DATA_SERVICE_CALL_LIMITERS, {}).get(domain)) is None:
+        return None
+    return limiter.async_get_stats()
+
+
+def _get_service_call_limiter(entity: Entity) -> ServiceCallLimiter | None:
+    """Return the service call limiter of the integration of an entity."""
+    if (platform := entity.platform) is None:
+        return None
+    return platform.service_call_limiter
+
+
+def _limited_entity_call[_T](
+    entity: Entity, caller: Hashable, coro: Coroutine[Any, Any, _T]
+) -> Coroutine[Any, Any, _T]:
+    """Wrap an entity call with the limiter of its integration, if any."""
+    if (limiter := _get_service_call_limiter(entity)) is None:
+        return coro
+    # The calls are gathered into new tasks, so nested calls
+    # are detected here in the task making them
+    if limiter.async_held_by_current_task():
+        limiter.nested_calls += 1
+        return coro
+    return limiter.async_run(caller, coro)
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -1052,19 +1259,24 @@ async def _handle_entity_call(
     entity.async_set_context(context)
 
     task: asyncio.Future[ServiceResponse] | None
+    result: ServiceResponse = None
     if isinstance(func, str):
         job = HassJob(
             partial(getattr(entity, func), **data),  # type: ignore[arg-type]
             job_type=entity.get_hassjob_type(func),
         )
-        task = hass.async_run_hass_job(job)
+        args: tuple[Any, ...] = ()
     else:
-        task = hass.async_run_hass_job(func, entity, data)
+        job = func
+        args = (entity, data)
 
+    if job.job_type is HassJobType.Coroutinefunction:
+        # Run in the current task so the service calls the entity makes
+        # are made by the task holding the slot of the service call limiter
+        result = await job.target(*args)
     # Guard because callback functions do not return a task when passed to
     # async_run_job.
-    result: ServiceResponse = None
-    if task is not None:
+    elif (task := hass.async_run_hass_job(job, *args)) is not None:
         result = await task
 
     if asyncio.iscoroutine(result):
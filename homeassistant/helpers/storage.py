@@ -11,6 +11,7 @@ from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
+import time
 from typing import Any
 
 from propcache import cached_property
@@ -49,6 +50,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# The store manager records which keys are loaded during startup
+# and saves them so the next startup can preload all of them
+PRELOAD_PROFILE_KEY = "core.storage_preload"
+PRELOAD_PROFILE_VERSION = 1
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -117,6 +123,13 @@ class _StoreManager:
         self._data_preload: dict[str, json_util.JsonValueType] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
+        # Keys loaded by the previous startup, in load order, with their size
+        self._learned_keys: dict[str, int] = {}
+        # Keys loaded during this startup, in load order. This is set to
+        # None once startup has finished and we stop recording.
+        self._startup_loads: dict[str, None] | None = {}
+        self._load_timings: dict[str, float] = {}
+        self._preload_time: float = 0.0
 
     async def async_initialize(self) -> None:
         """Initialize the storage manager."""
@@ -138,6 +151,32 @@ class _StoreManager:
             self._invalidated.add(key)
             self._data_preload.pop(key, None)
 
+    @callback
+    def async_record_load(self, key: str, load_time: float | None = None) -> None:
+        """Record that a key was loaded.
+
+        Keys loaded before Home Assistant has started are saved
+        so they can be preloaded during the next startup.
+        """
+        if load_time is not None:
+            self._load_timings[key] = load_time
+        if (
+            self._startup_loads is not None
+            and "/" not in key
+            and key != PRELOAD_PROFILE_KEY
+        ):
+            self._startup_loads[key] = None
+
+    @callback
+    def async_get_load_timings(self) -> dict[str, float]:
+        """Return the time spent loading and decoding each storage key."""
+        return self._load_timings
+
+    @callback
+    def async_get_preload_time(self) -> float:
+        """Return the wall clock time spent preloading storage."""
+        return self._preload_time
+
     @callback
     def async_fetch(
         self, key: str
@@ -180,6 +219,7 @@ class _StoreManager:
         self._cancel_cleanup = self._hass.loop.call_later(
             MANAGER_CLEANUP_DELAY, self._async_cleanup
         )
+        self._async_save_preload_profile()
         # Handle the case where we stop in the first 60s
         self._hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_STOP,
@@ -203,28 +243,107 @@ class _StoreManager:
         """
         self._data_preload.clear()
 
+    @callback
+    def _async_save_preload_profile(self) -> None:
+        """Stop recording loads and save the keys loaded during startup."""
+        if (startup_loads := self._startup_loads) is None:
+            return
+        self._startup_loads = None
+        if not startup_loads:
+            return
+        storage_path = self._storage_path
+        keys = list(startup_loads)
+
+        def _build_profile() -> dict[str, Any]:
+            """Build the preload profile, called in the executor."""
+            profile: list[dict[str, Any]] = []
+            for key in keys:
+                try:
+                    size = storage_path.joinpath(key).stat().st_size
+                except OSError:
+                    continue
+                profile.append({"key": key, "size": size})
+            return {"keys": profile}
+
+        store: Store[dict[str, Any]] = Store(
+            self._hass, PRELOAD_PROFILE_VERSION, PRELOAD_PROFILE_KEY, private=True
+        )
+        store.async_delay_save(_build_profile, MANAGER_CLEANUP_DELAY)
+
     async def async_preload(self, keys: Iterable[str]) -> None:
-        """Cache the keys."""
+        """Cache the keys.
+
+        Keys that were loaded during the previous startup are preloaded
+        as well, and the loading is spread across several executor jobs
+        so large files do not hold up the small ones behind them.
+        """
         # If async_initialize has not been called yet, we can't preload
-        if self._files is not None and (existing := self._files.intersection(keys)):
-            await self._hass.async_add_executor_job(self._preload, existing)
+        if self._files is None:
+            return
+        files = self._files
+        learned_keys = self._learned_keys
+        ordered = [key for key in learned_keys if key in files]
+        ordered.extend(
+            key
+            for key in dict.fromkeys(keys)
+            if key in files and key not in learned_keys
+        )
+        if not ordered:
+            return
+        # Keep the load order within each job and assign each key to the
+        # job with the fewest bytes assigned so far
+        jobs: list[list[str]] = [
+            [] for _ in range(min(len(ordered), MAX_LOAD_CONCURRENTLY))
+        ]
+        job_sizes = [0] * len(jobs)
+        for key in ordered:
+            idx = job_sizes.index(min(job_sizes))
+            jobs[idx].append(key)
+            # Unknown files count as 1 byte so they are spread out as well
+            job_sizes[idx] += learned_keys.get(key) or 1
+        start = time.monotonic()
+        await asyncio.gather(
+            *(self._hass.async_add_executor_job(self._preload, job) for job in jobs)
+        )
+        self._preload_time += time.monotonic() - start
 
     def _preload(self, keys: Iterable[str]) -> None:
         """Cache the keys."""
         storage_path = self._storage_path
         data_preload = self._data_preload
+        load_timings = self._load_timings
         for key in keys:
             storage_file: Path = storage_path.joinpath(key)
+            start = time.monotonic()
             try:
                 if storage_file.is_file():
                     data_preload[key] = json_util.load_json(storage_file)
             except Exception as ex:  # noqa: BLE001
                 _LOGGER.debug("Error loading %s: %s", key, ex)
+            load_timings[key] = time.monotonic() - start
 
     def _initialize_files(self) -> None:
         """Initialize the cache."""
         if self._storage_path.exists():
             self._files = set(os.listdir(self._storage_path))
+            if PRELOAD_PROFILE_KEY in self._files:
+                self._learned_keys = self._load_preload_profile()
+
+    def _load_preload_profile(self) -> dict[str, int]:
+        """Load the keys recorded during the previous startup."""
+        try:
+            profile = json_util.load_json_object(
+                self._storage_path.joinpath(PRELOAD_PROFILE_KEY)
+            )
+            if profile.get("version") != PRELOAD_PROFILE_VERSION:
+                return {}
+            return {
+                entry["key"]: entry["size"]
+                for entry in profile["data"]["keys"]  # type: ignore[call-overload,index,union-attr]
+            }
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.debug("Error loading %s: %s", PRELOAD_PROFILE_KEY, ex)
+            return {}
 
 
 @bind_hass
@@ -326,11 +445,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            self._manager.async_record_load(self.key)
         else:
             try:
+                start = time.monotonic()
                 data = await self.hass.async_add_executor_job(
                     json_util.load_json, self.path
                 )
+                self._manager.async_record_load(self.key, time.monotonic() - start)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
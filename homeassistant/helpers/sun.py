@@ -6,6 +6,8 @@ from collections.abc import Callable
 import datetime
 from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU
+
 from homeassistant.const import SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.loader import bind_hass
@@ -19,6 +21,12 @@ if TYPE_CHECKING:
 DATA_LOCATION_CACHE: HassKey[
     dict[tuple[str, str, str, float, float], astral.location.Location]
 ] = HassKey("astral_location_cache")
+DATA_ASTRAL_EVENT_CACHE: HassKey[LRU[tuple[Any, ...], Any]] = HassKey(
+    "astral_event_cache"
+)
+
+# Enough for the events of all locations for a few days
+ASTRAL_EVENT_CACHE_SIZE = 512
 
 ELEVATION_AGNOSTIC_EVENTS = ("noon", "midnight")
 
@@ -46,10 +54,70 @@ def get_astral_location(
 
     if info not in hass.data[DATA_LOCATION_CACHE]:
         hass.data[DATA_LOCATION_CACHE][info] = Location(LocationInfo(*info))
+        # The location changed, events of the old location are not needed
+        get_astral_event_cache(hass).clear()
 
     return hass.data[DATA_LOCATION_CACHE][info], elevation
 
 
+@callback
+def get_astral_event_cache(hass: HomeAssistant) -> LRU[tuple[Any, ...], Any]:
+    """Get the cache of calculated astral events.
+
+    It holds the events of a date and the next events found walking dates.
+    """
+    if DATA_ASTRAL_EVENT_CACHE not in hass.data:
+        hass.data[DATA_ASTRAL_EVENT_CACHE] = LRU(ASTRAL_EVENT_CACHE_SIZE)
+    return hass.data[DATA_ASTRAL_EVENT_CACHE]
+
+
+def _astral_event_key(
+    location: astral.location.Location, elevation: astral.Elevation, event: str
+) -> tuple[Any, ...]:
+    """Return the cache key of an event for a location."""
+    # Dawn and dusk depend on the solar depression set on the location
+    return (
+        location.latitude,
+        location.longitude,
+        location.timezone,
+        location.solar_depression,
+        None if event in ELEVATION_AGNOSTIC_EVENTS else elevation,
+        event,
+    )
+
+
+def _get_location_astral_event_date(
+    location: astral.location.Location,
+    elevation: astral.Elevation,
+    event: str,
+    date: datetime.date,
+    cache: LRU[tuple[Any, ...], Any] | None,
+) -> datetime.datetime:
+    """Calculate the astral event time for a date, using the cache if given.
+
+    Raises ValueError when the event does not occur on the date.
+    """
+    kwargs: dict[str, Any] = {"local": False}
+    if event not in ELEVATION_AGNOSTIC_EVENTS:
+        kwargs["observer_elevation"] = elevation
+
+    if cache is None:
+        return cast(_AstralSunEventCallable, getattr(location, event))(date, **kwargs)
+
+    key = (*_astral_event_key(location, elevation, event), date)
+    if (result := cache.get(key)) is None:
+        try:
+            result = cast(_AstralSunEventCallable, getattr(location, event))(
+                date, **kwargs
+            )
+        except ValueError as err:
+            result = str(err)
+        cache[key] = result
+    if isinstance(result, datetime.datetime):
+        return result
+    raise ValueError(result)
+
+
 @callback
 @bind_hass
 def get_astral_event_next(
@@ -61,7 +129,12 @@ def get_astral_event_next(
     """Calculate the next specified solar event."""
     location, elevation = get_astral_location(hass)
     return get_location_astral_event_next(
-        location, elevation, event, utc_point_in_time, offset
+        location,
+        elevation,
+        event,
+        utc_point_in_time,
+        offset,
+        cache=get_astral_event_cache(hass),
     )
 
 
@@ -72,8 +145,15 @@ def get_location_astral_event_next(
     event: str,
     utc_point_in_time: datetime.datetime | None = None,
     offset: datetime.timedelta | None = None,
+    *,
+    cache: LRU[tuple[Any, ...], Any] | None = None,
 ) -> datetime.datetime:
-    """Calculate the next specified solar event."""
+    """Calculate the next specified solar event.
+
+    The next event is looked up in and added to the cache, if given. It is
+    the next event for any point in time from the one it was found for up
+    to the event, so near the poles the dates are not walked again.
+    """
 
     if offset is None:
         offset = datetime.timedelta()
@@ -81,23 +161,30 @@ def get_location_astral_event_next(
     if utc_point_in_time is None:
         utc_point_in_time = dt_util.utcnow()
 
-    kwargs: dict[str, Any] = {"local": False}
-    if event not in ELEVATION_AGNOSTIC_EVENTS:
-        kwargs["observer_elevation"] = elevation
+    key = (*_astral_event_key(location, elevation, event), offset, "next")
+    if cache is not None and (cached := cache.get(key)) is not None:
+        found_at, next_dt = cached
+        if found_at <= utc_point_in_time < next_dt:
+            return cast(datetime.datetime, next_dt)
 
+    local_date = dt_util.as_local(utc_point_in_time).date()
     mod = -1
     first_err = None
     while mod < 367:
         try:
             next_dt = (
-                cast(_AstralSunEventCallable, getattr(location, event))(
-                    dt_util.as_local(utc_point_in_time).date()
-                    + datetime.timedelta(days=mod),
-                    **kwargs,
+                _get_location_astral_event_date(
+                    location,
+                    elevation,
+                    event,
+                    local_date + datetime.timedelta(days=mod),
+                    None,
                 )
                 + offset
             )
             if next_dt > utc_point_in_time:
+                if cache is not None:
+                    cache[key] = (utc_point_in_time, next_dt)
                 return next_dt
         except ValueError as err:
             if not first_err:
@@ -124,12 +211,10 @@ def get_astral_event_date(
     if isinstance(date, datetime.datetime):
         date = dt_util.as_local(date).date()
 
-    kwargs: dict[str, Any] = {"local": False}
-    if event not in ELEVATION_AGNOSTIC_EVENTS:
-        kwargs["observer_elevation"] = elevation
-
     try:
-        return cast(_AstralSunEventCallable, getattr(location, event))(date, **kwargs)
+        return _get_location_astral_event_date(
+            location, elevation, event, date, get_astral_event_cache(hass)
+        )
     except ValueError:
         # Event never occurs for specified date.
         return None
@@ -22,6 +22,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+from time import perf_counter
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
@@ -29,7 +30,7 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import nodes, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -55,6 +56,7 @@ from homeassistant.core import (
     HomeAssistant,
     ServiceResponse,
     State,
+    StateMachine,
     callback,
     split_entity_id,
     valid_domain,
@@ -129,6 +131,51 @@ DOMAIN_STATES_RATE_LIMIT = 1  # seconds
 
 _render_info: ContextVar[RenderInfo | None] = ContextVar("_render_info", default=None)
 
+# Snapshot of the states a template is rendered against outside the event loop
+_states_snapshot: ContextVar[StatesSnapshot | None] = ContextVar(
+    "_states_snapshot", default=None
+)
+
+# Templates which repeatedly take longer than this to render are flagged
+# to be rendered in the executor, see Template.render_in_executor
+SLOW_RENDER_THRESHOLD = 0.02  # seconds
+SLOW_RENDERS_BEFORE_EXECUTOR = 3
+
+# Template functions, filters and tests which read more than the states,
+# like the registries, which may only be accessed from the event loop.
+# Templates using them are never rendered in the executor.
+_LOOP_ONLY_FUNCTIONS = frozenset(
+    {
+        "area_devices",
+        "area_entities",
+        "area_id",
+        "area_name",
+        "areas",
+        "config_entry_attr",
+        "config_entry_id",
+        "device_attr",
+        "device_entities",
+        "device_id",
+        "expand",
+        "floor_areas",
+        "floor_id",
+        "floor_name",
+        "floors",
+        "integration_entities",
+        "is_device_attr",
+        "is_hidden_entity",
+        "issue",
+        "issues",
+        "label_areas",
+        "label_devices",
+        "label_entities",
+        "label_id",
+        "label_name",
+        "labels",
+        "state_translated",
+    }
+)
+
 
 template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "template_cv", default=None
@@ -506,6 +553,10 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_slow_renders",
+        "_loop_only",
+        "render_in_executor",
+        "render_time",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -540,6 +591,12 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._slow_renders: int = 0
+        self._loop_only: bool | None = None
+        # Render in the executor where supported, see async_render_to_info_in_executor
+        self.render_in_executor = False
+        # Duration of the last render in seconds
+        self.render_time: float | None = None
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -629,10 +686,13 @@ class Template:
         if variables is not None:
             kwargs.update(variables)
 
+        start = perf_counter()
         try:
             render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
+        finally:
+            self._record_render_time(perf_counter() - start)
 
         if len(render_result) > MAX_TEMPLATE_OUTPUT:
             raise TemplateError(
@@ -646,6 +706,66 @@ class Template:
 
         return self._parse_result(render_result)
 
+    def _record_render_time(self, render_time: float) -> None:
+        """Record the render time and flag templates which are repeatedly slow."""
+        self.render_time = render_time
+        if render_time < SLOW_RENDER_THRESHOLD:
+            self._slow_renders = 0
+            return
+        self._slow_renders += 1
+        if (
+            self._slow_renders == SLOW_RENDERS_BEFORE_EXECUTOR
+            and not self.render_in_executor
+        ):
+            if self._uses_loop_only_functions():
+                _LOGGER.warning(
+                    (
+                        "Template took %.0f ms to render, more than %.0f ms %d "
+                        "times in a row, it uses functions which must run in the "
+                        "event loop: %s"
+                    ),
+                    render_time * 1000,
+                    SLOW_RENDER_THRESHOLD * 1000,
+                    SLOW_RENDERS_BEFORE_EXECUTOR,
+                    self.template,
+                )
+                return
+            self.render_in_executor = True
+            _LOGGER.warning(
+                (
+                    "Template took %.0f ms to render, more than %.0f ms %d times "
+                    "in a row, it will be rendered in the executor where "
+                    "supported: %s"
+                ),
+                render_time * 1000,
+                SLOW_RENDER_THRESHOLD * 1000,
+                SLOW_RENDERS_BEFORE_EXECUTOR,
+                self.template,
+            )
+
+    def _uses_loop_only_functions(self) -> bool:
+        """Return if the template can only be rendered in the event loop.
+
+        This is the case when it uses functions reading more than the
+        states, or imports or includes other templates which might.
+        """
+        if self._loop_only is None:
+            try:
+                ast = self._env.parse(self.template)
+            except jinja2.TemplateError:
+                self._loop_only = True
+                return True
+            names = {
+                node.name
+                for node in ast.find_all((nodes.Name, nodes.Filter, nodes.Test))
+            }
+            imports = ast.find_all((nodes.Import, nodes.FromImport, nodes.Include))
+            self._loop_only = (
+                not names.isdisjoint(_LOOP_ONLY_FUNCTIONS)
+                or next(imports, None) is not None
+            )
+        return self._loop_only
+
     def _parse_result(self, render_result: str) -> Any:
         """Parse the result."""
         try:
@@ -758,6 +878,43 @@ class Template:
         render_info._freeze()  # noqa: SLF001
         return render_info
 
+    async def async_render_to_info_in_executor(
+        self, variables: TemplateVarsType = None, **kwargs: Any
+    ) -> RenderInfo:
+        """Render the template in the executor and collect an entity filter.
+
+        The template is rendered against a snapshot of the state machine taken
+        when this is called, so the event loop is not blocked while rendering.
+        The template must have been rendered in the event loop before, which
+        binds it to its environment. Templates using functions which read
+        the registries are rendered in the event loop instead.
+        """
+        if not self.hass:
+            raise RuntimeError(f"hass not set while rendering {self}")
+
+        if self.is_static or self._compiled is None or self._uses_loop_only_functions():
+            return self.async_render_to_info(variables, **kwargs)
+
+        render_info = RenderInfo(self)
+        snapshot = StatesSnapshot(self.hass)
+
+        def _render() -> None:
+            snapshot_token = _states_snapshot.set(snapshot)
+            render_info_token = _render_info.set(render_info)
+            try:
+                render_info._result = self.async_render(  # noqa: SLF001
+                    variables, **kwargs
+                )
+            except TemplateError as ex:
+                render_info.exception = ex
+            finally:
+                _render_info.reset(render_info_token)
+                _states_snapshot.reset(snapshot_token)
+
+        await self.hass.async_add_executor_job(_render)
+        render_info._freeze()  # noqa: SLF001
+        return render_info
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -871,6 +1028,49 @@ class Template:
         return f"Template<template=({self.template}) renders={self._renders}>"
 
 
+class StatesSnapshot:
+    """Immutable copy of the states for rendering outside the event loop.
+
+    State objects are immutable, so copying the mapping of the state machine
+    is enough. The domain index is built on first use.
+    """
+
+    __slots__ = ("_domains", "_states")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Copy the states of the state machine."""
+        self._states: dict[str, State] = dict(hass.states._states_data)  # noqa: SLF001
+        self._domains: dict[str, list[State]] | None = None
+
+    def get(self, entity_id: str) -> State | None:
+        """Return the state of entity_id or None if not found."""
+        return self._states.get(entity_id) or self._states.get(entity_id.lower())
+
+    def _domain_states(self, domain: str) -> list[State]:
+        if self._domains is None:
+            self._domains = {}
+            for state in self._states.values():
+                self._domains.setdefault(state.domain, []).append(state)
+        return self._domains.get(domain.lower(), [])
+
+    def async_all(self, domain_filter: str | None = None) -> list[State]:
+        """Return all states or the states of a domain."""
+        if domain_filter is None:
+            return list(self._states.values())
+        return self._domain_states(domain_filter)
+
+    def async_entity_ids_count(self, domain_filter: str | None = None) -> int:
+        """Return the number of states or the number of states of a domain."""
+        if domain_filter is None:
+            return len(self._states)
+        return len(self._domain_states(domain_filter))
+
+
+def _get_states(hass: HomeAssistant) -> StateMachine | StatesSnapshot:
+    """Return the states snapshot being rendered against or the state machine."""
+    return _states_snapshot.get() or hass.states
+
+
 @cache
 def _domain_states(hass: HomeAssistant, name: str) -> DomainStates:
     return DomainStates(hass, name)
@@ -925,7 +1125,7 @@ class AllStates:
     def __len__(self) -> int:
         """Return number of states."""
         self._collect_all_lifecycle()
-        return self._hass.states.async_entity_ids_count()
+        return _get_states(self._hass).async_entity_ids_count()
 
     def __call__(
         self,
@@ -1015,7 +1215,7 @@ class DomainStates:
     def __len__(self) -> int:
         """Return number of states."""
         self._collect_domain_lifecycle()
-        return self._hass.states.async_entity_ids_count(self._domain)
+        return _get_states(self._hass).async_entity_ids_count(self._domain)
 
     def __repr__(self) -> str:
         """Representation of Domain States."""
@@ -1180,7 +1380,7 @@ class TemplateStateFromEntityId(TemplateStateBase):
 
     @property
     def _state(self) -> State:  # type: ignore[override]
-        state = self._hass.states.get(self._entity_id)
+        state = _get_states(self._hass).get(self._entity_id)
         if not state:
             state = State(self._entity_id, STATE_UNKNOWN)
         return state
@@ -1212,7 +1412,9 @@ def _state_generator(
     # ensure it does not get misused.
     #
     container: Iterable[State]
-    if domain is None:
+    if (snapshot := _states_snapshot.get()) is not None:
+        container = snapshot.async_all(domain)
+    elif domain is None:
         container = states._states.values()  # noqa: SLF001
     else:
         container = states.async_all(domain)
@@ -1221,14 +1423,16 @@ def _state_generator(
 
 
 def _get_state_if_valid(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
-    state = hass.states.get(entity_id)
+    state = _get_states(hass).get(entity_id)
     if state is None and not valid_entity_id(entity_id):
         raise TemplateError(f"Invalid entity ID '{entity_id}'")
     return _get_template_state_from_state(hass, entity_id, state)
 
 
 def _get_state(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
-    return _get_template_state_from_state(hass, entity_id, hass.states.get(entity_id))
+    return _get_template_state_from_state(
+        hass, entity_id, _get_states(hass).get(entity_id)
+    )
 
 
 def _get_template_state_from_state(
@@ -7,6 +7,7 @@ from collections.abc import Callable, Coroutine, Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from functools import wraps
+import sys
 from typing import Any
 
 from homeassistant.core import ServiceResponse
@@ -70,14 +71,28 @@ class TraceElement:
         if variables is None:
             variables = {}
         last_variables = self._last_variables
-        variables_cv.set(dict(variables))
         changed_variables = {
             key: value
             for key, value in variables.items()
             if key not in last_variables or last_variables[key] != value
         }
+        # The snapshot is shared by the following elements until the
+        # variables change, then it is replaced by a new copy
+        if changed_variables or len(variables) != len(last_variables):
+            variables_cv.set(dict(variables))
         self._variables = changed_variables
 
+    def estimate_size(self) -> int:
+        """Return a rough estimate of the memory used by this TraceElement."""
+        size = sys.getsizeof(self) + sys.getsizeof(self._variables)
+        for value in self._variables.values():
+            size += sys.getsizeof(value)
+        if self._result is not None:
+            size += sys.getsizeof(self._result)
+            for value in self._result.values():
+                size += sys.getsizeof(value)
+        return size
+
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this TraceElement."""
         result: dict[str, Any] = {"path": self.path, "timestamp": self._timestamp}
@@ -97,8 +112,11 @@ class TraceElement:
         return result
 
 
+# The trace of a context where tracing is disabled, nothing is added to it
+_TRACE_DISABLED: dict[str, deque[TraceElement]] = {}
+
 # Context variables for tracing
-# Current trace
+# Current trace, or _TRACE_DISABLED
 trace_cv: ContextVar[dict[str, deque[TraceElement]] | None] = ContextVar(
     "trace_cv", default=None
 )
@@ -132,10 +150,22 @@ def trace_id_get() -> tuple[str, str] | None:
     return trace_id_cv.get()
 
 
+def trace_collected() -> bool:
+    """Return if a trace is collected in the current context."""
+    return (trace := trace_cv.get()) is not None and trace is not _TRACE_DISABLED
+
+
+def trace_disabled() -> bool:
+    """Return if tracing is disabled in the current context."""
+    return trace_cv.get() is _TRACE_DISABLED
+
+
 def trace_stack_push[_T](
     trace_stack_var: ContextVar[list[_T] | None], node: _T
 ) -> None:
     """Push an element to the top of a trace stack."""
+    if trace_cv.get() is _TRACE_DISABLED:
+        return
     trace_stack: list[_T] | None
     if (trace_stack := trace_stack_var.get()) is None:
         trace_stack = []
@@ -183,7 +213,9 @@ def trace_append_element(
     maxlen: int | None = None,
 ) -> None:
     """Append a TraceElement to trace[path]."""
-    if (trace := trace_cv.get()) is None:
+    if (trace := trace_cv.get()) is _TRACE_DISABLED:
+        return
+    if trace is None:
         trace = {}
         trace_cv.set(trace)
     if (path := trace_element.path) not in trace:
@@ -195,7 +227,9 @@ def trace_get(clear: bool = True) -> dict[str, deque[TraceElement]] | None:
     """Return the current trace."""
     if clear:
         trace_clear()
-    return trace_cv.get()
+    if (trace := trace_cv.get()) is _TRACE_DISABLED:
+        return None
+    return trace
 
 
 def trace_clear() -> None:
@@ -207,6 +241,16 @@ def trace_clear() -> None:
     script_execution_cv.set(StopReason())
 
 
+def trace_disable() -> None:
+    """Stop collecting a trace in the current context.
+
+    No trace elements are created until the trace is cleared again, and
+    conditions are evaluated without any tracing overhead.
+    """
+    trace_clear()
+    trace_cv.set(_TRACE_DISABLED)
+
+
 def trace_set_child_id(child_key: str, child_run_id: str) -> None:
     """Set child trace_id of TraceElement at the top of the stack."""
     if node := trace_stack_top(trace_stack_cv):
@@ -8,21 +8,31 @@ from collections.abc import Callable
 from contextlib import suppress
 import logging
 from timeit import default_timer as timer
+import tracemalloc
+
+import voluptuous as vol
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import condition, config_validation as cv
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.schema_compiler import compile_schema
+from homeassistant.helpers.trace import trace_clear, trace_disable
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
 
 BENCHMARKS: dict[str, Callable] = {}
 
+# Memory used by each state in the state machine we aim to stay below,
+# including its attributes, context and the index entries for it
+STATE_MEMORY_TARGET = 1500
+
 
 def run(args):
     """Handle benchmark commandline script."""
@@ -308,3 +318,177 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def state_memory(hass):
+    """Set 10k entities 100 times and measure the memory used per state."""
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(10**4)]
+    attributes = {"friendly_name": "Benchmark sensor", "unit_of_measurement": "W"}
+    async_set = hass.states.async_set
+
+    start = timer()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for value in range(100):
+        for entity_id in entity_ids:
+            async_set(entity_id, str(value), attributes)
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    runtime = timer() - start
+
+    per_state = used / len(entity_ids)
+    result = "PASS" if per_state <= STATE_MEMORY_TARGET else "FAIL"
+    print(
+        f"Memory per state: {per_state:.0f} bytes"
+        f" (target {STATE_MEMORY_TARGET} bytes): {result}"
+    )
+    assert len(hass.states.async_all()) == len(entity_ids)
+    return runtime
+
+
+@benchmark
+async def service_call_validation(hass):
+    """Validate 100k light.turn_on and climate.set_temperature service calls."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.climate import SET_TEMPERATURE_SCHEMA
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.light import LIGHT_TURN_ON_SCHEMA
+
+    calls = 10**5
+    payloads = {
+        "light.turn_on": (
+            vol.All(cv.make_entity_service_schema(LIGHT_TURN_ON_SCHEMA)),
+            {"entity_id": "light.kitchen", "brightness_pct": 50, "transition": 2},
+        ),
+        "climate.set_temperature": (
+            SET_TEMPERATURE_SCHEMA,
+            {"entity_id": "climate.living_room", "temperature": 21.5},
+        ),
+    }
+
+    total = 0.0
+    for service, (schema, payload) in payloads.items():
+        for name, validator in (
+            ("voluptuous", schema),
+            ("compiled", compile_schema(schema)),
+        ):
+            start = timer()
+            for _ in range(calls):
+                validator(payload)
+            runtime = timer() - start
+            total += runtime
+            print(f"{service} {name}: {calls / runtime:.0f} calls per second")
+
+    return total
+
+
+@benchmark
+async def automation_conditions(hass):
+    """Evaluate 12 automation conditions 10k times with and without tracing."""
+    for idx in range(8):
+        hass.states.async_set(f"binary_sensor.motion_{idx}", "on")
+    hass.states.async_set("sensor.temperature", "21.5")
+    hass.states.async_set("input_boolean.guest_mode", "off")
+
+    configs = [
+        {
+            "condition": "template",
+            "value_template": "{{ states('sensor.temperature') | float > 18 }}",
+        },
+        {
+            "condition": "template",
+            "value_template": "{{ is_state('binary_sensor.motion_0', 'on') }}",
+        },
+        {
+            "condition": "numeric_state",
+            "entity_id": "sensor.temperature",
+            "above": 15,
+            "below": 30,
+        },
+        {"condition": "trigger", "id": "motion"},
+        *(
+            {
+                "condition": "state",
+                "entity_id": f"binary_sensor.motion_{idx}",
+                "state": "on",
+            }
+            for idx in range(7)
+        ),
+        # Fails last in the configured order, but is cheap to check
+        {"condition": "state", "entity_id": "input_boolean.guest_mode", "state": "on"},
+    ]
+    configs = await condition.async_validate_conditions_config(
+        hass, cv.CONDITIONS_SCHEMA(configs)
+    )
+    check = await condition.async_conditions_from_config(
+        hass, configs, logging.getLogger(__name__), "benchmark"
+    )
+    variables = {"trigger": {"id": "motion"}}
+    evaluations = 10**4
+
+    total = 0.0
+    for name, prepare in (("traced", trace_clear), ("untraced", trace_disable)):
+        start = timer()
+        for _ in range(evaluations):
+            prepare()
+            assert check(variables) is False
+        runtime = timer() - start
+        total += runtime
+        print(f"{name}: {evaluations / runtime:.0f} evaluations per second")
+
+    return total
+
+
+@benchmark
+async def script_run(hass):
+    """Run a script with 6 steps 10k times and measure the time per run."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import entity_registry as er
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.script import Script
+
+    await er.async_load(hass)
+    logging.getLogger("homeassistant.helpers.script").setLevel(logging.WARNING)
+    calls = 0
+
+    @core.callback
+    def service_handler(call):
+        nonlocal calls
+        calls += 1
+
+    hass.services.async_register("light", "turn_on", service_handler)
+    hass.states.async_set("sensor.temperature", "21.5")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"variables": {"brightness": 100}},
+            {"condition": "state", "entity_id": "sensor.temperature", "state": "21.5"},
+            {
+                "action": "light.turn_on",
+                "target": {"entity_id": ["light.kitchen", "light.living_room"]},
+                "data": {"brightness": 255, "transition": 2},
+            },
+            {
+                "action": "light.turn_on",
+                "target": {"entity_id": "light.hallway"},
+                "data": {"brightness": "{{ brightness }}"},
+            },
+            {"delay": 0},
+            {"event": "benchmark_event", "event_data": {"source": "benchmark"}},
+        ]
+    )
+    script = Script(hass, sequence, "benchmark", "benchmark")
+    runs = 10**4
+
+    start = timer()
+    for _ in range(runs):
+        trace_disable()
+        await script.async_run(context=core.Context())
+    runtime = timer() - start
+    assert calls == 2 * runs
+
+    print(f"{runtime / runs * 10**6:.0f} µs per run")
+    return runtime
@@ -132,6 +132,8 @@ async def test_diagnostics(
                     }
                 }
             },
+            "callbacks": [],
+            "passive_update_processors": [],
             "manager": {
                 "adapters": {
                     "hci0": {
@@ -290,6 +292,8 @@ async def test_diagnostics_macos(
                     "vendor_id": "Unknown",
                 }
             },
+            "callbacks": [],
+            "passive_update_processors": [],
             "manager": {
                 "adapters": {
                     "Core Bluetooth": {
@@ -483,6 +487,8 @@ async def test_diagnostics_remote_adapter(
                 }
             },
             "dbus": {},
+            "callbacks": [],
+            "passive_update_processors": [],
             "manager": {
                 "adapters": {
                     "hci0": {
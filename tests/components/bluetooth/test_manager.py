@@ -48,6 +48,7 @@ from . import (
     _get_manager,
     generate_advertisement_data,
     generate_ble_device,
+    inject_advertisement,
     inject_advertisement_with_source,
     inject_advertisement_with_time_and_source,
     inject_advertisement_with_time_and_source_connectable,
@@ -1660,3 +1661,69 @@ async def test_bluetooth_rediscover_no_match(
     cancel()
     unsetup_connectable_scanner()
     cancel_connectable_scanner()
+
+
+@pytest.mark.usefixtures("enable_bluetooth")
+async def test_callback_dispatch_counts(hass: HomeAssistant) -> None:
+    """Test the number of dispatches of each callback is tracked."""
+    manager = _get_manager()
+    address = "44:44:33:11:23:45"
+    device = generate_ble_device(address, "wohand")
+
+    @callback
+    def _matching_callback(
+        service_info: BluetoothServiceInfo, change: BluetoothChange
+    ) -> None:
+        """Handle a matching advertisement."""
+
+    @callback
+    def _other_callback(
+        service_info: BluetoothServiceInfo, change: BluetoothChange
+    ) -> None:
+        """Handle an advertisement that is never matched."""
+
+    cancel_matching = bluetooth.async_register_callback(
+        hass,
+        _matching_callback,
+        {"manufacturer_id": 1, "connectable": False},
+        BluetoothScanningMode.ACTIVE,
+    )
+    cancel_other = bluetooth.async_register_callback(
+        hass,
+        _other_callback,
+        {"manufacturer_id": 2, "connectable": False},
+        BluetoothScanningMode.ACTIVE,
+    )
+
+    for data in (b"\x01", b"\x02"):
+        inject_advertisement(
+            hass,
+            device,
+            generate_advertisement_data(
+                local_name="wohand", manufacturer_data={1: data}
+            ),
+        )
+
+    assert manager.async_callback_diagnostics() == [
+        {
+            "callback": f"{__name__}.test_callback_dispatch_counts."
+            "<locals>._matching_callback",
+            "matcher": {"manufacturer_id": 1, "connectable": False},
+            "dispatches": 2,
+        },
+        {
+            "callback": f"{__name__}.test_callback_dispatch_counts."
+            "<locals>._other_callback",
+            "matcher": {"manufacturer_id": 2, "connectable": False},
+            "dispatches": 0,
+        },
+    ]
+
+    cancel_other()
+    assert [item["matcher"] for item in manager.async_callback_diagnostics()] == [
+        {"manufacturer_id": 1, "connectable": False}
+    ]
+    # The empty bucket of the removed callback is dropped from the index
+    assert manager._callback_index.manufacturer_id_set == {1}
+    cancel_matching()
+    assert manager.async_callback_diagnostics() == []
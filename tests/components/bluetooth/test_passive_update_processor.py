@@ -560,6 +560,87 @@ async def test_no_updates_once_stopping(hass: HomeAssistant) -> None:
     cancel_coordinator()
 
 
+def _generic_service_info_at(
+    manufacturer_data: dict[int, bytes], at: float
+) -> BluetoothServiceInfoBleak:
+    """Return a generic service info with manufacturer data seen at a time."""
+    return BluetoothServiceInfoBleak(
+        name="Generic",
+        address="aa:bb:cc:dd:ee:ff",
+        rssi=-95,
+        manufacturer_data=manufacturer_data,
+        service_data={},
+        service_uuids=[],
+        source="local",
+        time=at,
+        device=MagicMock(),
+        advertisement=MagicMock(),
+        connectable=True,
+        tx_power=0,
+    )
+
+
+@pytest.mark.usefixtures("mock_bleak_scanner_start", "mock_bluetooth_adapters")
+async def test_skip_duplicates_and_min_update_interval(hass: HomeAssistant) -> None:
+    """Test duplicate and too frequent advertisements are dropped before parsing."""
+    await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    parsed = []
+
+    @callback
+    def _mock_update_method(
+        service_info: BluetoothServiceInfo,
+    ) -> dict[str, str]:
+        parsed.append(service_info)
+        return {"test": "data"}
+
+    coordinator = PassiveBluetoothProcessorCoordinator(
+        hass,
+        _LOGGER,
+        "aa:bb:cc:dd:ee:ff",
+        BluetoothScanningMode.ACTIVE,
+        _mock_update_method,
+        skip_duplicates=True,
+        min_update_interval=timedelta(seconds=10),
+    )
+    cancel_coordinator = coordinator.async_start()
+    now = time.monotonic()
+
+    for manufacturer_data, at in (
+        ({1: b"\x01"}, now),
+        # Same payload
+        ({1: b"\x01"}, now + 1),
+        # Changed payload within the interval
+        ({1: b"\x02"}, now + 2),
+        ({1: b"\x02"}, now + 11),
+        ({1: b"\x02"}, now + 30),
+    ):
+        coordinator._async_handle_bluetooth_event(
+            _generic_service_info_at(manufacturer_data, at),
+            BluetoothChange.ADVERTISEMENT,
+        )
+
+    assert [service_info.time for service_info in parsed] == [now, now + 11]
+    assert coordinator.async_get_diagnostics() == {
+        "address": "aa:bb:cc:dd:ee:ff",
+        "skip_duplicates": True,
+        "min_update_interval": 10.0,
+        "processed": 2,
+        "duplicates": 2,
+        "rate_limited": 1,
+    }
+
+    # Advertisements of a device that was unavailable are always processed
+    coordinator._async_handle_unavailable(
+        _generic_service_info_at({1: b"\x02"}, now + 31)
+    )
+    coordinator._async_handle_bluetooth_event(
+        _generic_service_info_at({1: b"\x02"}, now + 32),
+        BluetoothChange.ADVERTISEMENT,
+    )
+    assert len(parsed) == 3
+    cancel_coordinator()
+
+
 @pytest.mark.usefixtures("mock_bleak_scanner_start", "mock_bluetooth_adapters")
 async def test_exception_from_update_method(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
@@ -7,7 +7,7 @@ import pytest
 
 from homeassistant.components.websocket_api import TYPE_RESULT
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, service
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
@@ -268,6 +268,34 @@ async def test_download_diagnostics(
     }
 
 
+async def test_download_diagnostics_service_call_limiter(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the service call limiter statistics are included in diagnostics."""
+    config_entry = MockConfigEntry(domain="fake_integration")
+    config_entry.add_to_hass(hass)
+    limiter = service.ServiceCallLimiter(hass, 2, None)
+    hass.data[service.DATA_SERVICE_CALL_LIMITERS] = {"fake_integration": limiter}
+
+    async def call() -> None:
+        pass
+
+    await limiter.async_run("caller", call())
+
+    response = await _get_diagnostics_for_config_entry(hass, hass_client, config_entry)
+    assert response["service_call_limiter"] == {
+        "max_concurrent": 2,
+        "calls_per_second": None,
+        "active": 0,
+        "waiting": 0,
+        "calls": 1,
+        "queued_calls": 0,
+        "nested_calls": 0,
+        "total_wait_time": 0.0,
+        "max_wait_time": 0.0,
+    }
+
+
 async def test_failure_scenarios(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
@@ -0,0 +1,21 @@
+"""Test the Energy system health."""
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_system_health_info(recorder_mock: Recorder, hass: HomeAssistant) -> None:
+    """Test system health info endpoint."""
+    assert await async_setup_component(hass, "energy", {})
+    assert await async_setup_component(hass, "system_health", {})
+    await hass.async_block_till_done()
+    info = await get_system_health_info(hass, "energy")
+    assert info == {
+        "cached_results": 0,
+        "cache_hits": 0,
+        "cache_misses": 0,
+        "cache_hit_rate": 0,
+    }
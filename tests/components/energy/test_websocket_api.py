@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from homeassistant.components.energy import data, is_configured
+from homeassistant.components.energy import data, is_configured, websocket_api
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.statistics import async_add_external_statistics
 from homeassistant.core import HomeAssistant
@@ -1159,3 +1159,119 @@ async def test_fossil_energy_consumption_check_missing_hour(
         hour3.isoformat(),
         hour4.isoformat(),
     ]
+
+
+async def test_fossil_energy_consumption_cache(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test fossil_energy_consumption results are cached until statistics change."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 01:00:00"))
+    period3 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 02:00:00"))
+    end = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 02:00:00"))
+    energy_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    co2_metadata = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": "Fossil percentage",
+        "source": "test",
+        "statistic_id": "test:fossil_percentage",
+        "unit_of_measurement": "%",
+    }
+    other_metadata = {**energy_metadata, "statistic_id": "test:other_energy"}
+    async_add_external_statistics(
+        hass,
+        energy_metadata,
+        (
+            {"start": period1, "last_reset": None, "state": 0, "sum": 2},
+            {"start": period2, "last_reset": None, "state": 1, "sum": 3},
+        ),
+    )
+    async_add_external_statistics(
+        hass,
+        co2_metadata,
+        (
+            {"start": period1, "last_reset": None, "mean": 10},
+            {"start": period2, "last_reset": None, "mean": 30},
+        ),
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    msg_id = 0
+
+    async def _fossil_energy_consumption() -> dict[str, float]:
+        nonlocal msg_id
+        msg_id += 1
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "energy/fossil_energy_consumption",
+                "start_time": period1.isoformat(),
+                "end_time": end.isoformat(),
+                "energy_statistic_ids": ["test:total_energy_import"],
+                "co2_statistic_id": "test:fossil_percentage",
+                "period": "hour",
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return response["result"]
+
+    expected = {
+        period1.isoformat(): pytest.approx(2.0 * 0.1),
+        period2.isoformat(): pytest.approx(1.0 * 0.3),
+    }
+    result_cache = websocket_api.async_get_result_cache(hass)
+    assert await _fossil_energy_consumption() == expected
+    assert (result_cache.hits, result_cache.misses) == (0, 1)
+    assert await _fossil_energy_consumption() == expected
+    assert (result_cache.hits, result_cache.misses) == (1, 1)
+
+    # Statistics of other statistic_ids or after the end don't change the result
+    async_add_external_statistics(
+        hass,
+        other_metadata,
+        ({"start": period1, "last_reset": None, "state": 0, "sum": 5},),
+    )
+    async_add_external_statistics(
+        hass,
+        energy_metadata,
+        ({"start": period3, "last_reset": None, "state": 2, "sum": 10},),
+    )
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    assert await _fossil_energy_consumption() == expected
+    assert (result_cache.hits, result_cache.misses) == (2, 1)
+
+    # Changed statistics of the statistic_ids drop the result
+    async_add_external_statistics(
+        hass,
+        co2_metadata,
+        ({"start": period2, "last_reset": None, "mean": 50},),
+    )
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    assert await _fossil_energy_consumption() == {
+        period1.isoformat(): pytest.approx(2.0 * 0.1),
+        period2.isoformat(): pytest.approx(1.0 * 0.5),
+    }
+    assert (result_cache.hits, result_cache.misses) == (2, 2)
+    assert await _fossil_energy_consumption()
+    assert result_cache.async_get_info() == {
+        "cached_results": 1,
+        "cache_hits": 3,
+        "cache_misses": 2,
+        "cache_hit_rate": 60.0,
+    }
@@ -5,6 +5,7 @@ from datetime import timedelta
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import history
@@ -916,6 +917,63 @@ async def test_history_stream_live_no_attributes_minimal_response(
     }
 
 
+async def test_history_stream_live_shared_between_streams(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test live states are converted once for all the streams they are sent to."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    clients = []
+    for msg_id in (1, 2):
+        client = await hass_ws_client()
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one"],
+                "start_time": now.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["states"]["sensor.one"][0]["s"] == "on"
+        clients.append(client)
+
+    await async_recorder_block_till_done(hass)
+    with patch.object(
+        websocket_api,
+        "_history_compressed_state",
+        wraps=websocket_api._history_compressed_state,
+    ) as compressed_state_mock:
+        hass.states.async_set("sensor.one", "one", attributes={"any": "attr"})
+        hass.states.async_set("sensor.one", "two", attributes={"any": "attr"})
+        await async_recorder_block_till_done(hass)
+        for msg_id, client in zip((1, 2), clients, strict=True):
+            response = await client.receive_json()
+            assert response == {
+                "event": {
+                    "states": {
+                        "sensor.one": [
+                            {"lu": ANY, "s": "one"},
+                            {"lu": ANY, "s": "two"},
+                        ],
+                    },
+                },
+                "id": msg_id,
+                "type": "event",
+            }
+    assert compressed_state_mock.call_count == 2
+
+
 async def test_history_stream_live(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2154,3 +2212,224 @@ async def test_history_stream_live_chained_events(
         "id": 1,
         "type": "event",
     }
+
+
+async def test_history_stream_historical_in_chunks(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test historical windows are sent in chunks of HISTORY_CHUNK_ROWS states."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    end_time = dt_util.utcnow()
+    start_time = end_time - timedelta(days=3)
+
+    freezer.move_to(start_time + timedelta(hours=1))
+    hass.states.async_set("sensor.one", "on")
+    await async_recorder_block_till_done(hass)
+    freezer.move_to(start_time + timedelta(days=1))
+    hass.states.async_set("sensor.one", "off")
+    await async_recorder_block_till_done(hass)
+    freezer.move_to(start_time + timedelta(days=2, hours=1))
+    hass.states.async_set("sensor.two", "on")
+    await async_wait_recording_done(hass)
+    freezer.move_to(end_time + timedelta(seconds=1))
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "HISTORY_CHUNK_ROWS", 1):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": False,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        states = []
+        for _ in range(3):
+            response = await client.receive_json()
+            assert response["type"] == "event"
+            states.append(response["event"]["states"])
+
+    assert states == [
+        {
+            "sensor.one": [
+                {
+                    "lu": pytest.approx((start_time + timedelta(hours=1)).timestamp()),
+                    "s": "on",
+                }
+            ]
+        },
+        {
+            "sensor.one": [
+                {
+                    "lu": pytest.approx((start_time + timedelta(days=1)).timestamp()),
+                    "s": "off",
+                }
+            ]
+        },
+        {
+            "sensor.two": [
+                {
+                    "lu": pytest.approx(
+                        (start_time + timedelta(days=2, hours=1)).timestamp()
+                    ),
+                    "s": "on",
+                }
+            ]
+        },
+    ]
+
+
+async def test_history_during_period_max_points(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test history_during_period downsamples to max_points."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    # Align the start so the window is split into two buckets of 40 seconds
+    start_ts = (int(dt_util.utcnow().timestamp()) // 1000 + 1) * 1000
+
+    def _set_state(offset: int, state: str) -> None:
+        freezer.move_to(dt_util.utc_from_timestamp(start_ts + offset))
+        hass.states.async_set("sensor.temperature", state)
+
+    for offset in range(1, 31):
+        _set_state(offset, str(offset * 7 % 23))
+    _set_state(35, "unavailable")
+    for offset in range(41, 71):
+        _set_state(offset, str(offset * 7 % 23))
+    await async_wait_recording_done(hass)
+    freezer.move_to(dt_util.utc_from_timestamp(start_ts + 100))
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": dt_util.utc_from_timestamp(start_ts).isoformat(),
+            "end_time": dt_util.utc_from_timestamp(start_ts + 80).isoformat(),
+            "entity_ids": ["sensor.temperature"],
+            "include_start_time_state": False,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "max_points": 8,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert [
+        (state["s"], round(state["lu"] - start_ts))
+        for state in response["result"]["sensor.temperature"]
+    ] == [
+        # First, maximum, minimum and last of the first bucket
+        ("7", 1),
+        ("22", 13),
+        ("0", 23),
+        ("3", 30),
+        ("unavailable", 35),
+        # First, minimum, maximum and last of the second bucket
+        ("11", 41),
+        ("0", 46),
+        ("22", 59),
+        ("7", 70),
+    ]
+
+
+async def test_history_during_period_chunked(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test history_during_period sends chunks of HISTORY_CHUNK_ROWS states."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    end_time = dt_util.utcnow()
+    start_time = end_time - timedelta(days=1)
+    first_time = start_time + timedelta(hours=1)
+    second_time = start_time + timedelta(hours=2)
+
+    # More states than fit in a chunk with the same last_updated time
+    freezer.move_to(first_time)
+    hass.states.async_set("sensor.one", "on")
+    hass.states.async_set("sensor.two", "on")
+    await async_recorder_block_till_done(hass)
+    freezer.move_to(second_time)
+    hass.states.async_set("sensor.one", "off")
+    await async_wait_recording_done(hass)
+    freezer.move_to(end_time + timedelta(seconds=1))
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "HISTORY_CHUNK_ROWS", 1):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": False,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] is None
+
+        events = []
+        while not events or not events[-1]["complete"]:
+            response = await client.receive_json()
+            assert response["type"] == "event"
+            events.append(response["event"])
+
+    assert [state for event in events for state in event["states"].items()] == [
+        ("sensor.one", [{"lu": pytest.approx(first_time.timestamp()), "s": "on"}]),
+        ("sensor.two", [{"lu": pytest.approx(first_time.timestamp()), "s": "on"}]),
+        ("sensor.one", [{"lu": pytest.approx(second_time.timestamp()), "s": "off"}]),
+    ]
+    assert [event["complete"] for event in events[:-1]] == [False] * (len(events) - 1)
+
+
+async def test_history_during_period_chunked_empty(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test chunked history_during_period with a start time in the future."""
+    await async_setup_component(hass, "history", {})
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "entity_ids": ["sensor.one"],
+            "start_time": (dt_util.utcnow() + timedelta(hours=1)).isoformat(),
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+    response = await client.receive_json()
+    assert response["event"] == {"states": {}, "complete": True}
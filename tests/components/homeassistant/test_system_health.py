@@ -0,0 +1,67 @@
+"""Test the Home Assistant system health."""
+
+from homeassistant.components import automation
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_system_health_info_state_triggers(hass: HomeAssistant) -> None:
+    """Test system health reports how often state triggers were evaluated."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": alias,
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": to_state,
+                    },
+                    "action": {"event": "test_event"},
+                }
+                for alias, to_state in (("to_on", "on"), ("to_off", "off"))
+            ]
+        },
+    )
+    assert await async_setup_component(hass, "system_health", {})
+    await hass.async_block_till_done()
+
+    for state in ("on", "off", "on"):
+        hass.states.async_set("test.entity", state)
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, "homeassistant")
+    assert info["state_triggers"] == 2
+    assert info["state_trigger_evaluations"] == 3
+    assert info["most_evaluated_state_triggers"] == "to_on (2), to_off (1)"
+
+
+async def test_system_health_info_time_pattern(hass: HomeAssistant) -> None:
+    """Test system health reports the time pattern timers per integration."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "system_health", {})
+    await hass.async_block_till_done()
+
+    unsubs = [
+        async_track_utc_time_change(hass, callback(lambda now: None), minute="/5")
+        for _ in range(3)
+    ]
+    unsubs.append(
+        async_track_utc_time_change(hass, callback(lambda now: None), second=30)
+    )
+
+    info = await get_system_health_info(hass, "homeassistant")
+    assert info["time_pattern_timers"] == 2
+    assert info["time_pattern_listeners"] == "homeassistant (4)"
+
+    for unsub in unsubs:
+        unsub()
+    info = await get_system_health_info(hass, "homeassistant")
+    assert info["time_pattern_timers"] == 0
+    assert info["time_pattern_listeners"] == ""
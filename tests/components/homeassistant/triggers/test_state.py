@@ -1,5 +1,6 @@
 """The test for state automation."""
 
+from collections.abc import Callable
 from datetime import timedelta
 from unittest.mock import patch
 
@@ -14,7 +15,14 @@ from homeassistant.const import (
     SERVICE_TURN_OFF,
     STATE_UNAVAILABLE,
 )
-from homeassistant.core import Context, HomeAssistant, ServiceCall
+from homeassistant.core import (
+    Context,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
 from homeassistant.helpers import entity_registry as er
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -1771,3 +1779,117 @@ async def test_variables_priority(
     await hass.async_block_till_done()
     assert len(service_calls) == 2
     assert service_calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_state_trigger_index(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test state changes are only evaluated by triggers that can match."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": "to_on",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": ["on", "open"],
+                    },
+                    "action": {"service": "test.automation"},
+                },
+                {
+                    "alias": "attribute",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "attribute": "brightness",
+                    },
+                    "action": {"service": "test.automation"},
+                },
+                {
+                    "alias": "not_to",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "not_to": "on",
+                    },
+                    "action": {"service": "test.automation"},
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    def evaluations() -> dict[str, int]:
+        return {
+            stats["name"]: stats["evaluations"]
+            for stats in state_trigger.async_get_state_trigger_index(
+                hass
+            ).async_get_stats()
+        }
+
+    hass.states.async_set("test.entity", "off")
+    await hass.async_block_till_done()
+    assert evaluations() == {
+        "to_on": 0,
+        "attribute": 0,
+        "not_to": 1,
+    }
+    assert len(service_calls) == 1
+
+    hass.states.async_set("test.entity", "on", {"brightness": 10})
+    await hass.async_block_till_done()
+    assert evaluations() == {
+        "to_on": 1,
+        "attribute": 1,
+        "not_to": 2,
+    }
+    assert len(service_calls) == 3
+
+    hass.states.async_set("test.entity", "on", {"brightness": 10, "color": "red"})
+    await hass.async_block_till_done()
+    assert evaluations() == {
+        "to_on": 2,
+        "attribute": 1,
+        "not_to": 3,
+    }
+    assert len(service_calls) == 3
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert state_trigger.async_get_state_trigger_index(hass).async_get_stats() == []
+
+
+async def test_state_trigger_index_dispatch_order(hass: HomeAssistant) -> None:
+    """Test the order state triggers of an entity are called in.
+
+    Triggers are called by bucket, not in the order they were attached:
+    first the triggers of the new state, then the triggers of attributes
+    that changed and last the triggers that cannot be indexed.
+    """
+    index = state_trigger.async_get_state_trigger_index(hass)
+    called: list[str] = []
+
+    def listener(name: str) -> Callable[[Event[EventStateChangedData]], None]:
+        @callback
+        def _listener(event: Event[EventStateChangedData]) -> None:
+            called.append(name)
+
+        return _listener
+
+    index.async_add("all_1", "test.entity", listener("all_1"))
+    index.async_add(
+        "attribute", "test.entity", listener("attribute"), attribute="brightness"
+    )
+    index.async_add("to_on", "test.entity", listener("to_on"), to_states=["on"])
+    index.async_add("all_2", "test.entity", listener("all_2"))
+
+    hass.states.async_set("test.entity", "on", {"brightness": 10})
+    await hass.async_block_till_done()
+    assert called == ["to_on", "attribute", "all_1", "all_2"]
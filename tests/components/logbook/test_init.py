@@ -4,9 +4,10 @@ import asyncio
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
@@ -17,11 +18,18 @@ from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook.models import EventAsRow, LazyEventPartialState
 from homeassistant.components.logbook.processor import EventProcessor
+from homeassistant.components.logbook.queries import (
+    devices_references_stmt,
+    entities_references_stmt,
+)
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import EventReferences
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.const import (
+    ATTR_DEVICE_ID,
     ATTR_DOMAIN,
     ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
@@ -156,6 +164,60 @@ async def test_service_call_create_logbook_entry_invalid_entity_id(
     assert events[0][logbook.ATTR_MESSAGE] == "is triggered"
 
 
+@pytest.mark.usefixtures("recorder_mock")
+async def test_get_events_before_event_references(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test events recorded before the event references are matched by their data."""
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_block_till_done()
+    now = dt_util.utcnow()
+
+    for name, fired in (
+        ("Old", now - timedelta(hours=2)),
+        ("New", now - timedelta(hours=1)),
+        ("Newer", now - timedelta(minutes=30)),
+    ):
+        freezer.move_to(fired)
+        hass.bus.async_fire(
+            logbook.EVENT_LOGBOOK_ENTRY,
+            {
+                logbook.ATTR_NAME: name,
+                logbook.ATTR_MESSAGE: "is triggered",
+                logbook.ATTR_ENTITY_ID: "switch.test_switch",
+                ATTR_DEVICE_ID: "abc123",
+            },
+        )
+        await async_wait_recording_done(hass)
+        if name == "Old":
+            # Events recorded before upgrading the database are not referenced
+            with session_scope(hass=hass) as session:
+                session.query(EventReferences).delete()
+    freezer.move_to(now)
+
+    for kwargs, references_stmt in (
+        ({"entity_ids": ["switch.test_switch"]}, entities_references_stmt),
+        ({"device_ids": ["abc123"]}, devices_references_stmt),
+    ):
+        event_processor = EventProcessor(hass, (EVENT_LOGBOOK_ENTRY,), **kwargs)
+        with patch(
+            f"homeassistant.components.logbook.queries.{references_stmt.__name__}",
+            wraps=references_stmt,
+        ) as references_stmt_mock:
+            events = event_processor.get_events(now - timedelta(hours=3), now)
+            assert [event[logbook.ATTR_NAME] for event in events] == [
+                "Old",
+                "New",
+                "Newer",
+            ]
+            assert references_stmt_mock.call_count == 0
+
+            # The references cover the events since the first referenced one
+            events = event_processor.get_events(now - timedelta(hours=1), now)
+            assert [event[logbook.ATTR_NAME] for event in events] == ["Newer"]
+            assert references_stmt_mock.call_count == 1
+
+
 async def test_service_call_create_log_book_entry_no_message(
     hass_: HomeAssistant,
 ) -> None:
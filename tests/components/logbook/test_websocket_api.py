@@ -1468,6 +1468,58 @@ async def test_subscribe_unsubscribe_logbook_stream(
 
 
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_logbook_stream_live_shared_between_streams(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test live events are humanified once for all the streams they are sent to."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("light.small", STATE_ON)
+    await async_wait_recording_done(hass)
+
+    websocket_clients = []
+    for msg_id in (7, 8):
+        websocket_client = await hass_ws_client()
+        await websocket_client.send_json(
+            {
+                "id": msg_id,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.small"],
+            }
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["event"]["partial"] is True
+        await get_instance(hass).async_block_till_done()
+        await hass.async_block_till_done()
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert "partial" not in msg["event"]
+        websocket_clients.append(websocket_client)
+
+    with patch.object(
+        websocket_api, "async_event_to_row", wraps=websocket_api.async_event_to_row
+    ) as event_to_row_mock:
+        hass.states.async_set("light.small", STATE_OFF)
+        await get_instance(hass).async_block_till_done()
+        await hass.async_block_till_done()
+        for msg_id, websocket_client in zip((7, 8), websocket_clients, strict=True):
+            msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+            assert msg["id"] == msg_id
+            assert msg["type"] == "event"
+            assert msg["event"]["events"] == [
+                {"entity_id": "light.small", "state": "off", "when": ANY}
+            ]
+    assert event_to_row_mock.call_count == 1
+
+
 async def test_subscribe_unsubscribe_logbook_stream_entities(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -0,0 +1,70 @@
+"""Test adapting the recorder to the load on the database."""
+
+from homeassistant.components.recorder.backpressure import (
+    CommitIntervalController,
+    Histogram,
+)
+
+
+def test_commit_interval_controller() -> None:
+    """Test the commit interval is widened when busy and shrunk when idle."""
+    controller = CommitIntervalController(5, 1)
+    assert (controller.min_interval, controller.max_interval) == (1, 30)
+    assert controller.interval == 5
+
+    # A large backlog or slow commits widen the interval
+    assert controller.update(5000, 0) == 10
+    assert controller.update(0, 1) == 20
+    assert controller.update(5000, 0) == 30
+    assert controller.update(5000, 0) == 30
+
+    # Neither busy nor idle keeps the interval
+    assert controller.update(500, 0) == 30
+    assert controller.update(0, 0.5) == 30
+
+    # Idle shrinks the interval
+    assert controller.update(0, 0) == 15
+    assert controller.update(10, 0.01) == 7.5
+    assert controller.update(0, 0) == 3.75
+    assert controller.update(0, 0) == 1.875
+    assert controller.update(0, 0) == 1
+    assert controller.update(0, 0) == 1
+
+
+def test_commit_interval_controller_bounds() -> None:
+    """Test the commit interval bounds follow the configured commit interval."""
+    controller = CommitIntervalController(60)
+    assert (controller.min_interval, controller.max_interval) == (60, 360)
+    controller = CommitIntervalController(60, 12)
+    assert (controller.min_interval, controller.max_interval) == (12, 360)
+    controller = CommitIntervalController(1, 5)
+    assert (controller.min_interval, controller.max_interval) == (1, 6)
+
+
+def test_commit_interval_controller_idle_keeps_commit_interval() -> None:
+    """Test an idle database does not shrink the interval by default."""
+    controller = CommitIntervalController(5)
+    assert controller.update(0, 0) == 5
+    assert controller.update(5000, 0) == 10
+    assert controller.update(0, 0) == 5
+    assert controller.update(0, 0) == 5
+
+
+def test_histogram() -> None:
+    """Test the histogram counts values in cumulative buckets."""
+    histogram = Histogram((1, 10, 100))
+    assert histogram.as_dict() == {
+        "buckets": {"1": 0, "10": 0, "100": 0, "+Inf": 0},
+        "count": 0,
+        "sum": 0,
+    }
+    assert histogram.last is None
+
+    for value in (0, 1, 5, 50, 500):
+        histogram.observe(value)
+    assert histogram.as_dict() == {
+        "buckets": {"1": 2, "10": 3, "100": 4, "+Inf": 5},
+        "count": 5,
+        "sum": 556,
+    }
+    assert histogram.last == 500
@@ -1014,3 +1014,30 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+async def test_get_states_chunk_end_time(hass: HomeAssistant) -> None:
+    """Test get_states_chunk_end_time bounds the states in a window."""
+    start = dt_util.utcnow()
+    times = [start + timedelta(seconds=offset) for offset in (1, 2, 3)]
+    for point, state in zip(times, ("1", "2", "3"), strict=True):
+        with freeze_time(point):
+            hass.states.async_set("sensor.one", state)
+    await async_wait_recording_done(hass)
+    end = start + timedelta(seconds=10)
+
+    assert (
+        history.get_states_chunk_end_time(hass, start, end, ["sensor.one"], 2)
+        == times[2]
+    )
+    assert (
+        history.get_states_chunk_end_time(hass, times[0], end, ["sensor.one"], 1)
+        == times[2]
+    )
+    assert (
+        history.get_states_chunk_end_time(hass, start, end, ["sensor.one"], 3) is None
+    )
+    assert (
+        history.get_states_chunk_end_time(hass, start, end, ["nonexistent.entity"], 1)
+        is None
+    )
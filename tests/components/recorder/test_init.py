@@ -25,6 +25,8 @@ from homeassistant.components.recorder import (
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
     CONF_DB_URL,
+    CONF_LOW_PRIORITY_EVENT_TYPES,
+    CONF_MIN_COMMIT_INTERVAL,
     CONFIG_SCHEMA,
     DOMAIN,
     Recorder,
@@ -33,6 +35,7 @@ from homeassistant.components.recorder import (
     migration,
     statistics,
 )
+from homeassistant.components.recorder.backpressure import BacklogPressure
 from homeassistant.components.recorder.const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
@@ -42,6 +45,7 @@ from homeassistant.components.recorder.const import (
 from homeassistant.components.recorder.db_schema import (
     SCHEMA_VERSION,
     EventData,
+    EventReferences,
     Events,
     EventTypes,
     RecorderRuns,
@@ -129,13 +133,16 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         hass,
         auto_purge=True,
         auto_repack=True,
+        sqlite_incremental_vacuum=False,
         keep_days=7,
         commit_interval=1,
+        min_commit_interval=None,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        low_priority_event_types=set(),
     )
 
 
@@ -558,6 +565,40 @@ async def test_saving_event(hass: HomeAssistant, setup_recorder: None) -> None:
     )
 
 
+async def test_saving_event_references(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test the entity and device ids referenced by events are saved."""
+    hass.bus.async_fire(
+        "EVENT_TEST", {"entity_id": "light.kitchen", "device_id": "abc123"}
+    )
+    hass.bus.async_fire("EVENT_TEST", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("EVENT_TEST", {"entity_id": ["light.kitchen", "light.hallway"]})
+    hass.bus.async_fire("EVENT_TEST", {"device_id": None})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        references = (
+            session.query(EventReferences, Events)
+            .join(Events, EventReferences.event_id == Events.event_id)
+            .order_by(EventReferences.reference_id)
+            .all()
+        )
+        assert [
+            (reference.reference, reference.event_id) for reference, _ in references
+        ] == [
+            ("light.kitchen", references[0][1].event_id),
+            ("abc123", references[0][1].event_id),
+            ("light.kitchen", references[2][1].event_id),
+        ]
+        assert references[0][1].event_id != references[2][1].event_id
+        for reference, event in references:
+            assert reference.time_fired_ts == event.time_fired_ts
+            assert reference.context_id_bin == event.context_id_bin
+            assert reference.event_type_id == event.event_type_id
+            assert reference.event_type_id is not None
+
+
 async def test_saving_state_with_commit_interval_zero(
     hass: HomeAssistant,
     async_setup_recorder_instance: RecorderInstanceGenerator,
@@ -2026,6 +2067,138 @@ async def test_database_lock_and_overflow_checks_available_memory(
     assert start_time.count(":") == 2
 
 
+async def test_backlog_pressure_sheds_events(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test events are shed when the backlog grows while memory runs low."""
+    await async_setup_recorder_instance(
+        hass, {CONF_LOW_PRIORITY_EVENT_TYPES: ["low_priority_event"]}
+    )
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    min_available_memory = 256 * 1024**2
+    available_memory = min_available_memory * 4
+
+    def _fire_events(state: str) -> None:
+        hass.bus.async_fire("low_priority_event")
+        hass.bus.async_fire("other_event")
+        hass.states.async_set("test.recorder", state)
+
+    with (
+        patch.object(recorder.core, "BACKLOG_PRESSURE_MIN_VALUE", 0),
+        patch.object(
+            recorder.core,
+            "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG",
+            min_available_memory,
+        ),
+        patch.object(
+            recorder.core.Recorder,
+            "_available_memory",
+            side_effect=lambda: available_memory,
+        ),
+    ):
+        instance._async_check_backlog_pressure()
+        assert instance.backlog_pressure is BacklogPressure.NONE
+
+        available_memory = min_available_memory * 3
+        instance._async_check_backlog_pressure()
+        assert instance.backlog_pressure is BacklogPressure.LOW_PRIORITY
+        assert "low priority events will not be recorded" in caplog.text
+        _fire_events("1")
+
+        available_memory = min_available_memory
+        instance._async_check_backlog_pressure()
+        assert instance.backlog_pressure is BacklogPressure.STATES_ONLY
+        assert "only state changes will be recorded" in caplog.text
+        _fire_events("2")
+
+        available_memory = min_available_memory * 4
+        instance._async_check_backlog_pressure()
+        assert instance.backlog_pressure is BacklogPressure.NONE
+        assert "recording all events again after shedding 3 events" in caplog.text
+        _fire_events("3")
+
+    await async_wait_recording_done(hass)
+
+    def _get_db_rows() -> tuple[list[str], list[str]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            event_types = [
+                event_type
+                for (event_type,) in session.query(EventTypes.event_type)
+                .join(Events, Events.event_type_id == EventTypes.event_type_id)
+                .filter(
+                    EventTypes.event_type.in_(("low_priority_event", "other_event"))
+                )
+                .order_by(Events.event_id)
+            ]
+            states = [state for (state,) in session.query(States.state)]
+            return event_types, states
+
+    assert await instance.async_add_executor_job(_get_db_rows) == (
+        ["other_event", "low_priority_event", "other_event"],
+        ["1", "2", "3"],
+    )
+    assert instance.shed_events == 3
+
+
+async def test_adaptive_commit_interval(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the commit interval shrinks to min_commit_interval when idle."""
+    await async_setup_recorder_instance(
+        hass, {CONF_COMMIT_INTERVAL: 5, CONF_MIN_COMMIT_INTERVAL: 1}
+    )
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    controller = instance.commit_interval_controller
+    assert controller.interval == 5
+
+    def _get_db_states() -> list[str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [state for (state,) in session.query(States.state)]
+
+    hass.states.async_set("test.recorder", "on")
+    await async_recorder_block_till_done(hass)
+    for interval in (2.5, 1.25, 1):
+        freezer.tick(controller.interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert controller.interval == interval
+    await async_recorder_block_till_done(hass)
+    assert await instance.async_add_executor_job(_get_db_states) == ["on"]
+    assert instance.commit_duration_histogram.count >= 1
+
+    # The database is busy when the backlog grows
+    with patch.object(recorder.core.Recorder, "backlog", 5000):
+        freezer.tick(controller.interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    assert controller.interval == 2
+
+
+async def test_adaptive_commit_interval_keeps_commit_interval(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test an idle database keeps the configured commit interval by default."""
+    await async_setup_recorder_instance(hass, {CONF_COMMIT_INTERVAL: 5})
+    await async_wait_recording_done(hass)
+    controller = get_instance(hass).commit_interval_controller
+
+    hass.states.async_set("test.recorder", "on")
+    await async_recorder_block_till_done(hass)
+    for _ in range(3):
+        freezer.tick(controller.interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert controller.interval == 5
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("skip_by_db_engine")
 async def test_database_lock_timeout(
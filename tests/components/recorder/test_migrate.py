@@ -1470,3 +1470,56 @@ def test_update_states_table_with_foreign_key_options_unsupported_engine(
         match="_update_states_table_with_foreign_key_options not supported for sqlite",
     ):
         migration._update_states_table_with_foreign_key_options(session_maker, engine)
+
+
+def test_initialize_last_referenced_ts_batched() -> None:
+    """Test last_referenced_ts is initialized in primary key range batches."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    db_schema.Base.metadata.create_all(engine)
+    session_maker = scoped_session(sessionmaker(bind=engine, future=True))
+    with session_scope(session=session_maker()) as session:
+        session.add_all(
+            db_schema.StateAttributes(
+                shared_attrs="{}", hash=attributes_id, last_referenced_ts=None
+            )
+            for attributes_id in range(5)
+        )
+        session.add(
+            db_schema.StateAttributes(shared_attrs="{}", hash=5, last_referenced_ts=1.0)
+        )
+
+    with (
+        patch.object(migration, "MIGRATION_PRIMARY_KEY_BATCH_SIZE", 2),
+        patch.object(
+            migration, "session_scope", wraps=session_scope
+        ) as mock_session_scope,
+    ):
+        migration._initialize_last_referenced_ts(
+            session_maker,
+            db_schema.StateAttributes,
+            db_schema.StateAttributes.attributes_id,
+            100.0,
+        )
+
+    # One session to find the id range and one per batch of two ids
+    assert mock_session_scope.call_count == 4
+    with session_scope(session=session_maker()) as session:
+        assert [
+            row.last_referenced_ts
+            for row in session.query(db_schema.StateAttributes).order_by(
+                db_schema.StateAttributes.attributes_id
+            )
+        ] == [100.0, 100.0, 100.0, 100.0, 100.0, 1.0]
+
+    with patch.object(
+        migration, "session_scope", wraps=session_scope
+    ) as mock_session_scope:
+        migration._initialize_last_referenced_ts(
+            session_maker,
+            db_schema.EventData,
+            db_schema.EventData.data_id,
+            100.0,
+        )
+    # Empty table, only the id range is queried
+    assert mock_session_scope.call_count == 1
+    engine.dispose()
@@ -7,7 +7,9 @@ import sqlite3
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
@@ -15,6 +17,8 @@ from voluptuous.error import MultipleInvalid
 from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
+    EventData,
+    EventReferences,
     Events,
     EventTypes,
     RecorderRuns,
@@ -25,7 +29,10 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    _select_unused_attributes_ids,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -103,6 +110,22 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
         )
         assert not finished
 
+        with session_scope(hass=hass) as session:
+            states = session.query(States)
+            state_attributes = session.query(StateAttributes)
+            assert states.count() == 24
+            # Old attributes are purged once all old states are gone
+            assert state_attributes.count() == 3
+
+        finished = purge_old_data(
+            recorder_mock,
+            purge_before,
+            states_batch_size=1,
+            events_batch_size=1,
+            repack=False,
+        )
+        assert finished
+
         with session_scope(hass=hass) as session:
             states = session.query(States)
             state_attributes = session.query(StateAttributes)
@@ -110,6 +133,36 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("recorder_config", [{"sqlite_incremental_vacuum": True}])
+async def test_purge_sqlite_incremental_vacuum(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the pages of purged rows are freed with the incremental layout."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    def _pragma(name: str) -> int:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.execute(text(f"PRAGMA {name}")).scalar_one()
+
+    assert _pragma("auto_vacuum") == 2  # INCREMENTAL
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with patch(
+        "homeassistant.components.recorder.purge.repack_database"
+    ) as repack_mock:
+        while not purge_old_data(recorder_mock, purge_before, repack=False):
+            pass
+    assert not repack_mock.called
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 24
+    assert _pragma("freelist_count") == 0
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     await _add_test_states(hass)
@@ -145,7 +198,8 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
         states = session.query(States)
         state_attributes = session.query(StateAttributes)
         assert states.count() == 2
-        assert state_attributes.count() == 1
+        # Old attributes are purged once all old states are gone
+        assert state_attributes.count() == 3
 
     assert "test.recorder2" in recorder_mock.states_manager._last_committed_id
 
@@ -2065,3 +2119,105 @@ async def test_purge_entities_keep_days(
     )
     assert len(states["sensor.keep"]) == 2
     assert "sensor.purge" not in states
+
+
+async def test_purge_unreferenced_state_attributes_and_event_data(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test attributes and event data are purged by when they were last referenced."""
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+    five_days_ago = utcnow - timedelta(days=5)
+
+    freezer.move_to(eleven_days_ago)
+    hass.states.async_set("sensor.one", "on", {"shared": True})
+    hass.states.async_set("sensor.two", "on", {"shared": False})
+    hass.bus.async_fire("EVENT_TEST_REFERENCED", {"shared": True})
+    hass.bus.async_fire("EVENT_TEST_REFERENCED", {"shared": False})
+    await async_wait_recording_done(hass)
+
+    freezer.move_to(five_days_ago)
+    hass.states.async_set("sensor.three", "on", {"shared": True})
+    hass.bus.async_fire("EVENT_TEST_REFERENCED", {"shared": True})
+    await async_wait_recording_done(hass)
+
+    freezer.move_to(utcnow)
+    with session_scope(hass=hass) as session:
+        last_referenced = dict(
+            session.query(
+                StateAttributes.shared_attrs, StateAttributes.last_referenced_ts
+            ).all()
+        )
+        assert last_referenced == {
+            '{"shared":true}': five_days_ago.timestamp(),
+            '{"shared":false}': eleven_days_ago.timestamp(),
+        }
+        last_referenced = dict(
+            session.query(EventData.shared_data, EventData.last_referenced_ts)
+            .filter(EventData.shared_data.like('%"shared"%'))
+            .all()
+        )
+        assert last_referenced == {
+            '{"shared":true}': five_days_ago.timestamp(),
+            '{"shared":false}': eleven_days_ago.timestamp(),
+        }
+
+    with patch(
+        "homeassistant.components.recorder.purge._select_unused_attributes_ids",
+        wraps=_select_unused_attributes_ids,
+    ) as select_unused_attributes_ids:
+        finished = purge_old_data(
+            recorder_mock, utcnow - timedelta(days=8), repack=False
+        )
+    assert finished
+    # Only the recently referenced attributes are looked up in the states table
+    assert set().union(
+        *(call.args[2] for call in select_unused_attributes_ids.call_args_list)
+    ) == {recorder_mock.state_attributes_manager._id_map['{"shared":true}']}
+
+    with session_scope(hass=hass) as session:
+        assert [
+            shared_attrs
+            for (shared_attrs,) in session.query(StateAttributes.shared_attrs)
+        ] == ['{"shared":true}']
+        assert [
+            shared_data
+            for (shared_data,) in session.query(EventData.shared_data).filter(
+                EventData.shared_data.like('%"shared"%')
+            )
+        ] == ['{"shared":true}']
+        assert session.query(States).count() == 1
+    assert '{"shared":false}' not in recorder_mock.state_attributes_manager._id_map
+    assert '{"shared":false}' not in recorder_mock.event_data_manager._id_map
+
+
+async def test_purge_event_references(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test event references are purged with their events."""
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    freezer.move_to(eleven_days_ago)
+    hass.bus.async_fire("EVENT_TEST_REFERENCES", {"entity_id": "light.old"})
+    await async_wait_recording_done(hass)
+
+    freezer.move_to(utcnow)
+    hass.bus.async_fire(
+        "EVENT_TEST_REFERENCES", {"entity_id": "light.new", "device_id": "abc123"}
+    )
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(EventReferences).count() == 3
+
+    finished = purge_old_data(recorder_mock, utcnow - timedelta(days=8), repack=False)
+    assert finished
+
+    with session_scope(hass=hass) as session:
+        assert [
+            reference
+            for (reference,) in session.query(EventReferences.reference).order_by(
+                EventReferences.reference_id
+            )
+        ] == ["light.new", "abc123"]
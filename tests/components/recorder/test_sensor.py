@@ -0,0 +1,64 @@
+"""Test the recorder sensors."""
+
+import pytest
+
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from .common import async_wait_recording_done
+
+
+async def test_sensors_disabled_by_default(
+    recorder_mock: Recorder, hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the recorder sensors are disabled by default."""
+    assert await async_setup_component(hass, "sensor", {})
+    await hass.async_block_till_done()
+
+    for entity_id in (
+        "sensor.recorder_queue_depth",
+        "sensor.recorder_commit_duration",
+    ):
+        entry = entity_registry.async_get(entity_id)
+        assert entry is not None
+        assert entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+        assert hass.states.get(entity_id) is None
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_sensors(recorder_mock: Recorder, hass: HomeAssistant) -> None:
+    """Test the recorder sensors report the queue depth and commit durations."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "sensor", {})
+    await hass.async_block_till_done()
+    instance = get_instance(hass)
+
+    hass.states.async_set("test.recorder", "on")
+    await async_wait_recording_done(hass)
+    instance._async_check_backlog_pressure()
+
+    await hass.services.async_call(
+        "homeassistant",
+        "update_entity",
+        {
+            "entity_id": [
+                "sensor.recorder_queue_depth",
+                "sensor.recorder_commit_duration",
+            ]
+        },
+        blocking=True,
+    )
+
+    state = hass.states.get("sensor.recorder_queue_depth")
+    assert int(state.state) >= 0
+    assert state.attributes["unit_of_measurement"] == "events"
+    assert state.attributes["count"] == 1
+    assert state.attributes["buckets"]["10"] == 1
+
+    state = hass.states.get("sensor.recorder_commit_duration")
+    assert float(state.state) > 0
+    assert state.attributes["unit_of_measurement"] == "s"
+    assert state.attributes["count"] >= 1
+    assert state.attributes["buckets"]["+Inf"] == state.attributes["count"]
@@ -1,6 +1,6 @@
 """The tests for sensor recorder platform."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
@@ -8,8 +8,13 @@ import pytest
 from sqlalchemy import select
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder import Recorder, history, migration, statistics
+from homeassistant.components.recorder.const import SIGNAL_STATISTICS_CHANGED
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -37,9 +42,10 @@ from homeassistant.components.recorder.table_managers.statistics_meta import (
 )
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -1844,6 +1850,355 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+@pytest.mark.parametrize("units", [None, {"energy": "Wh"}])
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+async def test_statistics_reduced_in_db(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone: str,
+    period: str,
+    units: dict[str, str] | None,
+) -> None:
+    """Test statistics reduced in the database match the Python reducers."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-10-20 00:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "state": hour % 7,
+            "sum": hour * 1.5,
+            "min": None if hour % 11 == 0 else hour % 5 - 2,
+            "max": hour % 9,
+            "mean": hour % 3,
+        }
+        for hour in range(24 * 50)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    for start_time, end_time in (
+        (start, None),
+        (start + timedelta(days=3, hours=5), start + timedelta(days=40, hours=2)),
+    ):
+        for types in (
+            {"change", "last_reset", "max", "min", "state", "sum"},
+            {"change"},
+            {"max", "min"},
+        ):
+            kwargs = {
+                "start_time": start_time,
+                "end_time": end_time,
+                "statistic_ids": {"test:total_energy_import"},
+                "period": period,
+                "units": units,
+                "types": types,
+            }
+            with patch.object(
+                statistics, "_reduce_statistics", wraps=statistics._reduce_statistics
+            ) as reduce_mock:
+                reduced_in_db = statistics_during_period(hass, **kwargs)
+            assert reduce_mock.call_count == 0
+            with patch.object(statistics, "MAX_PERIODS_TO_REDUCE_IN_DB", 0):
+                reduced_in_python = statistics_during_period(hass, **kwargs)
+            assert reduced_in_db == reduced_in_python
+            assert reduced_in_db["test:total_energy_import"]
+
+    # Mean is still reduced by the Python reducers
+    with patch.object(
+        statistics, "_reduce_statistics", wraps=statistics._reduce_statistics
+    ) as reduce_mock:
+        statistics_during_period(
+            hass,
+            start,
+            statistic_ids={"test:total_energy_import"},
+            period=period,
+            types={"mean", "sum"},
+        )
+    assert reduce_mock.call_count == 1
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna"])
+@pytest.mark.freeze_time("2021-12-01 12:00:00+00:00")
+async def test_statistics_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone: str,
+) -> None:
+    """Test daily and monthly statistics are read from the rollups."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-25 00:00:00"))
+    imported_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "state": hour % 7,
+            "sum": hour * 1.5,
+            "min": None if hour % 11 == 0 else hour % 5 - 2,
+            "max": hour % 9,
+            "mean": hour % 3,
+        }
+        for hour in range(24 * 45)
+    ]
+    imported_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "recorder",
+        "statistic_id": "sensor.total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_import_statistics(hass, imported_metadata, imported_statistics)
+    await async_wait_recording_done(hass)
+
+    def _rollup_periods(table: type[StatisticsDaily | StatisticsMonthly]) -> list:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.execute(
+                select(table.start_ts, table.end_ts).order_by(table.start_ts)
+            ).all()
+
+    daily = await instance.async_add_executor_job(_rollup_periods, StatisticsDaily)
+    assert len(daily) == 45
+    assert all(end_ts - start_ts in (82800, 86400, 90000) for start_ts, end_ts in daily)
+    monthly = await instance.async_add_executor_job(_rollup_periods, StatisticsMonthly)
+    oct_start = dt_util.as_utc(dt_util.parse_datetime("2021-10-01 00:00:00"))
+    nov_start = dt_util.as_utc(dt_util.parse_datetime("2021-11-01 00:00:00"))
+    assert (oct_start.timestamp(), nov_start.timestamp()) in monthly
+
+    def _reduced_from_hourly(start_time: datetime, end_time: datetime | None) -> int:
+        """Compare with the reducers and return how often hourly rows were reduced."""
+        reduced_from_hourly = 0
+        for period in ("day", "month"):
+            kwargs = {
+                "start_time": start_time,
+                "end_time": end_time,
+                "statistic_ids": {"sensor.total_energy_import"},
+                "period": period,
+                "types": {"change", "last_reset", "max", "min", "state", "sum"},
+            }
+            with patch.object(
+                statistics,
+                "_generate_reduced_statistics_during_period_stmt",
+                wraps=statistics._generate_reduced_statistics_during_period_stmt,
+            ) as reduce_in_db_mock:
+                stats = statistics_during_period(hass, **kwargs)
+            with patch.object(statistics, "MAX_PERIODS_TO_REDUCE_IN_DB", 0):
+                assert stats == statistics_during_period(hass, **kwargs)
+            assert stats["sensor.total_energy_import"]
+            reduced_from_hourly += reduce_in_db_mock.call_count
+        return reduced_from_hourly
+
+    # All periods are rolled up
+    assert _reduced_from_hourly(oct_start, nov_start - timedelta(hours=1)) == 0
+    # The periods which are not rolled up are reduced from the hourly statistics
+    assert _reduced_from_hourly(start - timedelta(days=20), None) == 1
+
+    instance.async_adjust_statistics(
+        "sensor.total_energy_import",
+        dt_util.as_utc(dt_util.parse_datetime("2021-10-10 12:00:00")),
+        100,
+        "kWh",
+    )
+    await async_wait_recording_done(hass)
+    assert _reduced_from_hourly(oct_start, nov_start - timedelta(hours=1)) == 0
+
+    instance.async_change_statistics_unit(
+        "sensor.total_energy_import",
+        new_unit_of_measurement="MWh",
+        old_unit_of_measurement="kWh",
+    )
+    await async_wait_recording_done(hass)
+    assert _reduced_from_hourly(oct_start, nov_start - timedelta(hours=1)) == 0
+
+    # Rollups computed in another time zone are not used
+    await hass.config.async_set_time_zone("Asia/Tokyo")
+    assert _reduced_from_hourly(oct_start, nov_start - timedelta(hours=1)) == 2
+
+    instance.async_clear_statistics(["sensor.total_energy_import"])
+    await async_wait_recording_done(hass)
+    assert await instance.async_add_executor_job(_rollup_periods, StatisticsDaily) == []
+
+
+@pytest.mark.freeze_time("2021-12-01 12:00:00+00:00")
+async def test_statistics_rollups_migration(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test the existing statistics are rolled up by the migration."""
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-25 00:00:00"))
+    external_statistics = [
+        {"start": start + timedelta(hours=hour), "state": hour, "sum": hour}
+        for hour in range(24 * 45)
+    ]
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    def _rollups() -> tuple[list, list]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return tuple(
+                session.execute(
+                    select(table.start_ts, table.end_ts, table.sum).order_by(
+                        table.start_ts
+                    )
+                ).all()
+                for table in (StatisticsDaily, StatisticsMonthly)
+            )
+
+    def _delete_rollups() -> None:
+        with session_scope(hass=hass) as session:
+            session.query(StatisticsDaily).delete()
+            session.query(StatisticsMonthly).delete()
+
+    rollups = await instance.async_add_executor_job(_rollups)
+    assert len(rollups[0]) == 45
+    assert len(rollups[1]) == 3
+    await instance.async_add_executor_job(_delete_rollups)
+    assert await instance.async_add_executor_job(_rollups) == ([], [])
+
+    migrator = migration.StatisticsRollupsMigration(migration.SCHEMA_VERSION, {})
+    instance.queue_task(migrator.task(migrator))
+    # The migration rolls up a month at a time
+    for _ in range(4):
+        await async_recorder_block_till_done(hass)
+    assert await instance.async_add_executor_job(_rollups) == rollups
+
+
+@pytest.mark.freeze_time("2021-10-01 23:50:00+00:00")
+async def test_compile_statistics_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test the daily rollups are computed when the day is compiled."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    day_start = dt_util.utcnow().replace(hour=0, minute=0)
+    external_statistics = [
+        {"start": day_start + timedelta(hours=hour), "state": hour, "sum": hour}
+        for hour in range(24)
+    ]
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    def _rollups() -> list:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.execute(
+                select(StatisticsDaily.start_ts, StatisticsDaily.sum)
+            ).all()
+
+    # The day is not over yet
+    assert await instance.async_add_executor_job(_rollups) == []
+
+    do_adhoc_statistics(hass, start=day_start + timedelta(hours=23, minutes=55))
+    await async_wait_recording_done(hass)
+    assert await instance.async_add_executor_job(_rollups) == [
+        (day_start.timestamp(), 23)
+    ]
+
+
+async def test_statistics_changed_signal(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test SIGNAL_STATISTICS_CHANGED is dispatched when statistics change."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    changes: list[tuple[set[str], float]] = []
+
+    @callback
+    def _statistics_changed(statistic_ids: set[str], start_ts: float) -> None:
+        changes.append((statistic_ids, start_ts))
+
+    async_dispatcher_connect(hass, SIGNAL_STATISTICS_CHANGED, _statistics_changed)
+
+    hour_start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        [
+            {"start": hour_start - timedelta(hours=2), "state": 0, "sum": 0},
+            {"start": hour_start - timedelta(hours=1), "state": 1, "sum": 1},
+        ],
+    )
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    assert changes == [
+        ({"test:total_energy_import"}, (hour_start - timedelta(hours=2)).timestamp())
+    ]
+
+    # Short term statistics are summarized when the hour is compiled
+    changes.clear()
+    sensor_metadata = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": None,
+        "source": "recorder",
+        "statistic_id": "sensor.test",
+        "unit_of_measurement": "W",
+    }
+    instance.async_import_statistics(
+        sensor_metadata,
+        [{"start": hour_start, "mean": 1, "min": 1, "max": 1}],
+        StatisticsShortTerm,
+    )
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    assert changes == []
+    do_adhoc_statistics(hass, start=hour_start + timedelta(minutes=55))
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    assert changes == [({"sensor.test"}, hour_start.timestamp())]
+
+    changes.clear()
+    instance.async_clear_statistics(["test:total_energy_import"])
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    assert changes == [({"test:total_energy_import"}, 0)]
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -239,7 +239,7 @@ def test_setup_connection_for_dialect_mysql(mysql_version) -> None:
 )
 def test_setup_connection_for_dialect_sqlite(sqlite_version: str) -> None:
     """Test setting up the connection for a sqlite dialect."""
-    instance_mock = MagicMock()
+    instance_mock = MagicMock(sqlite_incremental_vacuum=False)
     execute_args = []
     close_mock = MagicMock()
 
@@ -294,7 +294,7 @@ def test_setup_connection_for_dialect_sqlite_zero_commit_interval(
     sqlite_version: str,
 ) -> None:
     """Test setting up the connection for a sqlite dialect with a zero commit interval."""
-    instance_mock = MagicMock(commit_interval=0)
+    instance_mock = MagicMock(commit_interval=0, sqlite_incremental_vacuum=False)
     execute_args = []
     close_mock = MagicMock()
 
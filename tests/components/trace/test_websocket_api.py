@@ -12,11 +12,12 @@ from pytest_unordered import unordered
 from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
+from homeassistant.helpers.trace import TraceElement
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.setup import async_setup_component
 from homeassistant.util.uuid import random_uuid_hex
 
-from tests.common import load_fixture
+from tests.common import async_capture_events, load_fixture
 from tests.typing import WebSocketGenerator
 
 
@@ -44,6 +45,7 @@ async def _setup_automation_or_script(
     configs: list[dict[str, Any]],
     script_config: dict[str, Any] | None = None,
     stored_traces: int | None = None,
+    trace_config: dict[str, Any] | None = None,
 ) -> None:
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -58,14 +60,14 @@ async def _setup_automation_or_script(
             configs = {**configs, **script_config}
 
     if stored_traces is not None:
+        trace_config = {**(trace_config or {}), "stored_traces": stored_traces}
+    if trace_config is not None:
         if domain == "script":
             for config in configs.values():
-                config["trace"] = {}
-                config["trace"]["stored_traces"] = stored_traces
+                config["trace"] = dict(trace_config)
         else:
             for config in configs:
-                config["trace"] = {}
-                config["trace"]["stored_traces"] = stored_traces
+                config["trace"] = dict(trace_config)
 
     assert await async_setup_component(hass, domain, {domain: configs})
 
@@ -788,6 +790,161 @@ async def test_trace_no_traces(
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_sample_every(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain
+) -> None:
+    """Test only one in every sample_every runs is traced."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config={"sample_every": 3}
+    )
+
+    client = await hass_ws_client()
+
+    for _ in range(5):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], domain, "sun")
+    assert len(traces) == 2
+    assert all(trace["script_execution"] == "finished" for trace in traces)
+
+    await client.send_json({"id": 2, "type": "trace/stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    stats = response["result"]["traces"][f"{domain}.sun"]
+    assert stats["runs"] == 5
+    assert stats["traced_runs"] == 2
+    assert stats["stored_traces"] == 2
+    assert stats["trace_elements"] > 0
+    assert stats["estimated_size"] > 0
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_failed_only(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain
+) -> None:
+    """Test only the traces of failed runs are stored when requested."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"stop": "Something failed", "error": True},
+    }
+    moon_config = {
+        "id": "moon",
+        "triggers": {"platform": "event", "event_type": "test_event2"},
+        "actions": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config, moon_config], trace_config={"failed_only": True}
+    )
+
+    client = await hass_ws_client()
+
+    for _ in range(2):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    sun_traces = _find_traces(response["result"], domain, "sun")
+    assert len(sun_traces) == 2
+    assert all(trace["script_execution"] == "aborted" for trace in sun_traces)
+    assert len(_find_traces(response["result"], domain, "moon")) == 0
+
+    await client.send_json({"id": 2, "type": "trace/stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    stats = response["result"]["traces"]
+    assert stats[f"{domain}.sun"]["stored_traces"] == 2
+    assert stats[f"{domain}.moon"]["runs"] == 2
+    assert stats[f"{domain}.moon"]["traced_runs"] == 2
+    assert stats[f"{domain}.moon"]["stored_traces"] == 0
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("trace_config", "skipped_run"),
+    [({"stored_traces": 0}, 0), ({"sample_every": 2}, 1)],
+)
+async def test_trace_skipped_run_creates_no_elements(
+    hass: HomeAssistant,
+    domain: str,
+    trace_config: dict[str, Any],
+    skipped_run: int,
+) -> None:
+    """Test runs which are not traced do not create trace elements."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": [
+            {"event": "some_event"},
+            {"condition": "template", "value_template": "{{ true }}"},
+            {"event": "another_event"},
+        ],
+    }
+    if domain == "automation":
+        sun_config["conditions"] = {
+            "condition": "template",
+            "value_template": "{{ true }}",
+        }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config=trace_config
+    )
+    events = async_capture_events(hass, "another_event")
+
+    original_init = TraceElement.__init__
+    with patch.object(
+        TraceElement, "__init__", autospec=True, side_effect=original_init
+    ) as element_init:
+        for run in range(skipped_run + 1):
+            element_init.reset_mock()
+            await _run_automation_or_script(hass, domain, sun_config, "test_event")
+            await hass.async_block_till_done()
+            assert element_init.called == (run != skipped_run)
+
+    assert len(events) == skipped_run + 1
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_stats_pruned_on_removal(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain: str
+) -> None:
+    """Test the runs of a removed automation or script are forgotten."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config], stored_traces=0)
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["traces"][f"{domain}.sun"]["runs"] == 1
+
+    with patch("homeassistant.config.load_yaml_config_file", return_value={domain: {}}):
+        await hass.services.async_call(domain, "reload", blocking=True)
+
+    await client.send_json({"id": 2, "type": "trace/stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert f"{domain}.sun" not in response["result"]["traces"]
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix", "trigger", "last_step", "script_execution"),
     [
@@ -1,5 +1,6 @@
 """Test Zeroconf component setup process."""
 
+from datetime import timedelta
 from typing import Any
 from unittest.mock import MagicMock, call, patch
 
@@ -25,8 +26,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.generated import zeroconf as zc_gen
 from homeassistant.helpers.discovery_flow import DiscoveryKey
 from homeassistant.setup import ATTR_COMPONENT, async_setup_component
+from homeassistant.util import dt as dt_util
 
-from tests.common import MockConfigEntry, MockModule, mock_integration
+from tests.common import (
+    MockConfigEntry,
+    MockModule,
+    async_fire_time_changed,
+    mock_integration,
+)
 
 NON_UTF8_VALUE = b"ABCDEF\x8a"
 NON_ASCII_KEY = b"non-ascii-key\x8a"
@@ -1059,6 +1066,119 @@ async def test_removed_ignored(hass: HomeAssistant) -> None:
     assert mock_service_info.mock_calls[1][1][0] == "_service.updated.local."
 
 
+@pytest.mark.usefixtures("mock_async_zeroconf")
+async def test_repeated_updates_are_collapsed(hass: HomeAssistant) -> None:
+    """Test repeated updates of a service inside the window are processed once."""
+
+    def service_update_mock(zeroconf, services, handlers):
+        """Call service update handler."""
+        for state_change in (
+            ServiceStateChange.Added,
+            ServiceStateChange.Updated,
+            ServiceStateChange.Updated,
+        ):
+            handlers[0](
+                zeroconf,
+                "_service.updated.local.",
+                "name._service.updated.local.",
+                state_change,
+            )
+
+    with (
+        patch.object(zeroconf, "AsyncServiceBrowser", side_effect=service_update_mock),
+        patch(
+            "homeassistant.components.zeroconf.AsyncServiceInfo",
+            side_effect=get_service_info_mock,
+        ) as mock_service_info,
+    ):
+        assert await async_setup_component(hass, zeroconf.DOMAIN, {zeroconf.DOMAIN: {}})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        assert len(mock_service_info.mock_calls) == 1
+
+        # The latest state is processed once the window has passed
+        async_fire_time_changed(
+            hass,
+            dt_util.utcnow()
+            + timedelta(seconds=zeroconf.SERVICE_UPDATE_COALESCE_SECONDS),
+        )
+        await hass.async_block_till_done()
+        assert len(mock_service_info.mock_calls) == 2
+
+        async_fire_time_changed(
+            hass,
+            dt_util.utcnow()
+            + timedelta(seconds=zeroconf.SERVICE_UPDATE_COALESCE_SECONDS * 2),
+        )
+        await hass.async_block_till_done()
+        assert len(mock_service_info.mock_calls) == 2
+
+
+@pytest.mark.usefixtures("mock_async_zeroconf")
+async def test_burst_straddling_window_is_collapsed(hass: HomeAssistant) -> None:
+    """Test a burst of updates going on past the end of the window."""
+    browsed = []
+
+    def service_update_mock(zeroconf, services, handlers):
+        """Capture the zeroconf instance and the service update handler."""
+        browsed.append((zeroconf, handlers[0]))
+
+    def fire_update(state_change: ServiceStateChange) -> None:
+        """Call the service update handler."""
+        zeroconf_instance, handler = browsed[0]
+        handler(
+            zeroconf_instance,
+            "_service.updated.local.",
+            "name._service.updated.local.",
+            state_change,
+        )
+
+    def fire_window_passed(windows: int) -> None:
+        """Fire the time changed event when some windows have passed."""
+        async_fire_time_changed(
+            hass,
+            start
+            + timedelta(seconds=zeroconf.SERVICE_UPDATE_COALESCE_SECONDS * windows),
+        )
+
+    with (
+        patch.object(zeroconf, "AsyncServiceBrowser", side_effect=service_update_mock),
+        patch(
+            "homeassistant.components.zeroconf.AsyncServiceInfo",
+            side_effect=get_service_info_mock,
+        ) as mock_service_info,
+    ):
+        assert await async_setup_component(hass, zeroconf.DOMAIN, {zeroconf.DOMAIN: {}})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        start = dt_util.utcnow()
+
+        fire_update(ServiceStateChange.Added)
+        fire_update(ServiceStateChange.Updated)
+        assert len(mock_service_info.mock_calls) == 1
+
+        # The pending update is processed when the window ends and starts a
+        # new window, which collapses the rest of the burst
+        fire_window_passed(1)
+        await hass.async_block_till_done()
+        assert len(mock_service_info.mock_calls) == 2
+        fire_update(ServiceStateChange.Updated)
+        fire_update(ServiceStateChange.Updated)
+        assert len(mock_service_info.mock_calls) == 2
+
+        fire_window_passed(2)
+        await hass.async_block_till_done()
+        assert len(mock_service_info.mock_calls) == 3
+
+        # Once a window passes without updates, the next one is processed
+        # right away
+        fire_window_passed(3)
+        await hass.async_block_till_done()
+        assert len(mock_service_info.mock_calls) == 3
+        fire_update(ServiceStateChange.Updated)
+        assert len(mock_service_info.mock_calls) == 4
+
+
 _ADAPTER_WITH_DEFAULT_ENABLED = [
     {
         "auto": True,
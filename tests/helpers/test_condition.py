@@ -276,6 +276,94 @@ async def test_and_condition_with_template(hass: HomeAssistant) -> None:
     assert test(hass)
 
 
+async def test_untraced_conditions_ordered_by_cost(hass: HomeAssistant) -> None:
+    """Test conditions are evaluated cheapest first without a trace."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "template",
+                "value_template": '{{ states.sensor.temperature.state == "100" }}',
+            },
+            {
+                "condition": "or",
+                "conditions": [
+                    {
+                        "condition": "template",
+                        "value_template": "{{ true }}",
+                    },
+                    {
+                        "condition": "state",
+                        "entity_id": "sensor.temperature",
+                        "state": "100",
+                    },
+                ],
+            },
+            {
+                "condition": "state",
+                "entity_id": "sensor.temperature",
+                "state": "100",
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    trace.trace_disable()
+    hass.states.async_set("sensor.temperature", 120)
+    with patch(
+        "homeassistant.helpers.condition.async_template",
+        wraps=condition.async_template,
+    ) as mock_template:
+        assert test(hass) is False
+        # The state condition is false, no template is rendered
+        assert mock_template.call_count == 0
+
+        hass.states.async_set("sensor.temperature", 100)
+        assert test(hass) is True
+        # The state condition of the OR condition is true
+        assert mock_template.call_count == 1
+
+    # No trace was collected
+    assert trace.trace_get(clear=False) is None
+
+
+async def test_untraced_condition_errors(hass: HomeAssistant) -> None:
+    """Test untraced conditions raise the same errors as traced ones."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "numeric_state",
+                "entity_id": "sensor.temperature",
+                "below": 110,
+            },
+            {
+                "condition": "state",
+                "entity_id": ["sensor.missing", "sensor.temperature"],
+                "state": "100",
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 100)
+    with pytest.raises(ConditionError) as traced_err:
+        test(hass)
+
+    trace.trace_disable()
+    with pytest.raises(ConditionError) as untraced_err:
+        test(hass)
+    assert str(untraced_err.value) == str(traced_err.value)
+    assert trace.trace_get(clear=False) is None
+
+    hass.states.async_set("sensor.temperature", 120)
+    assert test(hass) is False
+
+
 async def test_and_condition_shorthand(hass: HomeAssistant) -> None:
     """Test the 'and' condition shorthand."""
     config = {
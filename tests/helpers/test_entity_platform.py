@@ -390,6 +390,32 @@ async def test_parallel_updates_async_platform_with_constant(
     assert handle._update_in_sequence is False
 
 
+async def test_service_call_limiter_shared_by_integration(
+    hass: HomeAssistant,
+) -> None:
+    """Test platforms of an integration share a service call limiter."""
+    platform = MockPlatform()
+    platform.PARALLEL_SERVICE_CALLS = 2
+    platform.SERVICE_CALLS_PER_SECOND = 10
+
+    light_platform = MockEntityPlatform(
+        hass, domain="light", platform_name="hue", platform=platform
+    )
+    switch_platform = MockEntityPlatform(
+        hass, domain="switch", platform_name="hue", platform=platform
+    )
+    other_platform = MockEntityPlatform(
+        hass, domain="light", platform_name="other", platform=MockPlatform()
+    )
+
+    limiter = light_platform.service_call_limiter
+    assert limiter is not None
+    assert limiter.max_concurrent == 2
+    assert limiter.calls_per_second == 10
+    assert switch_platform.service_call_limiter is limiter
+    assert other_platform.service_call_limiter is None
+
+
 async def test_parallel_updates_sync_platform(hass: HomeAssistant) -> None:
     """Test sync platform parallel_updates default set to 1."""
     platform = MockPlatform()
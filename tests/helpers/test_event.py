@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from typing import Any
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -30,6 +31,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_time_change_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -50,7 +52,7 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
     track_point_in_utc_time,
 )
-from homeassistant.helpers.template import Template, result_as_boolean
+from homeassistant.helpers.template import RenderInfo, Template, result_as_boolean
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -1959,6 +1961,123 @@ async def test_track_template_result_with_wildcard(hass: HomeAssistant) -> None:
     assert "cover.office_skylight=open" in specific_runs[0]
 
 
+async def test_track_template_result_render_in_executor(hass: HomeAssistant) -> None:
+    """Test slow templates are re-rendered in the executor when requested."""
+    runs = []
+    hass.states.async_set("sensor.test", "1")
+    template_sum = Template(
+        "{{ states('sensor.test') | int + states('sensor.other') | int(0) }}", hass
+    )
+
+    @ha.callback
+    def run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_sum, None)],
+        run_callback,
+        render_in_executor=True,
+    )
+    await hass.async_block_till_done()
+    info.async_refresh()
+    assert runs == [1]
+
+    template_sum.render_in_executor = True
+    with patch.object(
+        Template, "async_render_to_info", side_effect=AssertionError
+    ) as render_in_loop:
+        hass.states.async_set("sensor.test", "2")
+        # The result is applied once the render in the executor is done
+        assert runs == [1]
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert runs == [1, 2]
+
+        hass.states.async_set("sensor.other", "3")
+        hass.states.async_set("sensor.test", "4")
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert runs[-1] == 7
+
+    assert not render_in_loop.called
+    info.async_remove()
+
+
+async def test_track_template_result_render_in_executor_super_template(
+    hass: HomeAssistant,
+) -> None:
+    """Test executor results are dropped once the super template blocks them."""
+    runs = []
+    hass.states.async_set("sensor.available", "on")
+    hass.states.async_set("sensor.test", "1")
+    template_availability = Template("{{ is_state('sensor.available', 'on') }}", hass)
+    template_value = Template("{{ states('sensor.test') }}", hass)
+
+    @ha.callback
+    def run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend((update.template, update.result) for update in updates)
+
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_availability, None),
+            TrackTemplate(template_value, None),
+        ],
+        run_callback,
+        has_super_template=True,
+        render_in_executor=True,
+    )
+    await hass.async_block_till_done()
+    info.async_refresh()
+    assert runs == [(template_availability, True), (template_value, 1)]
+    runs.clear()
+
+    template_value.render_in_executor = True
+    release = asyncio.Event()
+    render_in_executor = Template.async_render_to_info_in_executor
+
+    async def slow_render_in_executor(self: Template, *args: Any) -> RenderInfo:
+        await release.wait()
+        return await render_in_executor(self, *args)
+
+    with patch.object(
+        Template, "async_render_to_info_in_executor", slow_render_in_executor
+    ):
+        # Applying the result does not render the super template again
+        super_renders = template_availability._renders
+        release.set()
+        hass.states.async_set("sensor.test", "2")
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert runs == [(template_value, 2)]
+        assert template_availability._renders == super_renders
+        runs.clear()
+
+        # The super template blocks updates while the value is rendering
+        release.clear()
+        hass.states.async_set("sensor.test", "3")
+        hass.states.async_set("sensor.available", "off")
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert runs == [(template_availability, False)]
+        runs.clear()
+
+        # The dropped result is not applied by a later refresh
+        hass.states.async_set("sensor.test", "4")
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert runs == []
+
+        hass.states.async_set("sensor.available", "on")
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert runs == [(template_availability, True), (template_value, 4)]
+
+    info.async_remove()
+
+
 async def test_track_template_result_with_group(hass: HomeAssistant) -> None:
     """Test tracking template with a group."""
     hass.states.async_set("sensor.power_1", 0)
@@ -3936,6 +4055,104 @@ async def test_periodic_task_minute(
     assert len(specific_runs) == 2
 
 
+async def test_time_change_listeners_share_timer(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test listeners of the same time pattern share a timer."""
+    runs = []
+    other_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+
+    unsubs = [
+        async_track_utc_time_change(
+            hass,
+            # pylint: disable-next=unnecessary-lambda
+            callback(lambda x: runs.append(x)),
+            minute="/5",
+            second=0,
+        )
+        for _ in range(10)
+    ]
+    unsub_other = async_track_utc_time_change(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: other_runs.append(x)),
+        minute="/10",
+        second=0,
+    )
+    assert async_get_time_change_stats(hass) == {
+        "timers": 2,
+        "listeners": {"homeassistant": 11},
+    }
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 10
+    assert len(other_runs) == 1
+
+    for unsub in unsubs[:5]:
+        unsub()
+    # Unsubscribing twice is a no-op
+    unsubs[0]()
+    assert async_get_time_change_stats(hass)["listeners"] == {"homeassistant": 6}
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 15
+    assert len(other_runs) == 1
+
+    for unsub in unsubs[5:]:
+        unsub()
+    unsub_other()
+    unsub_other()
+    assert async_get_time_change_stats(hass) == {"timers": 0, "listeners": {}}
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 10, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 15
+    assert len(other_runs) == 1
+
+
+async def test_time_change_listener_removed_by_other_listener(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a listener removed while its time pattern fires is not run."""
+    runs = []
+    now = dt_util.utcnow()
+    freezer.move_to(datetime(now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC))
+
+    @callback
+    def remove_other(now: datetime) -> None:
+        runs.append("first")
+        unsub_second()
+
+    unsub_first = async_track_utc_time_change(hass, remove_other, second=0)
+    unsub_second = async_track_utc_time_change(
+        hass, callback(lambda x: runs.append("second")), second=0
+    )
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert runs == ["first"]
+    unsub_first()
+
+
 async def test_periodic_task_hour(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
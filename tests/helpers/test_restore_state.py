@@ -17,6 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    DELTA_STORAGE_KEY,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -550,3 +551,127 @@ async def test_restore_entity_end_to_end(
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
+
+
+async def test_dump_changed_states(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test periodic dumps only write states changed since the last full dump."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for idx in range(4):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    for idx in range(4):
+        hass.states.async_set(f"input_boolean.b{idx}", "off")
+
+    data = async_get(hass)
+    await data.async_dump_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 4
+
+    # Nothing changed, the delta is empty
+    await data.async_dump_changed_states()
+    assert hass_storage[DELTA_STORAGE_KEY]["data"] == []
+
+    hass.states.async_set("input_boolean.b1", "on")
+    await data.async_dump_changed_states()
+    written = hass_storage[DELTA_STORAGE_KEY]["data"]
+    assert len(written) == 1
+    assert json_round_trip(written[0])["state"]["entity_id"] == "input_boolean.b1"
+
+    # Loading merges the delta on top of the full dump
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_get(hass).async_load()
+    last_states = async_get(hass).last_states
+    assert len(last_states) == 4
+    assert last_states["input_boolean.b1"].state.state == "on"
+    assert last_states["input_boolean.b2"].state.state == "off"
+    hass.data[DATA_RESTORE_STATE] = data
+
+    # Once most states changed a full dump is written and the delta is removed
+    for idx in range(4):
+        hass.states.async_set(f"input_boolean.b{idx}", "unknown")
+    await data.async_dump_changed_states()
+    assert DELTA_STORAGE_KEY not in hass_storage
+    assert [
+        json_round_trip(item)["state"]["state"]
+        for item in hass_storage[STORAGE_KEY]["data"]
+    ] == ["unknown"] * 4
+
+
+async def test_full_dump_removes_stale_delta(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test a full dump removes a delta left behind by a previous run."""
+    now = dt_util.utcnow()
+    hass_storage[DELTA_STORAGE_KEY] = {
+        "version": 1,
+        "key": DELTA_STORAGE_KEY,
+        "data": [
+            json_round_trip(
+                StoredState(State("input_boolean.removed", "on"), None, now).as_dict()
+            )
+        ],
+    }
+
+    data = async_get(hass)
+    await data.async_dump_states()
+    assert DELTA_STORAGE_KEY not in hass_storage
+
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_get(hass).async_load()
+    assert "input_boolean.removed" not in async_get(hass).last_states
+
+
+async def test_failed_full_dump_keeps_delta(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the changed states are kept when a full dump fails."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for idx in range(4):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    for idx in range(4):
+        hass.states.async_set(f"input_boolean.b{idx}", "off")
+
+    data = async_get(hass)
+    await data.async_dump_states()
+    hass.states.async_set("input_boolean.b1", "on")
+    await data.async_dump_changed_states()
+
+    hass.states.async_set("input_boolean.b2", "on")
+    with patch.object(data.store, "async_save", side_effect=HomeAssistantError):
+        await data.async_dump_states()
+    assert len(hass_storage[DELTA_STORAGE_KEY]["data"]) == 1
+
+    # The next delta still has every state changed since the last full dump
+    await data.async_dump_changed_states()
+    assert sorted(
+        json_round_trip(item)["state"]["entity_id"]
+        for item in hass_storage[DELTA_STORAGE_KEY]["data"]
+    ) == ["input_boolean.b1", "input_boolean.b2"]
+
+
+async def test_stored_state_decoded_lazily(hass: HomeAssistant) -> None:
+    """Test stored states are only decoded when accessed."""
+    now = dt_util.utcnow()
+    json_dict = json_round_trip(
+        StoredState(State("input_boolean.b0", "on"), None, now).as_dict()
+    )
+    stored_state = StoredState.from_dict(json_dict)
+    assert stored_state.entity_id == "input_boolean.b0"
+
+    with patch.object(State, "from_dict", wraps=State.from_dict) as mock_from_dict:
+        # Writing back a state that was never decoded does not decode it
+        assert stored_state.as_dict()["state"] == json_dict["state"]
+        assert not mock_from_dict.called
+        assert stored_state.state.state == "on"
+        assert stored_state.state.state == "on"
+    assert mock_from_dict.call_count == 1
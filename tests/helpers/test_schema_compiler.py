@@ -0,0 +1,110 @@
+"""Test the schema compiler helper."""
+
+from typing import Any
+
+import pytest
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.schema_compiler import compile_schema
+
+ENTITY_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Exclusive("brightness", "brightness"): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=255)
+        ),
+        vol.Exclusive("brightness_pct", "brightness"): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=100)
+        ),
+        vol.Inclusive("low", "range"): vol.Coerce(float),
+        vol.Inclusive("high", "range"): vol.Coerce(float),
+        vol.Optional("transition"): cv.positive_float,
+        vol.Optional("rgb_color"): vol.All(
+            vol.Coerce(tuple), vol.ExactSequence((cv.byte,) * 3)
+        ),
+        vol.Optional("flash"): vol.In(["short", "long"]),
+    }
+)
+
+
+def _validate(schema: Any, data: Any) -> tuple[str, Any]:
+    """Validate data and return the result or error message."""
+    try:
+        return ("ok", schema(data))
+    except vol.Invalid as err:
+        return ("error", str(err))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"entity_id": "light.kitchen"},
+        {"entity_id": ["light.kitchen", "light.living_room"], "brightness": "100"},
+        {"entity_id": "light.kitchen", "brightness_pct": 50, "transition": 2},
+        {"entity_id": "light.kitchen", "rgb_color": [255, 0, 0]},
+        {"area_id": "kitchen", "flash": "short", "metadata": {}},
+        {"entity_id": "all", "low": 1, "high": "2"},
+        {"entity_id": "light.kitchen", "brightness": 10, "brightness_pct": 10},
+        {"entity_id": "light.kitchen", "low": 1},
+        {"entity_id": "light.kitchen", "brightness": 300},
+        {"entity_id": "light.kitchen", "rgb_color": [255, 0]},
+        {"entity_id": "light.kitchen", "flash": "medium"},
+        {"entity_id": "light.kitchen", "unknown": 1},
+        {"entity_id": "not an entity id"},
+        {"brightness": 100},
+        {},
+        [],
+        None,
+    ],
+)
+async def test_entity_service_schema(hass: HomeAssistant, data: Any) -> None:
+    """Test the compiled entity service schema matches voluptuous."""
+    compiled = compile_schema(ENTITY_SCHEMA)
+    assert compiled is not ENTITY_SCHEMA
+    assert _validate(compiled, data) == _validate(ENTITY_SCHEMA, data)
+
+
+@pytest.mark.parametrize(
+    ("schema", "data"),
+    [
+        (vol.Schema({vol.Required("a"): int}), {"a": 1}),
+        (vol.Schema({vol.Required("a"): int}), {}),
+        (vol.Schema({vol.Optional("a", default=5): int}), {}),
+        (vol.Schema({vol.Optional("a", default="x"): int}), {}),
+        (vol.Schema({"a": int}, required=True), {}),
+        (vol.Schema({"a": int}, extra=vol.ALLOW_EXTRA), {"a": 1, "b": 2}),
+        (vol.Schema({"a": int}, extra=vol.REMOVE_EXTRA), {"a": 1, "b": 2}),
+        (vol.Schema({vol.Remove("a"): int, "b": int}), {"a": "x", "b": 2}),
+        (vol.Schema({vol.Remove("a"): int, "b": int}), {"a": 1, "b": 2}),
+        (
+            vol.Schema({vol.Remove("a"): int}, extra=vol.ALLOW_EXTRA),
+            {"a": "x", "b": 2},
+        ),
+        (vol.Schema({"a": {"b": int}}, extra=vol.ALLOW_EXTRA), {"a": {"b": 1, "c": 2}}),
+        (vol.Schema({"a": vol.Schema({"b": int})}), {"a": {"b": 1, "c": 2}}),
+        (vol.Schema({"a": [int, str]}), {"a": [1, "b", 2]}),
+        (vol.Schema({"a": [int, str]}), {"a": [1, 2.5]}),
+        (vol.Schema({"a": [{"b": int}]}), {"a": [{"b": 1}, {"b": "x"}]}),
+        (vol.Schema({"a": vol.Any("none", [str])}), {"a": "none"}),
+        (vol.Schema({"a": vol.Any("none", [str])}), {"a": ["x", 1]}),
+        (vol.Schema({"a": (int,)}), {"a": (1, 2)}),
+        (vol.Schema({"a": (int,)}), {"a": [1, 2]}),
+        (vol.Schema({str: int}), {"a": 1}),
+        (vol.Schema({str: int}), {"a": "x"}),
+        (vol.Schema({"a": vol.Coerce(int)}), {"a": "x"}),
+        (vol.All(vol.Schema({"a": int}), cv.has_at_least_one_key("a")), {}),
+    ],
+)
+async def test_schema(hass: HomeAssistant, schema: Any, data: Any) -> None:
+    """Test compiled schemas return the same data and errors as voluptuous."""
+    assert _validate(compile_schema(schema), data) == _validate(schema, data)
+
+
+async def test_unsupported_schema(hass: HomeAssistant) -> None:
+    """Test schemas that cannot be compiled are returned as is."""
+    self_schema = vol.Schema({"a": vol.Any(None, vol.Self)})
+    assert compile_schema(self_schema) is self_schema
+    assert compile_schema(cv.string) is cv.string
+    leaf_schema = vol.Schema(cv.string)
+    assert compile_schema(leaf_schema) is leaf_schema
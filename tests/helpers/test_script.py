@@ -38,6 +38,7 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
     script,
+    service,
     template,
     trace,
 )
@@ -280,6 +281,44 @@ async def test_calling_service_basic(
     )
 
 
+async def test_calling_service_prepared_params(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test service call parameters without templates are prepared once."""
+    calls = async_mock_service(hass, "test", "script")
+    entry = entity_registry.async_get_or_create("light", "hue", "1234")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "action": "test.script",
+                "target": {"entity_id": "light.kitchen"},
+                "data": {"hello": "world"},
+            },
+            {"action": "test.script", "target": {"entity_id": entry.id}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch(
+        "homeassistant.helpers.service.async_prepare_call_from_config",
+        wraps=service.async_prepare_call_from_config,
+    ) as prepare_call:
+        await script_obj.async_run(context=Context())
+        entity_registry.async_update_entity(entry.entity_id, new_entity_id="light.hue")
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+
+    # The first step is prepared once, the registry id is resolved on every run
+    assert prepare_call.call_count == 3
+    assert [call.data for call in calls] == [
+        {"entity_id": ["light.kitchen"], "hello": "world"},
+        {"entity_id": [entry.entity_id]},
+        {"entity_id": ["light.kitchen"], "hello": "world"},
+        {"entity_id": ["light.hue"]},
+    ]
+
+
 async def test_calling_service_template(hass: HomeAssistant) -> None:
     """Test the calling of a service."""
     context = Context()
@@ -1863,6 +1902,56 @@ async def test_condition_warning(
     )
 
 
+async def test_condition_untraced(hass: HomeAssistant) -> None:
+    """Test a script run with tracing disabled creates no trace."""
+    event = "test_event"
+    events = async_capture_events(hass, event)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"event": event},
+            {
+                "condition": "and",
+                "conditions": [
+                    {
+                        "condition": "template",
+                        "value_template": "{{ is_state('test.entity', 'hello') }}",
+                    },
+                    {"condition": "state", "entity_id": "test.entity", "state": "on"},
+                ],
+            },
+            {"event": event},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+    hass.states.async_set("test.entity", "hello")
+
+    trace.trace_disable()
+    with (
+        patch.object(
+            trace.TraceElement,
+            "__init__",
+            autospec=True,
+            side_effect=trace.TraceElement.__init__,
+        ) as mock_trace_element,
+        patch.object(
+            template.Template,
+            "async_render",
+            autospec=True,
+            side_effect=template.Template.async_render,
+        ) as mock_render,
+    ):
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+
+    # The condition after the first action stopped the script
+    assert len(events) == 1
+    assert not mock_trace_element.called
+    assert trace.trace_disabled()
+    assert trace.trace_get(clear=False) is None
+    # The cheap state condition was evaluated first and decided the result
+    assert not mock_render.called
+
+
 async def test_condition_basic(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -47,6 +47,7 @@ from homeassistant.util.yaml.loader import parse_yaml
 
 from tests.common import (
     MockEntity,
+    MockEntityPlatform,
     MockModule,
     MockUser,
     async_mock_service,
@@ -2133,3 +2134,201 @@ async def test_reload_service_helper(hass: HomeAssistant) -> None:
     ]
     await asyncio.gather(*tasks)
     assert reloaded == unordered(["all", "target1", "target2", "target3", "target4"])
+
+
+async def test_service_call_limiter_round_robin(hass: HomeAssistant) -> None:
+    """Test the service call limiter serves waiting callers round robin."""
+    limiter = service.ServiceCallLimiter(hass, 1, None)
+    release = asyncio.Event()
+    started: list[str] = []
+
+    async def call(name: str) -> str:
+        started.append(name)
+        await release.wait()
+        return name
+
+    tasks = [
+        hass.async_create_task(limiter.async_run(caller, call(f"{caller}{idx}")))
+        for caller, idx in (("a", 1), ("a", 2), ("a", 3), ("b", 1), ("b", 2))
+    ]
+    await asyncio.sleep(0)
+    assert started == ["a1"]
+    assert limiter.async_get_stats()["waiting"] == 4
+
+    release.set()
+    assert await asyncio.gather(*tasks) == ["a1", "a2", "a3", "b1", "b2"]
+    assert started == ["a1", "a2", "b1", "a3", "b2"]
+
+    stats = limiter.async_get_stats()
+    assert stats["active"] == 0
+    assert stats["waiting"] == 0
+    assert stats["calls"] == 5
+    assert stats["queued_calls"] == 4
+    assert stats["max_wait_time"] >= 0
+
+
+async def test_service_call_limiter_rate(hass: HomeAssistant) -> None:
+    """Test the service call limiter spaces out call starts."""
+    limiter = service.ServiceCallLimiter(hass, None, 50)
+    starts: list[float] = []
+
+    async def call() -> None:
+        starts.append(hass.loop.time())
+
+    await asyncio.gather(*(limiter.async_run("caller", call()) for _ in range(3)))
+    assert len(starts) == 3
+    assert starts[1] - starts[0] >= 0.015
+    assert starts[2] - starts[1] >= 0.015
+
+
+async def test_service_call_limiter_cancel(hass: HomeAssistant) -> None:
+    """Test cancelling a waiting call frees its place in the queue."""
+    limiter = service.ServiceCallLimiter(hass, 1, None)
+    release = asyncio.Event()
+
+    async def call() -> None:
+        await release.wait()
+
+    first = hass.async_create_task(limiter.async_run("a", call()))
+    second = hass.async_create_task(limiter.async_run("b", call()))
+    await asyncio.sleep(0)
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    assert limiter.async_get_stats()["waiting"] == 0
+
+    release.set()
+    await first
+    await limiter.async_run("c", call())
+    assert limiter.async_get_stats()["active"] == 0
+
+
+async def test_entity_service_call_limited(
+    hass: HomeAssistant, mock_entities: dict[str, MockEntity]
+) -> None:
+    """Test entity service calls use the limiter of the integration."""
+    platform = MockEntityPlatform(hass)
+    limiter = platform.service_call_limiter = service.ServiceCallLimiter(hass, 1, None)
+    running = 0
+    max_running = 0
+
+    async def slow_call(entity: MockEntity, call: ServiceCall) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    for entity in mock_entities.values():
+        entity.platform = platform
+
+    await service.entity_service_call(
+        hass,
+        mock_entities,
+        HassJob(slow_call),
+        ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
+    )
+    assert max_running == 1
+    assert limiter.async_get_stats()["calls"] == 4
+
+
+async def test_entity_service_call_limited_nested(
+    hass: HomeAssistant, mock_entities: dict[str, MockEntity]
+) -> None:
+    """Test a call made while holding a slot of the limiter does not wait."""
+    platform = MockEntityPlatform(hass)
+    limiter = platform.service_call_limiter = service.ServiceCallLimiter(hass, 1, None)
+    for entity in mock_entities.values():
+        entity.platform = platform
+    kitchen = mock_entities["light.kitchen"]
+    called: list[str] = []
+
+    async def inner_call(entity: MockEntity, call: ServiceCall) -> None:
+        called.append(entity.entity_id)
+
+    async def outer_call(entity: MockEntity, call: ServiceCall) -> None:
+        # Call another entity of the same integration while holding the slot
+        await service.entity_service_call(
+            hass,
+            {kitchen.entity_id: kitchen},
+            HassJob(inner_call),
+            ServiceCall("test_domain", "inner", {"entity_id": kitchen.entity_id}),
+        )
+        await asyncio.sleep(0)
+        called.append(entity.entity_id)
+
+    async with asyncio.timeout(5):
+        await service.entity_service_call(
+            hass,
+            mock_entities,
+            HassJob(outer_call),
+            ServiceCall(
+                "test_domain",
+                "outer",
+                {"entity_id": ["light.living_room", "light.bedroom"]},
+            ),
+        )
+    # Each outer call ran its nested call first
+    assert called[0::2] == ["light.kitchen", "light.kitchen"]
+    assert sorted(called[1::2]) == ["light.bedroom", "light.living_room"]
+    stats = limiter.async_get_stats()
+    # The outer calls still wait for each other
+    assert stats["calls"] == 2
+    assert stats["queued_calls"] == 1
+    assert stats["nested_calls"] == 2
+
+
+async def test_entity_service_call_limited_from_triggered_automation(
+    hass: HomeAssistant, mock_entities: dict[str, MockEntity]
+) -> None:
+    """Test calls from tasks created while holding a slot are limited."""
+    platform = MockEntityPlatform(hass)
+    limiter = platform.service_call_limiter = service.ServiceCallLimiter(hass, 1, None)
+    for entity in mock_entities.values():
+        entity.platform = platform
+    kitchen = mock_entities["light.kitchen"]
+    called: list[str] = []
+
+    async def inner_call(entity: MockEntity, call: ServiceCall) -> None:
+        called.append(entity.entity_id)
+
+    async def handle_inner(call: ServiceCall) -> None:
+        await service.entity_service_call(
+            hass, {kitchen.entity_id: kitchen}, HassJob(inner_call), call
+        )
+
+    hass.services.async_register("test_domain", "inner", handle_inner)
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": {
+                "trigger": {"platform": "state", "entity_id": "test.trigger"},
+                "action": {
+                    "action": "test_domain.inner",
+                    "target": {"entity_id": kitchen.entity_id},
+                },
+            }
+        },
+    )
+
+    async def outer_call(entity: MockEntity, call: ServiceCall) -> None:
+        # The state change triggers the automation while the slot is held
+        hass.states.async_set("test.trigger", "on")
+        while not limiter.waiting:
+            await asyncio.sleep(0)
+        called.append(entity.entity_id)
+
+    async with asyncio.timeout(5):
+        await service.entity_service_call(
+            hass,
+            mock_entities,
+            HassJob(outer_call),
+            ServiceCall("test_domain", "outer", {"entity_id": "light.living_room"}),
+        )
+        await hass.async_block_till_done()
+    assert called == ["light.living_room", "light.kitchen"]
+    stats = limiter.async_get_stats()
+    assert stats["calls"] == 2
+    assert stats["queued_calls"] == 1
+    assert stats["nested_calls"] == 0
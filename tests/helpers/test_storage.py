@@ -1180,3 +1180,54 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_store_manager_learns_startup_loads(
+    tmpdir: py.path.local, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test keys loaded during startup are preloaded on the next startup."""
+    loop = asyncio.get_running_loop()
+
+    def _setup_mock_storage():
+        config_dir = tmpdir.mkdir("temp_config")
+        tmp_storage = config_dir.mkdir(".storage")
+        tmp_storage.join("integration1").write_binary(
+            json_bytes({"data": {"integration1": "integration1"}, "version": 1})
+        )
+        tmp_storage.join("integration2").write_binary(
+            json_bytes({"data": {"integration2": "integration2"}, "version": 1})
+        )
+        return config_dir
+
+    config_dir = await loop.run_in_executor(None, _setup_mock_storage)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        hass.set_state(CoreState.not_running)
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        await store_manager.async_preload([])
+        assert not store_manager._data_preload
+
+        integration2 = storage.Store(hass, 1, "integration2")
+        assert await integration2.async_load() == {"integration2": "integration2"}
+        assert "integration2" in store_manager.async_get_load_timings()
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+        # Loads after startup are not recorded
+        integration1 = storage.Store(hass, 1, "integration1")
+        assert await integration1.async_load() == {"integration1": "integration1"}
+
+        freezer.tick(storage.MANAGER_CLEANUP_DELAY)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        await hass.async_stop(force=True)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        await store_manager.async_preload([])
+        assert "integration2" in store_manager._data_preload
+        assert "integration1" not in store_manager._data_preload
+        await hass.async_stop(force=True)
@@ -1,8 +1,10 @@
 """The tests for the Sun helpers."""
 
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from astral import LocationInfo
+from astral.location import Location
 import astral.sun
 from freezegun import freeze_time
 import pytest
@@ -200,3 +202,70 @@ def test_impossible_elevation(hass: HomeAssistant) -> None:
 
     with pytest.raises(ValueError):
         sun.get_astral_event_next(hass, SUN_EVENT_SUNRISE, june)
+
+
+def test_astral_event_cache(hass: HomeAssistant) -> None:
+    """Test astral events are cached until the location changes."""
+    utc_now = datetime(2016, 11, 1, 8, 0, 0, tzinfo=dt_util.UTC)
+    sunrise = sun.get_astral_event_next(hass, SUN_EVENT_SUNRISE, utc_now)
+    sunset = sun.get_astral_event_date(hass, SUN_EVENT_SUNSET, utc_now)
+
+    with patch(
+        "astral.location.Location.sunrise", side_effect=AssertionError
+    ) as mock_sunrise:
+        assert sun.get_astral_event_next(hass, SUN_EVENT_SUNRISE, utc_now) == sunrise
+        assert sun.is_up(hass, utc_now) is False
+    assert not mock_sunrise.called
+    assert sun.get_astral_event_date(hass, SUN_EVENT_SUNSET, utc_now) == sunset
+
+    hass.config.latitude = 69.6
+    hass.config.longitude = 18.8
+    assert sun.get_astral_event_next(hass, SUN_EVENT_SUNRISE, utc_now) != sunrise
+    cache = sun.get_astral_event_cache(hass)
+    assert all(key[:2] == (69.6, 18.8) for key in cache.keys())  # noqa: SIM118
+
+
+def test_astral_event_cache_event_not_occurring(hass: HomeAssistant) -> None:
+    """Test events that do not occur on a date are cached."""
+    hass.config.latitude = 69.6
+    hass.config.longitude = 18.8
+    june = datetime(2016, 6, 1, tzinfo=dt_util.UTC)
+
+    assert sun.get_astral_event_date(hass, SUN_EVENT_SUNSET, june) is None
+    with patch(
+        "astral.location.Location.sunset", side_effect=AssertionError
+    ) as mock_sunset:
+        assert sun.get_astral_event_date(hass, SUN_EVENT_SUNSET, june) is None
+    assert not mock_sunset.called
+
+
+def test_astral_event_cache_polar_walk(hass: HomeAssistant) -> None:
+    """Test the next event found walking dates near a pole is cached.
+
+    Only the next event is cached, not each of the dates walked.
+    """
+    hass.config.latitude = 78.2
+    hass.config.longitude = 15.6
+    may = datetime(2016, 5, 1, tzinfo=dt_util.UTC)
+
+    original_sunrise = Location.sunrise
+    with patch.object(
+        Location, "sunrise", autospec=True, side_effect=original_sunrise
+    ) as mock_sunrise:
+        next_sunrise = sun.get_astral_event_next(hass, SUN_EVENT_SUNRISE, may)
+        assert mock_sunrise.call_count > 100
+        assert len(sun.get_astral_event_cache(hass)) == 1
+
+        mock_sunrise.reset_mock()
+        assert sun.get_astral_event_next(hass, SUN_EVENT_SUNRISE, may) == next_sunrise
+        assert (
+            sun.get_astral_event_next(hass, SUN_EVENT_SUNRISE, may + timedelta(days=30))
+            == next_sunrise
+        )
+        assert not mock_sunrise.called
+
+        assert (
+            sun.get_astral_event_next(hass, SUN_EVENT_SUNRISE, next_sunrise)
+            > next_sunrise
+        )
+        assert mock_sunrise.called
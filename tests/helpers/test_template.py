@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+import contextlib
 from datetime import datetime, timedelta
 import json
 import logging
@@ -5313,6 +5314,103 @@ async def test_template_timeout(hass: HomeAssistant) -> None:
     assert await tmp5.async_render_will_timeout(0.000001) is True
 
 
+async def test_slow_template_flagged(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test templates which are repeatedly slow are flagged for the executor."""
+    tmp = template.Template("{{ states | count }}", hass)
+    with patch("homeassistant.helpers.template.SLOW_RENDER_THRESHOLD", 0):
+        for _ in range(template.SLOW_RENDERS_BEFORE_EXECUTOR - 1):
+            tmp.async_render()
+        assert tmp.render_in_executor is False
+        tmp.async_render()
+
+    assert tmp.render_in_executor is True
+    assert tmp.render_time is not None
+    assert "it will be rendered in the executor" in caplog.text
+
+    fast_tmp = template.Template("{{ states | count }}", hass)
+    for _ in range(template.SLOW_RENDERS_BEFORE_EXECUTOR):
+        fast_tmp.async_render()
+    assert fast_tmp.render_in_executor is False
+
+
+async def test_render_to_info_in_executor(hass: HomeAssistant) -> None:
+    """Test rendering in the executor against a snapshot of the states."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    hass.states.async_set("light.kitchen", "on")
+
+    tmp = template.Template(
+        "{{ states.sensor | map(attribute='state') | map('int') | sum }}"
+        " {{ states | count }} {{ states('light.kitchen') }}",
+        hass,
+    )
+    assert tmp.async_render() == "3 3 on"
+
+    original_executor_job = hass.async_add_executor_job
+
+    def change_states_and_render(target, *args):
+        # The render must not see states set after the snapshot was taken
+        hass.states.async_set("sensor.three", "3")
+        hass.states.async_set("light.kitchen", "off")
+        return original_executor_job(target, *args)
+
+    with patch.object(hass, "async_add_executor_job", change_states_and_render):
+        info = await tmp.async_render_to_info_in_executor()
+
+    assert info.result() == "3 3 on"
+    assert info.domains == {"sensor"}
+    assert info.entities == {"light.kitchen"}
+    assert info.all_states_lifecycle is True
+
+    info = await tmp.async_render_to_info_in_executor()
+    assert info.result() == "6 4 off"
+
+    # Templates which were not rendered before are rendered in the event loop
+    not_compiled = template.Template("{{ states('sensor.one') }}", hass)
+    info = await not_compiled.async_render_to_info_in_executor()
+    assert info.result() == 1
+
+
+async def test_registry_template_not_rendered_in_executor(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test templates reading the registries stay in the event loop."""
+    hass.states.async_set("light.kitchen", "on")
+    for template_str in (
+        "{{ area_name('light.kitchen') }}",
+        "{{ 'light.kitchen' | device_id }}",
+        "{{ 'light.kitchen' is is_hidden_entity }}",
+        "{{ expand('light.kitchen') | count }}",
+        "{% from 'macros.jinja' import macro %}{{ states('light.kitchen') }}",
+    ):
+        tmp = template.Template(template_str, hass)
+        with patch("homeassistant.helpers.template.SLOW_RENDER_THRESHOLD", 0):
+            for _ in range(template.SLOW_RENDERS_BEFORE_EXECUTOR):
+                with contextlib.suppress(TemplateError):
+                    tmp.async_render()
+        assert tmp.render_in_executor is False
+
+        tmp.render_in_executor = True
+        with patch.object(
+            hass, "async_add_executor_job", side_effect=AssertionError
+        ) as executor_job:
+            await tmp.async_render_to_info_in_executor()
+        assert not executor_job.called
+
+    assert "it uses functions which must run in the event loop" in caplog.text
+
+    tmp = template.Template("{{ states('light.kitchen') }}", hass)
+    tmp.async_render()
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as executor_job:
+        info = await tmp.async_render_to_info_in_executor()
+    assert info.result() == "on"
+    assert executor_job.called
+
+
 async def test_template_timeout_raise(hass: HomeAssistant) -> None:
     """Test we can raise from."""
     tmp2 = template.Template("{{ error_invalid + 1 }}", hass)
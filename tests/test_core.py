@@ -2896,6 +2896,40 @@ def test_state_timestamps() -> None:
     assert state.last_updated_timestamp == now.timestamp()
 
 
+def test_state_datetimes_created_on_access() -> None:
+    """Test the datetimes of a State created from timestamps are created on access."""
+    now = dt_util.utcnow()
+    timestamp = now.timestamp()
+    state = ha.State(
+        "light.bedroom",
+        "on",
+        None,
+        None,
+        None,
+        None,
+        ha.Context(id="1234"),
+        True,
+        None,
+        timestamp,
+        timestamp - 10,
+    )
+    assert "last_updated" not in state._cache
+    assert "last_changed" not in state._cache
+    assert "last_reported" not in state._cache
+    assert state.last_changed_timestamp == timestamp - 10
+    assert state.last_reported_timestamp == timestamp
+    assert state.as_compressed_state["lu"] == timestamp
+    assert "last_updated" not in state._cache
+
+    assert state.last_updated == dt_util.utc_from_timestamp(timestamp)
+    assert state.last_reported == state.last_updated
+    assert state.last_changed == dt_util.utc_from_timestamp(timestamp - 10)
+
+    state.last_changed = now
+    assert state.last_changed is now
+    assert state.last_changed_timestamp == timestamp
+
+
 async def test_state_firing_event_matches_context_id_ulid_time(
     hass: HomeAssistant,
 ) -> None: